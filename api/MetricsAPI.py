@@ -0,0 +1,414 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import tornado.ioloop
+import tornado.web
+
+from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+from services.DataExporter import FILTROS_CONSULTA, FORMATOS, VALOR_NULO, DataExporter
+from services.DataLoader import DataLoader
+
+# Threads que executam os serviços (as consultas são CPU/pandas, fora do loop de eventos).
+MAX_WORKERS = int(os.environ.get("DASHBOARD_API_WORKERS") or 4)
+
+# Respostas serializadas guardadas em memória (LRU).
+MAX_RESPOSTAS = int(os.environ.get("DASHBOARD_API_CACHE") or 2048)
+
+# `max-age` (s) do Cache-Control das respostas de métricas.
+MAX_AGE = int(os.environ.get("DASHBOARD_API_MAX_AGE") or 60)
+
+TIPOS_DISCIPLINA = ["Presencial", "EAD"]
+
+# Tabelas da rota `exportar`: as linhas filtradas ou as frequências por pergunta.
+TABELAS_EXPORTACAO = ("dados", "frequencias")
+
+
+def _filtros(avaliacao: str, opcoes: dict) -> dict:
+    """Junta o atributo e o valor padrão de `FILTROS_CONSULTA` às (opções, aceita vários valores) de cada filtro."""
+    return {nome: (atributo, *opcoes[nome], padrao) for nome, (atributo, padrao) in FILTROS_CONSULTA[avaliacao].items()}
+
+
+# Avaliação -> classe do serviço, tipos de dataset (períodos) e filtros aceitos na query string.
+# Cada filtro: parâmetro -> (atributo do serviço, opções, aceita vários valores, valor padrão), onde
+# opções é a coluna do cubo com os valores aceitos ou uma função serviço -> lista de valores.
+AVALIACOES = {
+    "institucional": {
+        "classe": AvaliacaoInstitucionalService,
+        "tipos": ["institucional"],
+        "filtros": _filtros("institucional", {
+            "eixo": ("EIXO_NOME", True),
+            "pergunta": (lambda servico: servico.formatar_perguntas()[1:], True),
+            "dimensao": ("DIMENSAO_NOME", False),
+        }),
+    },
+    "cursos": {
+        "classe": AvaliacaoDosCursosService,
+        "tipos": ["cursos"],
+        "filtros": _filtros("cursos", {
+            "curso": ("CURSO", False),
+            "setor": ("SETOR_CURSO", False),
+            "dimensao": ("DIMENSAO_NOME", False),
+        }),
+    },
+    "disciplinas": {
+        "classe": AvaliacaoDasDisciplinasService,
+        "tipos": ["presencial", "ead"],
+        "filtros": _filtros("disciplinas", {
+            "tipo": (lambda servico: TIPOS_DISCIPLINA, False),
+            "disciplina": ("NOME_DISCIPLINA", False),
+            "curso": ("CURSO", False),
+            "setor": ("SETOR_CURSO", False),
+            "dimensao": ("DIMENSAO_NOME", False),
+        }),
+    },
+}
+
+
+def json_padrao(valor):
+    """Converte os tipos numpy/pandas que o `json` não serializa."""
+    if isinstance(valor, np.integer):
+        return int(valor)
+    if isinstance(valor, np.floating):
+        return float(valor)
+    if isinstance(valor, np.bool_):
+        return bool(valor)
+    if isinstance(valor, pd.Timestamp):
+        return valor.isoformat()
+    raise TypeError(f"{type(valor).__name__} não é serializável em JSON")
+
+
+def metricas_json(metricas: dict | None) -> dict | None:
+    """Converte o dict de `metricas_filtradas` (tuplas (percentual, total)) para JSON."""
+    if metricas is None:
+        return None
+    saida = {"respondentes": metricas["respondentes"], "total_respostas": metricas["total_respostas"]}
+    for nome in ("concordancia", "discordancia", "desconhecimento"):
+        percentual, total = metricas[nome]
+        saida[nome] = {"percentual": percentual, "total": total}
+    return saida
+
+
+class MetricsAPI:
+    """API HTTP/JSON (Tornado) com as métricas dos serviços, sem sessão do Streamlit.
+
+    Os serviços rodam em um pool de threads: cada thread mantém a própria
+    instância de cada (avaliação, período), porque os serviços guardam os
+    filtros como estado, mas os datasets, cubos e índices vêm do mesmo
+    registro do DataLoader usado pelo dashboard. As respostas serializadas
+    ficam em um cache LRU por (rota, avaliação, período, filtros, versão dos
+    dados), e cada uma leva um ETag: clientes que repetem a consulta com
+    `If-None-Match` recebem 304 sem corpo.
+    """
+
+    ROTAS = ("metricas", "eixos", "saldo", "opcoes")
+
+    def __init__(self, workers: int = MAX_WORKERS, max_respostas: int = MAX_RESPOSTAS):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api")
+        self.max_respostas = max_respostas
+        self._local = threading.local()
+        self._respostas = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+
+    # ------------------------------------------------------------------ serviços
+
+    @staticmethod
+    def periodos(avaliacao: str) -> list:
+        """Períodos com dados de `avaliacao` (disciplinas: os que têm presencial e EAD)."""
+        tipos = AVALIACOES[avaliacao]["tipos"]
+        periodos = DataLoader.periodos_disponiveis(tipos[0])
+        for tipo in tipos[1:]:
+            periodos = [p for p in periodos if p in DataLoader.periodos_disponiveis(tipo)]
+        return periodos
+
+    def _servico(self, avaliacao: str, periodo: str):
+        """Retorna a instância do serviço desta thread, recriando-a se o dataset foi recarregado."""
+        servicos = self._local.__dict__.setdefault("servicos", {})
+        servico = servicos.get((avaliacao, periodo))
+        if servico is None or servico.desatualizado():
+            servico = AVALIACOES[avaliacao]["classe"](periodo=periodo)
+            servicos[(avaliacao, periodo)] = servico
+        return servico
+
+    @staticmethod
+    def _valores_coluna(servico, coluna: str) -> list:
+        """Valores distintos de `coluna` no cubo do serviço (vazio se o cubo não tiver a coluna)."""
+        cubo = servico._cubo()
+        if coluna not in cubo.dimensoes:
+            return []
+        return sorted(pd.unique(cubo.contagens[coluna].dropna()).tolist(), key=str)
+
+    def _aplicar_filtros(self, servico, avaliacao: str, parametros: dict):
+        """Aplica os filtros da query string ao serviço, no tipo usado pelos dados.
+
+        Valores de filtro chegam como texto; os de colunas do cubo não textuais
+        (ex.: `DIMENSAO_NOME` das disciplinas, inteiro) são convertidos pelo valor
+        correspondente no cubo. `VALOR_NULO` seleciona as linhas sem valor na coluna.
+        """
+        config = AVALIACOES[avaliacao]["filtros"]
+        if "tipo" in config:
+            servico.atualizar_filtros(tipo_disciplina_value=(parametros.get("tipo") or [config["tipo"][3]])[0])
+
+        filtros = {}
+        for nome, (atributo, coluna, multiplo, padrao) in config.items():
+            if nome == "tipo":
+                continue
+            valores = parametros.get(nome)
+            if not valores:
+                filtros[atributo] = padrao
+                continue
+
+            if isinstance(coluna, str):
+                por_texto = {str(v): v for v in self._valores_coluna(servico, coluna)}
+                valores = [np.nan if v == VALOR_NULO else por_texto.get(v, v) for v in valores]
+            filtros[atributo] = valores if multiplo else valores[0]
+
+        servico.atualizar_filtros(**filtros)
+
+    def _calcular(self, rota: str, servico, avaliacao: str) -> dict:
+        """Monta o corpo da `rota` com o serviço já filtrado."""
+        if rota == "metricas":
+            return {
+                "metricas": metricas_json(servico.metricas_filtradas()),
+                "ano_passado": metricas_json(servico.metricas_filtradas_ano_passado()),
+            }
+
+        if rota == "eixos":
+            resumo = servico.resumo_por_eixo()
+            if resumo is None:
+                return {"eixos": []}
+            return {
+                "eixos": [
+                    {"eixo": eixo, "resposta": resposta, "total": total, "percentual": percentual}
+                    for eixo, resposta, total, percentual in zip(
+                        resumo['EIXO_NOME'].astype(str), resumo['RESPOSTA'].astype(str),
+                        resumo['COUNT'], resumo['PERCENT'],
+                    )
+                ]
+            }
+
+        if rota == "saldo":
+            if not servico.dimensao_value:
+                raise tornado.web.HTTPError(400, reason="Informe a dimensão (parâmetro 'dimensao')")
+            saldo = servico.saldo_opiniao_dimensao()
+            if saldo is None:
+                return {"perguntas": []}
+            return {
+                "perguntas": [
+                    {"pergunta": pergunta, "percentuais": percentuais}
+                    for pergunta, percentuais in zip(saldo.index, saldo.to_dict("records"))
+                ]
+            }
+
+        return {
+            "opcoes": {
+                nome: self._valores_coluna(servico, coluna) if isinstance(coluna, str) else coluna(servico)
+                for nome, (_, coluna, _, _) in AVALIACOES[avaliacao]["filtros"].items()
+            }
+        }
+
+    def responder(self, rota: str, avaliacao: str, periodo: str, parametros: dict) -> tuple:
+        """Retorna (corpo JSON em bytes, ETag) da consulta, pelo cache quando possível.
+
+        Executado nas threads do pool.
+        """
+        servico = self._servico(avaliacao, periodo)
+        self._aplicar_filtros(servico, avaliacao, parametros)
+
+        chave = (
+            rota, avaliacao, periodo,
+            tuple(sorted((nome, tuple(valores)) for nome, valores in parametros.items())),
+            servico._versao_dados(),
+        )
+        with self._lock:
+            resposta = self._respostas.get(chave)
+            if resposta is not None:
+                self._respostas.move_to_end(chave)
+                self.acertos += 1
+                return resposta
+            self.faltas += 1
+
+        corpo = {"avaliacao": avaliacao, "periodo": periodo, "filtros": parametros, **self._calcular(rota, servico, avaliacao)}
+        dados = json.dumps(corpo, ensure_ascii=False, default=json_padrao).encode("utf-8")
+        resposta = (dados, f'"{hashlib.sha1(dados).hexdigest()}"')
+
+        with self._lock:
+            self._respostas[chave] = resposta
+            if len(self._respostas) > self.max_respostas:
+                self._respostas.popitem(last=False)
+        return resposta
+
+    def exportador(self, avaliacao: str, periodo: str, parametros: dict, tabela: str) -> DataExporter:
+        """Retorna o exportador das linhas (ou das frequências) que atendem aos filtros.
+
+        Executado nas threads do pool. O exportador guarda as posições já
+        resolvidas, então o serviço da thread pode ser refiltrado durante a exportação.
+        """
+        servico = self._servico(avaliacao, periodo)
+        self._aplicar_filtros(servico, avaliacao, parametros)
+        if tabela == "frequencias":
+            return DataExporter(servico.tabela_frequencias())
+        return servico.exportador_dados()
+
+    def estatisticas(self) -> dict:
+        """Tamanho e acertos/faltas do cache de respostas."""
+        with self._lock:
+            return {"respostas": len(self._respostas), "acertos": self.acertos, "faltas": self.faltas}
+
+    def limpar(self):
+        """Descarta as respostas guardadas."""
+        with self._lock:
+            self._respostas.clear()
+
+    # ------------------------------------------------------------------ HTTP
+
+    def aplicacao(self) -> tornado.web.Application:
+        """Retorna a aplicação Tornado com as rotas da API."""
+        rotas = "|".join(self.ROTAS)
+        avaliacoes = "|".join(AVALIACOES)
+        return tornado.web.Application([
+            (r"/health", _SaudeHandler, {"api": self}),
+            (r"/api/v1/periodos", _PeriodosHandler, {"api": self}),
+            (rf"/api/v1/({avaliacoes})/({rotas})", _ConsultaHandler, {"api": self}),
+            (rf"/api/v1/({avaliacoes})/exportar", _ExportacaoHandler, {"api": self}),
+        ], default_handler_class=_NaoEncontradoHandler)
+
+
+class _JSONHandler(tornado.web.RequestHandler):
+    """Base dos handlers: corpo JSON e erros como `{"erro": ...}`."""
+
+    def initialize(self, api: MetricsAPI = None):
+        self.api = api
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json; charset=utf-8")
+
+    def escrever_json(self, corpo: dict):
+        self.write(json.dumps(corpo, ensure_ascii=False, default=json_padrao))
+
+    def write_error(self, status_code: int, **kwargs):
+        self.escrever_json({"erro": self._reason, "status": status_code})
+
+
+class _NaoEncontradoHandler(_JSONHandler):
+    def prepare(self):
+        raise tornado.web.HTTPError(404, reason="Rota não encontrada")
+
+
+class _SaudeHandler(_JSONHandler):
+    def get(self):
+        self.escrever_json({"status": "ok", "cache": self.api.estatisticas()})
+
+
+class _PeriodosHandler(_JSONHandler):
+    async def get(self):
+        loop = tornado.ioloop.IOLoop.current()
+        periodos = {
+            avaliacao: await loop.run_in_executor(self.api.executor, MetricsAPI.periodos, avaliacao)
+            for avaliacao in AVALIACOES
+        }
+        self.set_header("Cache-Control", f"public, max-age={MAX_AGE}")
+        self.escrever_json({"periodos": periodos})
+
+
+class _ConsultaHandler(_JSONHandler):
+    """GET /api/v1/<avaliacao>/<rota>?periodo=...&<filtros>."""
+
+    def compute_etag(self):
+        # O ETag vem do cache de respostas, sem recalcular o hash do corpo.
+        return getattr(self, "_etag", None) or super().compute_etag()
+
+    # Parâmetros aceitos além de `periodo` e dos filtros da avaliação.
+    EXTRAS = ()
+
+    def _parametros(self, avaliacao: str) -> dict:
+        """Filtros da query string (parâmetro -> lista de valores), validados."""
+        config = AVALIACOES[avaliacao]["filtros"]
+        aceitos = ["periodo", *self.EXTRAS, *config]
+        desconhecidos = sorted(set(self.request.arguments) - set(aceitos))
+        if desconhecidos:
+            raise tornado.web.HTTPError(
+                400, reason=f"Parâmetros desconhecidos: {', '.join(desconhecidos)} (aceitos: {', '.join(aceitos)})"
+            )
+
+        parametros = {}
+        for nome, (_, _, multiplo, _) in config.items():
+            valores = [v for v in self.get_arguments(nome) if v]
+            if len(valores) > 1 and not multiplo:
+                raise tornado.web.HTTPError(400, reason=f"O parâmetro '{nome}' aceita um único valor")
+            if valores:
+                parametros[nome] = valores
+
+        tipo = parametros.get("tipo", [TIPOS_DISCIPLINA[0]])[0] if "tipo" in config else None
+        if tipo is not None and tipo not in TIPOS_DISCIPLINA:
+            raise tornado.web.HTTPError(400, reason=f"'tipo' deve ser um de: {', '.join(TIPOS_DISCIPLINA)}")
+        return parametros
+
+    async def _periodo(self, avaliacao: str) -> str:
+        """Período da query string (padrão: o mais recente), validado."""
+        loop = tornado.ioloop.IOLoop.current()
+        periodos = await loop.run_in_executor(self.api.executor, MetricsAPI.periodos, avaliacao)
+        periodo = self.get_argument("periodo", None) or (periodos[0] if periodos else None)
+        if periodo not in periodos:
+            raise tornado.web.HTTPError(404, reason=f"Sem dados de '{avaliacao}' para o período {periodo}")
+        return periodo
+
+    async def get(self, avaliacao: str, rota: str):
+        parametros = self._parametros(avaliacao)
+        loop = tornado.ioloop.IOLoop.current()
+        periodo = await self._periodo(avaliacao)
+
+        corpo, self._etag = await loop.run_in_executor(
+            self.api.executor, self.api.responder, rota, avaliacao, periodo, parametros
+        )
+        self.set_header("Cache-Control", f"public, max-age={MAX_AGE}")
+        self.write(corpo)
+
+
+class _ExportacaoHandler(_ConsultaHandler):
+    """GET /api/v1/<avaliacao>/exportar?formato=csv|parquet|xlsx&tabela=dados|frequencias&periodo=...&<filtros>.
+
+    O arquivo é enviado em pedaços (transferência chunked) à medida que cada
+    bloco de linhas é convertido nas threads do pool, sem montar o arquivo em memória.
+    """
+
+    EXTRAS = ("formato", "tabela")
+
+    async def get(self, avaliacao: str):
+        parametros = self._parametros(avaliacao)
+        formato = self.get_argument("formato", "csv")
+        tabela = self.get_argument("tabela", "dados")
+        if formato not in FORMATOS:
+            raise tornado.web.HTTPError(400, reason=f"'formato' deve ser um de: {', '.join(FORMATOS)}")
+        if not DataExporter.disponivel(formato):
+            raise tornado.web.HTTPError(501, reason="A exportação em .xlsx requer o pacote openpyxl no servidor")
+        if tabela not in TABELAS_EXPORTACAO:
+            raise tornado.web.HTTPError(400, reason=f"'tabela' deve ser um de: {', '.join(TABELAS_EXPORTACAO)}")
+
+        loop = tornado.ioloop.IOLoop.current()
+        periodo = await self._periodo(avaliacao)
+        exportador = await loop.run_in_executor(
+            self.api.executor, self.api.exportador, avaliacao, periodo, parametros, tabela
+        )
+
+        nome = DataExporter.nome_arquivo(f"{avaliacao}_{tabela}_{periodo.replace('/', '-')}", formato)
+        self.set_header("Content-Type", DataExporter.tipo_mime(formato))
+        self.set_header("Content-Disposition", f'attachment; filename="{nome}"')
+        self.set_header("X-Total-Linhas", str(len(exportador)))
+
+        pedacos = exportador.exportar(formato)
+        try:
+            while (dados := await loop.run_in_executor(self.api.executor, next, pedacos, None)) is not None:
+                self.write(dados)
+                await self.flush()
+        finally:
+            pedacos.close()
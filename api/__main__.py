@@ -0,0 +1,43 @@
+"""Serve as métricas das avaliações como JSON, sem o Streamlit.
+
+    python -m api --porta 8502
+    curl 'localhost:8502/api/v1/cursos/metricas?curso=...'
+
+Rotas (GET):
+    /health
+    /api/v1/periodos
+    /api/v1/{institucional,cursos,disciplinas}/{metricas,eixos,saldo,opcoes}?periodo=...&<filtros>
+    /api/v1/{institucional,cursos,disciplinas}/exportar?formato=csv|parquet|xlsx&tabela=dados|frequencias&<filtros>
+
+Filtros: institucional `eixo`/`pergunta` (repetíveis); cursos `curso`, `setor`;
+disciplinas `tipo` (Presencial/EAD), `disciplina`, `curso`, `setor`; todas
+aceitam `dimensao` (obrigatória em `saldo`). `opcoes` lista os valores aceitos.
+`exportar` envia as linhas filtradas (ou as frequências por pergunta) em pedaços.
+"""
+import argparse
+import asyncio
+import logging
+
+from api.MetricsAPI import MAX_WORKERS, MetricsAPI
+
+
+async def servir(porta: int, endereco: str, workers: int):
+    api = MetricsAPI(workers=workers)
+    api.aplicacao().listen(porta, address=endereco)
+    logging.getLogger("dashboard.api").info("API de métricas em http://%s:%d", endereco, porta)
+    await asyncio.Event().wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m api", description=__doc__.splitlines()[0])
+    parser.add_argument("--porta", type=int, default=8502)
+    parser.add_argument("--endereco", default="0.0.0.0", help="interface de rede (padrão: todas)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="threads que executam as consultas")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    asyncio.run(servir(args.porta, args.endereco, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,50 @@
+import os
+import threading
+
 import streamlit as st
 from view.home import home_view
 from view.avaliacao_institucional import avaliacao_institucional_view
 from view.avaliacao_das_disciplinas import avaliacao_das_disciplinas_view
 from view.avaliacao_dos_cursos import avaliacao_dos_cursos_view
 from view.login import login_view
+from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+from services.DataLoader import DataLoader
+from services.RenderProfiler import PROFILER
+
+# "paginas" (padrão): só a página ativa é executada a cada interação.
+# "abas": modo antigo com st.tabs, que executa todas as views sempre.
+NAVEGACAO = os.environ.get("DASHBOARD_NAVEGACAO", "paginas")
+
+# Com DASHBOARD_PREAQUECER=1 os datasets, cubos e índices são carregados em
+# segundo plano na primeira execução do processo.
+PREAQUECER = os.environ.get("DASHBOARD_PREAQUECER", "0") == "1"
+
+
+def _preaquecer_dados():
+    """Carrega no registro do DataLoader o que as páginas de avaliação usam."""
+    institucional = AvaliacaoInstitucionalService()
+    DataLoader.cubo(institucional.df_load_dados_institucional, institucional._path)
+    DataLoader.indice(institucional.df_load_dados_institucional)
+
+    disciplinas = AvaliacaoDasDisciplinasService()
+    for tipo in ("Presencial", "EAD"):
+        disciplinas.atualizar_filtros(tipo_disciplina_value=tipo)
+        disciplinas._cubo()
+        DataLoader.indice(disciplinas.df_disciplinas())
 
+    cursos = AvaliacaoDosCursosService()
+    cursos._cubo()
+    DataLoader.indice(cursos.df)
+
+
+@st.cache_resource(show_spinner=False)
+def iniciar_preaquecimento() -> threading.Thread:
+    """Dispara o pré-aquecimento uma única vez por processo."""
+    thread = threading.Thread(target=_preaquecer_dados, name="preaquecer-dados", daemon=True)
+    thread.start()
+    return thread
 
 
 def main():
@@ -13,28 +53,51 @@ def main():
         layout="wide",
     )
 
-    tabs = st.tabs([
-        "Home",
-        "Avaliação Institucional",
-        "Avaliação de Disciplinas",
-        "Avaliação dos Cursos",
-        "Administrador"
-    ])
+    # Com DASHBOARD_PROFILER=1, cargas, serviços e gráficos são cronometrados
+    # por rerun (ver painel do Administrador).
+    PROFILER.instalar()
+
+    if PREAQUECER:
+        iniciar_preaquecimento()
 
-    with tabs[0]:
-        home_view()
+    if NAVEGACAO == "abas":
+        tabs = st.tabs([
+            "Home",
+            "Avaliação Institucional",
+            "Avaliação de Disciplinas",
+            "Avaliação dos Cursos",
+            "Administrador"
+        ])
 
-    with tabs[1]:
-        avaliacao_institucional_view()
+        with PROFILER.execucao("abas"):
+            with tabs[0], PROFILER.medir("view", "Home"):
+                home_view()
 
-    with tabs[2]:
-        avaliacao_das_disciplinas_view()
+            with tabs[1], PROFILER.medir("view", "Avaliação Institucional"):
+                avaliacao_institucional_view()
 
-    with tabs[3]:
-        avaliacao_dos_cursos_view()
+            with tabs[2], PROFILER.medir("view", "Avaliação de Disciplinas"):
+                avaliacao_das_disciplinas_view()
 
-    with tabs[4]:
-        login_view()
+            with tabs[3], PROFILER.medir("view", "Avaliação dos Cursos"):
+                avaliacao_dos_cursos_view()
+
+            with tabs[4], PROFILER.medir("view", "Administrador"):
+                login_view()
+        return
+
+    pagina = st.navigation(
+        [
+            st.Page(home_view, title="Home", url_path="home", default=True),
+            st.Page(avaliacao_institucional_view, title="Avaliação Institucional", url_path="institucional"),
+            st.Page(avaliacao_das_disciplinas_view, title="Avaliação de Disciplinas", url_path="disciplinas"),
+            st.Page(avaliacao_dos_cursos_view, title="Avaliação dos Cursos", url_path="cursos"),
+            st.Page(login_view, title="Administrador", url_path="administrador"),
+        ],
+        position="top",
+    )
+    with PROFILER.execucao(pagina.title), PROFILER.medir("view", pagina.title):
+        pagina.run()
 
 
-main()
\ No newline at end of file
+main()
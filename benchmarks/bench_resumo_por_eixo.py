@@ -0,0 +1,81 @@
+"""Compara o resumo por eixo antigo (groupby + groupby + merge + apply) com o `EixoSummary`.
+
+Uso:
+    python -m benchmarks.bench_resumo_por_eixo --linhas 10000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from services.EixoSummary import EixoSummary
+
+EIXOS = [f"Eixo {i} - Nome do eixo {i}" for i in range(1, 6)]
+RESPOSTAS = ['Concordo', 'Discordo', 'Desconheço']
+
+
+def gerar_respostas(linhas: int, seed: int = 0) -> pd.DataFrame:
+    """Gera uma tabela sintética no nível de resposta (EIXO_NOME, RESPOSTA)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'EIXO_NOME': pd.Categorical.from_codes(rng.integers(0, len(EIXOS), linhas), EIXOS),
+        'RESPOSTA': pd.Categorical.from_codes(
+            rng.choice(len(RESPOSTAS), linhas, p=[0.6, 0.25, 0.15]), RESPOSTAS
+        ),
+    })
+
+
+def resumo_legado(df: pd.DataFrame) -> pd.DataFrame:
+    """Pipeline usado antes em `grafico_resumo_por_eixo` dos três serviços."""
+    df_grouped = df.groupby(['EIXO_NOME', 'RESPOSTA'], observed=True).size().reset_index(name='COUNT')
+    total_por_eixo = df.groupby('EIXO_NOME', observed=True).size().reset_index(name='TOTAL')
+
+    df_merged = pd.merge(df_grouped, total_por_eixo, on='EIXO_NOME')
+    df_merged['PERCENT'] = (df_merged['COUNT'] / df_merged['TOTAL']) * 100
+    df_merged = df_merged.sort_values('EIXO_NOME', kind='stable')
+
+    df_merged["LABEL"] = df_merged.apply(
+        lambda row: f"{row['PERCENT']:.1f}% ({row['COUNT']})", axis=1
+    )
+    return df_merged
+
+
+def cronometrar(funcao, repeticoes: int) -> float:
+    """Retorna o melhor tempo (s) de `repeticoes` execuções."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--linhas", type=int, default=10_000_000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    df = gerar_respostas(args.linhas)
+    contagens = df.groupby(['EIXO_NOME', 'RESPOSTA'], observed=True).size().reset_index(name='COUNT')
+
+    antigo = resumo_legado(df)
+    novo = EixoSummary.resumir(df)
+    colunas = ['EIXO_NOME', 'RESPOSTA', 'COUNT', 'PERCENT', 'LABEL']
+    pd.testing.assert_frame_equal(
+        antigo[colunas].reset_index(drop=True), novo[colunas].reset_index(drop=True), check_dtype=False
+    )
+
+    casos = {
+        "legado (linhas)": lambda: resumo_legado(df),
+        "EixoSummary (linhas)": lambda: EixoSummary.resumir(df),
+        "EixoSummary (cubo)": lambda: EixoSummary.resumir(contagens),
+    }
+    print(f"{args.linhas:,} respostas, melhor de {args.repeticoes}")
+    for nome, funcao in casos.items():
+        print(f"  {nome:<22} {cronometrar(funcao, args.repeticoes) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Mede os métodos públicos dos serviços sobre dados sintéticos de vários tamanhos.
+
+Uso:
+    python -m benchmarks.bench_servicos --linhas 10000 1000000 --saida relatorio.json
+    python -m benchmarks.bench_servicos --linhas 1000000 --referencia relatorio.json --tolerancia 0.25
+
+Para cada tamanho, os datasets são gerados por `benchmarks.dados_sinteticos`
+(reaproveitados de `--dados`, se informado) e cada método público sem
+parâmetros de cada serviço é cronometrado em um cenário geral e em um
+filtrado. O relatório JSON pode ser comparado com um anterior (`--referencia`):
+o comando termina com código 1 se algum método ficou mais lento que a
+tolerância ou falhou.
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.dados_sinteticos import gerar
+from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+from services.DataLoader import DataLoader
+from services.FigureCache import CACHE_FIGURAS
+
+# Diferença mínima (s) para um método mais lento contar como regressão: abaixo
+# disso, a variação é ruído de medição.
+PISO_REGRESSAO = 0.005
+
+
+def cenarios_institucional(servico: AvaliacaoInstitucionalService) -> dict:
+    """Visão geral e um eixo com três perguntas e uma dimensão selecionados."""
+    df = servico.df_load_dados_institucional
+    eixo = df['EIXO_NOME'].iloc[0]
+    perguntas = list(pd.unique(df.loc[df['EIXO_NOME'] == eixo, 'PERGUNTA']))[:3]
+    return {
+        "geral": {"eixos_value": None, "perguntas_value": None, "dimensao_value": None},
+        "filtrado": {"eixos_value": [eixo], "perguntas_value": perguntas, "dimensao_value": df['DIMENSAO_NOME'].iloc[0]},
+    }
+
+
+def cenarios_cursos(servico: AvaliacaoDosCursosService) -> dict:
+    """Todos os cursos e um curso/setor com uma dimensão selecionados."""
+    linha = servico.df.iloc[0]
+    return {
+        "geral": {"curso_value": "Todos", "setor_value": "Todos", "dimensao_value": None},
+        "filtrado": {"curso_value": linha['CURSO'], "setor_value": linha['SETOR_CURSO'], "dimensao_value": linha['DIMENSAO_NOME']},
+    }
+
+
+def cenarios_disciplinas(servico: AvaliacaoDasDisciplinasService) -> dict:
+    """Todas as disciplinas e uma disciplina/curso/setor, nas modalidades presencial e EAD."""
+    cenarios = {}
+    for tipo in ("Presencial", "EAD"):
+        servico.atualizar_filtros(tipo_disciplina_value=tipo)
+        linha = servico.df_disciplinas().iloc[0]
+        cenarios[f"{tipo.lower()}_geral"] = {
+            "tipo_disciplina_value": tipo, "disciplina_value": "Todas", "curso_value": "Todas",
+            "setor_value": "Todas", "dimensao_value": None,
+        }
+        cenarios[f"{tipo.lower()}_filtrado"] = {
+            "tipo_disciplina_value": tipo, "disciplina_value": linha['NOME_DISCIPLINA'], "curso_value": linha['CURSO'],
+            "setor_value": linha['SETOR_CURSO'], "dimensao_value": int(linha['DIMENSAO_NOME']),
+        }
+    return cenarios
+
+
+# classe do serviço -> função que monta os cenários (nome -> filtros) a partir dos dados carregados.
+SERVICOS = {
+    AvaliacaoInstitucionalService: cenarios_institucional,
+    AvaliacaoDosCursosService: cenarios_cursos,
+    AvaliacaoDasDisciplinasService: cenarios_disciplinas,
+}
+
+
+def metodos_publicos(classe) -> list:
+    """Métodos públicos definidos no próprio serviço que não recebem parâmetros."""
+    metodos = []
+    for nome, funcao in classe.__dict__.items():
+        if nome.startswith("_") or not inspect.isfunction(funcao):
+            continue
+        parametros = list(inspect.signature(funcao).parameters.values())[1:]
+        if all(p.default is not inspect.Parameter.empty for p in parametros):
+            metodos.append(nome)
+    return metodos
+
+
+def cronometrar(funcao) -> float:
+    """Retorna o tempo (s) de uma execução de `funcao`."""
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def medir_servico(classe, linhas: int, repeticoes: int) -> list:
+    """Cronometra a carga e cada método público de `classe` em cada cenário.
+
+    `frio_s` é a melhor de `repeticoes` execuções com a memoização do serviço e
+    o cache de figuras vazios; `primeira_s` é a primeira delas (inclui as
+    estruturas derivadas construídas sob demanda, como cubo e índices); `quente_s`
+    é uma chamada repetida, respondida pelos caches.
+    """
+    DataLoader.limpar_cache()
+    CACHE_FIGURAS.limpar()
+    inicio = time.perf_counter()
+    servico = classe()
+    carga = time.perf_counter() - inicio
+
+    resultados = [{
+        "linhas": linhas, "servico": classe.__name__, "cenario": "-", "metodo": "__init__",
+        "primeira_s": carga, "frio_s": carga, "mediana_s": carga, "quente_s": None, "erro": None,
+    }]
+    for cenario, filtros in SERVICOS[classe](servico).items():
+        for metodo in metodos_publicos(classe):
+            servico.atualizar_filtros(**filtros)
+            chamar = getattr(servico, metodo)
+            resultado = {"linhas": linhas, "servico": classe.__name__, "cenario": cenario, "metodo": metodo, "erro": None}
+            try:
+                tempos = []
+                for _ in range(repeticoes):
+                    servico.limpar_memo()
+                    CACHE_FIGURAS.limpar()
+                    tempos.append(cronometrar(chamar))
+                resultado.update(
+                    primeira_s=tempos[0], frio_s=min(tempos), mediana_s=statistics.median(tempos),
+                    quente_s=cronometrar(chamar),
+                )
+            except Exception as erro:
+                resultado.update(primeira_s=None, frio_s=None, mediana_s=None, quente_s=None, erro=repr(erro))
+            resultados.append(resultado)
+
+    return resultados
+
+
+def commit_atual() -> str | None:
+    """Retorna o commit do checkout, se for um repositório git."""
+    try:
+        saida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        return saida.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar(tamanhos: list, repeticoes: int, dados: str | None = None) -> dict:
+    """Gera os dados de cada tamanho, mede os serviços e retorna o relatório."""
+    raiz = dados or tempfile.mkdtemp(prefix="bench_servicos_")
+    diretorio_atual = os.getcwd()
+    resultados, memoria = [], {}
+    try:
+        for linhas in tamanhos:
+            destino = os.path.abspath(os.path.join(raiz, str(linhas)))
+            inicio = time.perf_counter()
+            gerar(destino, linhas)
+            print(f"{linhas:,} linhas: dados em {time.perf_counter() - inicio:.2f}s", file=sys.stderr)
+
+            os.chdir(destino)
+            try:
+                for classe in SERVICOS:
+                    resultados.extend(medir_servico(classe, linhas, repeticoes))
+            finally:
+                os.chdir(diretorio_atual)
+                DataLoader.limpar_cache()
+                CACHE_FIGURAS.limpar()
+            # ru_maxrss é o pico do processo (KB no Linux), acumulado entre os tamanhos.
+            memoria[str(linhas)] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    finally:
+        if dados is None:
+            shutil.rmtree(raiz, ignore_errors=True)
+
+    return {
+        "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "ambiente": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+        },
+        "repeticoes": repeticoes,
+        "pico_memoria_mb": memoria,
+        "resultados": resultados,
+    }
+
+
+def comparar(relatorio: dict, referencia: dict, tolerancia: float) -> list:
+    """Retorna os métodos que falharam ou ficaram mais lentos que `referencia` além da tolerância.
+
+    A comparação usa `frio_s`, casando os resultados por tamanho, serviço,
+    cenário e método; diferenças abaixo de `PISO_REGRESSAO` são ignoradas.
+    """
+    anteriores = {
+        (r["linhas"], r["servico"], r["cenario"], r["metodo"]): r for r in referencia["resultados"]
+    }
+    problemas = []
+    for resultado in relatorio["resultados"]:
+        chave = (resultado["linhas"], resultado["servico"], resultado["cenario"], resultado["metodo"])
+        if resultado["erro"]:
+            problemas.append({"chave": chave, "erro": resultado["erro"]})
+            continue
+
+        anterior = anteriores.get(chave)
+        if not anterior or anterior["frio_s"] is None:
+            continue
+        atual, antes = resultado["frio_s"], anterior["frio_s"]
+        if atual > antes * (1 + tolerancia) and atual - antes > PISO_REGRESSAO:
+            problemas.append({"chave": chave, "antes_s": antes, "depois_s": atual, "razao": atual / antes})
+    return problemas
+
+
+def imprimir(relatorio: dict):
+    """Imprime o relatório como tabela (ms)."""
+    tabela = pd.DataFrame(relatorio["resultados"])
+    for coluna in ["primeira_s", "frio_s", "mediana_s", "quente_s"]:
+        tabela[coluna.replace("_s", "_ms")] = tabela[coluna] * 1000
+    colunas = ["linhas", "servico", "cenario", "metodo", "primeira_ms", "frio_ms", "mediana_ms", "quente_ms", "erro"]
+    with pd.option_context("display.max_rows", None, "display.width", 200, "display.float_format", "{:.2f}".format):
+        print(tabela[colunas].to_string(index=False))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_servicos", description=__doc__.splitlines()[0])
+    parser.add_argument("--linhas", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="linhas de cada dataset")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--dados", help="pasta dos dados sintéticos (mantida e reaproveitada entre execuções)")
+    parser.add_argument("--saida", help="arquivo JSON do relatório")
+    parser.add_argument("--referencia", help="relatório JSON anterior para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="aumento relativo de tempo aceito (padrão: 0.25)")
+    args = parser.parse_args(argv)
+
+    relatorio = executar(args.linhas, args.repeticoes, args.dados)
+    imprimir(relatorio)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+
+    problemas = [{"chave": (r["linhas"], r["servico"], r["cenario"], r["metodo"]), "erro": r["erro"]}
+                 for r in relatorio["resultados"] if r["erro"]]
+    if args.referencia:
+        with open(args.referencia, encoding="utf-8") as arquivo:
+            problemas = comparar(relatorio, json.load(arquivo), args.tolerancia)
+
+    for problema in problemas:
+        linhas, servico, cenario, metodo = problema["chave"]
+        if problema.get("erro"):
+            print(f"FALHA {servico}.{metodo} [{cenario}, {linhas:,} linhas]: {problema['erro']}", file=sys.stderr)
+        else:
+            print(
+                f"REGRESSÃO {servico}.{metodo} [{cenario}, {linhas:,} linhas]: "
+                f"{problema['antes_s'] * 1000:.2f} ms -> {problema['depois_s'] * 1000:.2f} ms",
+                file=sys.stderr,
+            )
+    if problemas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Gera datasets sintéticos com o schema dos processados e os publica no armazenamento por período.
+
+Uso:
+    python -m benchmarks.dados_sinteticos --linhas 1000000 --destino /tmp/avaliacao_sintetica
+    python -m benchmarks.dados_sinteticos institucional cursos --linhas 50000000 --destino /tmp/grande
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pipeline.BasePipeline import NOMES_EIXOS, NUMEROS_DIMENSOES
+from pipeline.CursosPipeline import CursosPipeline
+from pipeline.DisciplinasPipeline import EADPipeline, PresencialPipeline
+from pipeline.InstitucionalPipeline import InstitucionalPipeline
+from services.DataLoader import PERIODOS_LEGADO, DataLoader
+from services.ResponseCube import ResponseCube
+
+# Colunas de saída de cada dataset, na ordem gravada pelos pipelines.
+COLUNAS_POR_TIPO = {
+    "institucional": list(dict.fromkeys(InstitucionalPipeline.COLUNAS_SAIDA)),
+    "presencial": PresencialPipeline.COLUNAS_SAIDA,
+    "ead": EADPipeline.COLUNAS_SAIDA,
+    "cursos": CursosPipeline.COLUNAS_SAIDA,
+}
+
+# Linhas geradas e gravadas por vez (limita a memória nos tamanhos grandes).
+LINHAS_POR_BLOCO = 2_000_000
+
+# Cada respondente (ID_PESQUISA) responde essa quantidade de perguntas.
+RESPOSTAS_POR_PESQUISA = 25
+
+QTD_PERGUNTAS = 60
+QTD_SETORES = 12
+QTD_CURSOS = 150
+QTD_DISCIPLINAS = 2_500
+DISCIPLINAS_POR_CURSO = 20
+QTD_UNIDADES = 25
+QTD_LOTACOES = 250
+
+# (RESPOSTA, VALOR_RESPOSTA, probabilidade) de cada resposta possível.
+RESPOSTAS_DISCIPLINAS = [
+    ('Concordo', 1, 0.50), ('Discordo', -1, 0.20), ('Desconheço', 0, 0.12), ('Sim', 1, 0.12), ('Não', -1, 0.06),
+]
+RESPOSTAS_INSTITUCIONAL = [('Concordo', 1, 0.60), ('Discordo', -1, 0.25), ('Desconheço', 0, 0.15)]
+
+
+def _categorias(codigos: np.ndarray, valores: list) -> pd.Categorical:
+    return pd.Categorical.from_codes(codigos, categories=pd.Index(valores))
+
+
+class _Catalogo:
+    """Perguntas, cursos, disciplinas e unidades fixos, compartilhados por todos os blocos."""
+
+    def __init__(self):
+        siglas = list(NUMEROS_DIMENSOES)
+        self.sigla_pergunta = np.arange(QTD_PERGUNTAS) % len(siglas)
+        self.siglas = siglas
+        self.dimensao_num = np.array([NUMEROS_DIMENSOES[s] for s in siglas], dtype=np.int8)
+        self.dimensao_nome = [f"{NUMEROS_DIMENSOES[s]} - Dimensão {s}" for s in siglas]
+        # Duas dimensões por eixo, como na numeração de `NUMEROS_DIMENSOES`.
+        self.eixo_num = np.minimum((self.dimensao_num - 1) // 2 + 1, len(NOMES_EIXOS)).astype(np.int8)
+        self.eixos = [NOMES_EIXOS[str(n)] for n in range(1, len(NOMES_EIXOS) + 1)]
+        self.perguntas = [
+            f"P{p + 1:02d} - Afirmação sintética {p + 1} sobre {siglas[s]}" for p, s in enumerate(self.sigla_pergunta)
+        ]
+
+        self.setores = [f"Setor {chr(ord('A') + i)}" for i in range(QTD_SETORES)]
+        setor_curso = np.arange(QTD_CURSOS) % QTD_SETORES
+        # Cursos em ordem de setor/curso: respondentes consecutivos caem no mesmo
+        # curso, e o arquivo sai ordenado como em `DataLoader.exportar_periodo`.
+        ordem = np.lexsort((np.arange(QTD_CURSOS), setor_curso))
+        self.setor_curso = setor_curso[ordem]
+        self.cursos = [f"Curso {i + 1:03d}" for i in ordem]
+        self.disciplinas = [f"Disciplina {i + 1:04d}" for i in range(QTD_DISCIPLINAS)]
+        self.cod_disciplinas = [f"DS{i + 1:04d}" for i in range(QTD_DISCIPLINAS)]
+
+        self.unidades = [f"Unidade {i + 1:02d}" for i in range(QTD_UNIDADES)]
+        self.lotacoes = [f"Lotação {i + 1:03d}" for i in range(QTD_LOTACOES)]
+        self.siglas_lotacao = [f"L{i + 1:03d}" for i in range(QTD_LOTACOES)]
+
+
+def gerar_bloco(tipo: str, inicio: int, linhas: int, total: int, seed: int = 0, catalogo: _Catalogo | None = None) -> pd.DataFrame:
+    """Gera as linhas `[inicio, inicio + linhas)` de um dataset sintético de `total` linhas.
+
+    O resultado tem as colunas de `COLUNAS_POR_TIPO[tipo]`, com categorias fixas
+    (as mesmas em todos os blocos).
+    """
+    catalogo = catalogo or _Catalogo()
+    rng = np.random.default_rng([seed, inicio])
+    posicao = np.arange(inicio, inicio + linhas)
+
+    pesquisa = posicao // RESPOSTAS_POR_PESQUISA
+    total_pesquisas = max(-(-total // RESPOSTAS_POR_PESQUISA), 1)
+    pergunta = ((posicao % RESPOSTAS_POR_PESQUISA) + pesquisa * 7) % QTD_PERGUNTAS
+    sigla = catalogo.sigla_pergunta[pergunta]
+
+    respostas = RESPOSTAS_INSTITUCIONAL if tipo == "institucional" else RESPOSTAS_DISCIPLINAS
+    codigo_resposta = rng.choice(len(respostas), linhas, p=[p for _, _, p in respostas])
+
+    colunas = {
+        'EIXO_NUM': catalogo.eixo_num[sigla],
+        'EIXO_NOME': _categorias(catalogo.eixo_num[sigla] - 1, catalogo.eixos),
+        'DIMENSAO_NUM': catalogo.dimensao_num[sigla],
+        'DIMENSAO_NOME': _categorias(sigla, catalogo.dimensao_nome),
+        'ID_PESQUISA': (100_000 + pesquisa).astype(np.int32),
+        'ID_QUESTIONARIO': np.full(linhas, 1, dtype=np.int32),
+        'QUESTIONARIO': _categorias(np.zeros(linhas, dtype=np.int8), [f"Avaliação {tipo}"]),
+        'ID_PERGUNTA': (1_000 + pergunta).astype(np.int32),
+        'PERGUNTA': _categorias(pergunta, catalogo.perguntas),
+        'RESPOSTA': _categorias(codigo_resposta, [r for r, _, _ in respostas]),
+        'VALOR_RESPOSTA': np.array([v for _, v, _ in respostas], dtype=np.int8)[codigo_resposta],
+        'SITUACAO': _categorias(np.zeros(linhas, dtype=np.int8), ['Finalizado']),
+        'Tipo_Perg': _categorias(sigla, catalogo.siglas),
+        'Ordem': (pergunta + 1).astype(np.float32),
+        'CL_PERGUNTA': _categorias(pergunta % 5, [f"CL{i}" for i in range(5)]),
+        'MULTIPLA_ESCOLHA': _categorias(np.zeros(linhas, dtype=np.int8), ['N']),
+    }
+
+    if tipo == "institucional":
+        lotacao = (pesquisa * QTD_LOTACOES) // total_pesquisas
+        colunas.update({
+            'LOTACAO': _categorias(lotacao, catalogo.lotacoes),
+            'SIGLA_LOTACAO': _categorias(lotacao, catalogo.siglas_lotacao),
+            'UNIDADE GESTORA': _categorias(lotacao % QTD_UNIDADES, catalogo.unidades),
+        })
+    else:
+        curso = (pesquisa * QTD_CURSOS) // total_pesquisas
+        setor = catalogo.setor_curso[curso]
+        colunas.update({
+            'CURSO': _categorias(curso, catalogo.cursos),
+            'COD_CURSO': (10_000 + curso).astype(np.int32),
+            'SETOR_CURSO': _categorias(setor, catalogo.setores),
+        })
+
+    if tipo in ("presencial", "ead"):
+        disciplina = (curso * 17 + rng.integers(0, DISCIPLINAS_POR_CURSO, linhas)) % QTD_DISCIPLINAS
+        colunas.update({
+            # Nas disciplinas a dimensão vem como número (ver os pipelines).
+            'DIMENSAO_NOME': catalogo.dimensao_num[sigla],
+            'COD_DISCIPLINA': _categorias(disciplina, catalogo.cod_disciplinas),
+            'NOME_DISCIPLINA': _categorias(disciplina, catalogo.disciplinas),
+            'TEMP': _categorias(curso, [f"{c} - {tipo.upper()} - Curitiba" for c in catalogo.cursos]),
+            'DEPARTAMENTO': _categorias(setor, [f"Departamento do {s}" for s in catalogo.setores]),
+            'CODPROF': (500_000 + disciplina).astype(np.int32),
+            'IDPROGRAMA': (20_000 + curso).astype(np.int32),
+            'LOCAL': _categorias(np.zeros(linhas, dtype=np.int8), ['Curitiba']),
+            'MODALIDADE': _categorias(np.zeros(linhas, dtype=np.int8), ['Presencial' if tipo == "presencial" else 'EAD']),
+        })
+
+    return pd.DataFrame(colunas)[COLUNAS_POR_TIPO[tipo]]
+
+
+def publicar(tipo: str, linhas: int, periodo: str | None = None, seed: int = 0) -> str:
+    """Grava um dataset sintético de `linhas` linhas como a partição `tipo`/`periodo`.
+
+    Os blocos são gravados direto no Parquet de uma nova versão (ordenado por
+    setor/curso, como em `DataLoader.exportar_periodo`) e o cubo da partição é
+    somado bloco a bloco. Retorna o caminho da versão publicada.
+    """
+    periodo = periodo or PERIODOS_LEGADO[tipo]
+    pasta = DataLoader.preparar_versao(tipo, periodo)
+    temporario = os.path.join(pasta, "dados.parquet")
+
+    catalogo = _Catalogo()
+    cubo = None
+    escritor = None
+    try:
+        for inicio in range(0, linhas, LINHAS_POR_BLOCO):
+            bloco = gerar_bloco(tipo, inicio, min(LINHAS_POR_BLOCO, linhas - inicio), linhas, seed, catalogo)
+            tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(temporario, tabela.schema, compression="zstd")
+            escritor.write_table(tabela, row_group_size=100_000)
+
+            cubo_bloco = ResponseCube.construir(bloco)
+            cubo = cubo_bloco if cubo is None else cubo.somar(cubo_bloco)
+    finally:
+        if escritor is not None:
+            escritor.close()
+
+    cubo.salvar(DataLoader.caminho_cubo(temporario))
+    return DataLoader.ativar_versao(tipo, periodo, pasta)
+
+
+def gerar(destino: str, linhas: int, tipos: list | None = None, ano_anterior: bool = True, seed: int = 0) -> dict:
+    """Gera em `destino/data/store` os datasets de `tipos` com `linhas` linhas cada.
+
+    Com `ano_anterior`, publica também o mesmo período do ano anterior (para as
+    comparações "Ano passado"). Um `destino` já gerado com os mesmos parâmetros
+    é reaproveitado (ver `sintetico.json`). Retorna {tipo: [períodos]}.
+    """
+    tipos = list(tipos or COLUNAS_POR_TIPO)
+    parametros = {"linhas": linhas, "tipos": tipos, "ano_anterior": ano_anterior, "seed": seed}
+    marcador = os.path.join(destino, "sintetico.json")
+
+    diretorio_atual = os.getcwd()
+    os.makedirs(destino, exist_ok=True)
+    os.chdir(destino)
+    try:
+        if os.path.exists(marcador):
+            with open(marcador, encoding="utf-8") as arquivo:
+                gerado = json.load(arquivo) == parametros
+            if gerado:
+                return {tipo: DataLoader.periodos_disponiveis(tipo) for tipo in tipos}
+            os.remove(marcador)
+
+        for tipo in tipos:
+            periodo = PERIODOS_LEGADO[tipo]
+            publicar(tipo, linhas, periodo, seed)
+            if ano_anterior:
+                ano, separador, semestre = periodo.partition("/")
+                publicar(tipo, linhas, f"{int(ano) - 1}{separador}{semestre}", seed + 1)
+
+        with open(marcador, "w", encoding="utf-8") as arquivo:
+            json.dump(parametros, arquivo)
+        return {tipo: DataLoader.periodos_disponiveis(tipo) for tipo in tipos}
+    finally:
+        os.chdir(diretorio_atual)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.dados_sinteticos", description=__doc__.splitlines()[0])
+    parser.add_argument("tipos", nargs="*", help=f"datasets a gerar: {', '.join(COLUNAS_POR_TIPO)} (padrão: todos)")
+    parser.add_argument("--linhas", type=int, default=1_000_000, help="linhas de cada dataset")
+    parser.add_argument("--destino", required=True, help="pasta onde `data/store` é criado")
+    parser.add_argument("--sem-ano-anterior", action="store_true", help="não gera o período do ano anterior")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    desconhecidos = set(args.tipos) - set(COLUNAS_POR_TIPO)
+    if desconhecidos:
+        parser.error(f"datasets desconhecidos: {', '.join(sorted(desconhecidos))}")
+
+    inicio = time.perf_counter()
+    periodos = gerar(args.destino, args.linhas, args.tipos, not args.sem_ano_anterior, args.seed)
+    print(f"{args.linhas:,} linhas por dataset em {time.perf_counter() - inicio:.2f}s")
+    for tipo, periodos in periodos.items():
+        print(f"  {tipo}: {', '.join(periodos)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from pipeline.StageTimer import StageTimer
+
+# Linhas lidas por vez dos arquivos de pesquisa (exportações grandes).
+CHUNKSIZE_PADRAO = 250_000
+
+NOMES_EIXOS = {
+    '1': 'Planejamento e Avaliação Institucional',
+    '2': 'Desenvolvimento Institucional',
+    '3': 'Políticas Acadêmicas',
+    '4': 'Políticas de Gestão',
+    '5': 'Infraestrutura Física',
+    '6': 'Complexo do Hospital de Clínicas'
+}
+
+# Numeração das dimensões a partir da sigla em `Tipo_Perg`.
+NUMEROS_DIMENSOES = {
+    'PA': 8,
+    'MsãoPDI': 1,
+    'RsSc': 3,
+    'PolEPPE': 2,
+    'ComSoc': 4,
+    'PolAD': 9,
+    'PolPes': 5,
+    'OrgGesInst': 6,
+    'SustFin': 10,
+    'InfraFis': 7,
+    'CHC': 11
+}
+
+
+class BasePipeline:
+    """Base dos pipelines que geram `data/processed/*` a partir de `data/raw/*`.
+
+    Cada subclasse define as pastas/arquivos do ano (`{ano}` nos nomes),
+    carrega as tabelas auxiliares pequenas em `carregar_auxiliares` e
+    transforma o arquivo de pesquisa bloco a bloco em `transformar_bloco`.
+    Os blocos transformados são concatenados e gravados em `finalizar`.
+    """
+
+    NOME = ""
+    PASTA_RAW = ""
+    ARQUIVO_PESQUISA = ""
+    ARQUIVO_SAIDA = ""
+    COLUNAS_SAIDA: list = []
+
+    def __init__(
+        self,
+        ano: int,
+        raw_dir: str = "data/raw",
+        processed_dir: str = "data/processed",
+        chunksize: int = CHUNKSIZE_PADRAO,
+    ):
+        self.ano = ano
+        self.raw_dir = raw_dir
+        self.processed_dir = processed_dir
+        self.chunksize = chunksize
+        self.timer = StageTimer()
+        self.linhas_lidas = 0
+        self._hashes_vistos = np.empty(0, dtype=np.uint64)
+
+    # ------------------------------------------------------------------ caminhos
+
+    def caminho_raw(self, arquivo: str) -> str:
+        """Retorna o caminho de `arquivo` na pasta raw do ano."""
+        return os.path.join(self.raw_dir, self.PASTA_RAW.format(ano=self.ano), arquivo.format(ano=self.ano))
+
+    def caminho_processado(self, arquivo: str) -> str:
+        """Retorna o caminho de `arquivo` (relativo a `processed_dir`) para o ano."""
+        return os.path.join(self.processed_dir, arquivo.format(ano=self.ano))
+
+    # ------------------------------------------------------------------ leitura
+
+    def ler_tabela(self, arquivo: str) -> pd.DataFrame:
+        """Lê uma tabela auxiliar (pequena) da pasta raw."""
+        with self.timer.etapa("ler"):
+            return pd.read_csv(self.caminho_raw(arquivo))
+
+    def ler_em_blocos(self, arquivo: str):
+        """Itera sobre o arquivo de pesquisa em blocos de `self.chunksize` linhas."""
+        leitor = pd.read_csv(self.caminho_raw(arquivo), chunksize=self.chunksize)
+        while True:
+            with self.timer.etapa("ler"):
+                bloco = next(leitor, None)
+            if bloco is None:
+                return
+            self.linhas_lidas += len(bloco)
+            yield bloco
+
+    def deduplicar(self, bloco: pd.DataFrame, subset: list | None = None) -> pd.DataFrame:
+        """Remove linhas repetidas em `subset`, mantendo a primeira, entre todos os blocos.
+
+        Equivale a `drop_duplicates(subset, keep='first')` no arquivo inteiro: as
+        chaves já vistas em blocos anteriores são guardadas como hash de 64 bits.
+        """
+        with self.timer.etapa("deduplicar"):
+            hashes = pd.util.hash_pandas_object(bloco[subset] if subset else bloco, index=False).to_numpy()
+            novos = ~pd.Series(hashes).duplicated().to_numpy()
+            if len(self._hashes_vistos):
+                novos &= ~np.isin(hashes, self._hashes_vistos)
+            self._hashes_vistos = np.union1d(self._hashes_vistos, hashes[novos])
+            return bloco[novos]
+
+    # ------------------------------------------------------------------ transformações
+
+    @staticmethod
+    def valor_resposta(resposta: pd.Series) -> np.ndarray:
+        """Concordo/Sim -> 1, Desconheço -> 0, qualquer outro valor -> -1."""
+        return np.select(
+            [resposta.isin(['Concordo', 'Sim']).to_numpy(), (resposta == 'Desconheço').to_numpy()],
+            [1, 0],
+            default=-1,
+        )
+
+    @staticmethod
+    def nome_eixo(eixo_num: pd.Series) -> pd.Series:
+        """Traduz o número do eixo para o nome (ver `NOMES_EIXOS`)."""
+        return eixo_num.astype(str).map(NOMES_EIXOS)
+
+    @staticmethod
+    def separar_curso(curso: pd.Series) -> pd.DataFrame:
+        """Separa 'CURSO - MODALIDADE - LOCAL' em colunas 0, 1, 2, ...
+
+        Quando há 4 ou mais partes (hífen dentro do nome do curso), as duas
+        primeiras são unidas com '/', como fazia `fix_split_CURSO` nos notebooks.
+        """
+        partes = curso.str.strip().str.split('-', expand=True)
+        partes = partes.apply(lambda coluna: coluna.str.strip())
+
+        quantidade = partes.notna().sum(axis=1).to_numpy()
+        corrigir = quantidade >= 4
+        if corrigir.any():
+            ultima = partes.columns[-1]
+            corrigidas = partes.loc[corrigir].copy()
+            corrigidas[0] = partes.loc[corrigir, 0] + '/' + partes.loc[corrigir, 1]
+            for i in partes.columns[1:-1]:
+                corrigidas[i] = partes.loc[corrigir, i + 1]
+            corrigidas[ultima] = None
+            partes.loc[corrigir] = corrigidas
+
+        return partes.dropna(axis=1, how='all')
+
+    @staticmethod
+    def perguntas_com_dimensoes(info_perguntas: pd.DataFrame, info_dimensoes: pd.DataFrame) -> pd.DataFrame:
+        """Junta as perguntas ao eixo/dimensão da sigla (`Tipo_Perg`)."""
+        return pd.merge(
+            left=info_perguntas.rename(columns={'Tipo_Pergunta': 'Tipo_Perg'}),
+            right=info_dimensoes[['Tipo_Perg', 'EIXO', 'DIMENSAO']],
+            on='Tipo_Perg',
+            how='left',
+        )[['ID_PERGUNTA', 'CL_PERGUNTA', 'DIMENSAO', 'EIXO', 'Ordem', 'Tipo_Perg']]
+
+    # ------------------------------------------------------------------ execução
+
+    def carregar_auxiliares(self):
+        """Lê as tabelas auxiliares usadas por `transformar_bloco`."""
+        raise NotImplementedError
+
+    def transformar_bloco(self, bloco: pd.DataFrame) -> pd.DataFrame:
+        """Transforma um bloco do arquivo de pesquisa."""
+        raise NotImplementedError
+
+    def finalizar(self, df: pd.DataFrame) -> dict:
+        """Retorna {caminho: DataFrame} com o que deve ser gravado."""
+        return {self.caminho_processado(self.ARQUIVO_SAIDA): df[self.COLUNAS_SAIDA]}
+
+    def arquivos_saida(self) -> list:
+        """Retorna os caminhos de todos os arquivos gravados por `finalizar`."""
+        return [self.caminho_processado(self.ARQUIVO_SAIDA)]
+
+    def processar(self, arquivo: str | None = None, ignorar_pesquisas=None) -> dict:
+        """Lê e transforma o arquivo de pesquisa. Retorna {caminho: DataFrame} sem gravar.
+
+        As linhas cujo `ID_PESQUISA` está em `ignorar_pesquisas` são descartadas
+        logo após a leitura de cada bloco.
+        """
+        self.carregar_auxiliares()
+
+        blocos = []
+        for bloco in self.ler_em_blocos(arquivo or self.ARQUIVO_PESQUISA):
+            if ignorar_pesquisas is not None:
+                with self.timer.etapa("filtrar"):
+                    bloco = bloco[~bloco['ID_PESQUISA'].isin(ignorar_pesquisas)]
+            blocos.append(self.transformar_bloco(bloco))
+
+        with self.timer.etapa("concatenar"):
+            df = pd.concat(blocos, ignore_index=True)
+
+        with self.timer.etapa("derivar"):
+            return self.finalizar(df)
+
+    def executar(self, arquivo: str | None = None) -> dict:
+        """Executa o pipeline e grava as saídas. Retorna {caminho: linhas gravadas}."""
+        saidas = self.processar(arquivo)
+
+        gravados = {}
+        with self.timer.etapa("gravar"):
+            for caminho, df_saida in saidas.items():
+                os.makedirs(os.path.dirname(caminho), exist_ok=True)
+                temporario = f"{caminho}.tmp"
+                df_saida.to_csv(temporario, index=False)
+                os.replace(temporario, caminho)
+                gravados[caminho] = len(df_saida)
+
+            self._gravar_pesquisas(pd.concat([df['ID_PESQUISA'] for df in saidas.values()], ignore_index=True))
+
+        return gravados
+
+    def caminho_pesquisas(self) -> str:
+        """Retorna o arquivo com os `ID_PESQUISA` gravados e a assinatura das saídas (ver `pesquisas_armazenadas`)."""
+        return f"{os.path.splitext(self.caminho_processado(self.ARQUIVO_SAIDA))[0]}_pesquisas.npz"
+
+    def _assinatura_saidas(self) -> np.ndarray:
+        """(tamanho, mtime em ns) de cada arquivo de `arquivos_saida`."""
+        return np.array([(os.stat(c).st_size, os.stat(c).st_mtime_ns) for c in self.arquivos_saida()], dtype=np.int64)
+
+    def _gravar_pesquisas(self, ids):
+        """Grava os `ids` únicos e a assinatura atual das saídas em `caminho_pesquisas`."""
+        caminho = self.caminho_pesquisas()
+        temporario = f"{caminho}.tmp.npz"
+        np.savez(temporario, ids=pd.unique(pd.Series(ids)), assinatura=self._assinatura_saidas())
+        os.replace(temporario, caminho)
+
+    def pesquisas_armazenadas(self) -> np.ndarray:
+        """Retorna os `ID_PESQUISA` já presentes nos arquivos processados.
+
+        Vêm de `caminho_pesquisas` enquanto a assinatura gravada lá confere com
+        a das saídas; senão (saídas alteradas por fora ou arquivo ausente), são
+        lidos da coluna dos CSVs e o arquivo é regravado.
+        """
+        try:
+            with np.load(self.caminho_pesquisas()) as gravado:
+                if np.array_equal(gravado["assinatura"], self._assinatura_saidas()):
+                    return gravado["ids"]
+        except (OSError, KeyError, ValueError):
+            pass
+
+        ids = [pd.read_csv(caminho, usecols=['ID_PESQUISA'])['ID_PESQUISA'] for caminho in self.arquivos_saida()]
+        ids = pd.unique(pd.concat(ids, ignore_index=True))
+        self._gravar_pesquisas(ids)
+        return ids
+
+    def executar_incremental(self, arquivo: str | None = None) -> dict:
+        """Acrescenta aos arquivos processados só as pesquisas (`ID_PESQUISA`) novas.
+
+        `arquivo` é a nova exportação de pesquisa (por padrão, a do ano na pasta
+        raw). As respostas de pesquisas já gravadas são ignoradas, as novas são
+        deduplicadas entre si e anexadas ao fim dos CSVs, e o cubo persistido
+        (quando existe) recebe as novas contagens. Sem arquivos processados,
+        equivale a `executar`. Nem os CSVs nem a lista de pesquisas gravadas são
+        relidos ou copiados por inteiro: o custo é o das linhas novas. Retorna
+        {caminho: linhas acrescentadas}.
+        """
+        if not all(os.path.exists(caminho) for caminho in self.arquivos_saida()):
+            return self.executar(arquivo)
+
+        with self.timer.etapa("ler"):
+            armazenadas = self.pesquisas_armazenadas()
+
+        saidas = self.processar(arquivo, ignorar_pesquisas=armazenadas)
+
+        gravados = {}
+        with self.timer.etapa("gravar"):
+            for caminho, df_saida in saidas.items():
+                with open(caminho, encoding="utf-8") as arquivo_atual:
+                    cabecalho = arquivo_atual.readline().rstrip("\r\n")
+                if cabecalho != df_saida.head(0).to_csv(index=False).rstrip("\r\n"):
+                    raise ValueError(f"As colunas de {caminho} não correspondem às do pipeline {self.NOME!r}")
+
+            # As linhas novas são anexadas no próprio CSV; uma falha no meio
+            # trunca cada arquivo de volta ao tamanho anterior, sem deixar linhas
+            # parciais nem IDs de pesquisa gravados pela metade.
+            tamanhos = {}
+            try:
+                for caminho, df_saida in saidas.items():
+                    if df_saida.empty:
+                        continue
+                    tamanhos[caminho] = os.path.getsize(caminho)
+                    df_saida.to_csv(caminho, mode="a", header=False, index=False)
+            except BaseException:
+                for caminho, tamanho in tamanhos.items():
+                    with open(caminho, "r+b") as arquivo_atual:
+                        arquivo_atual.truncate(tamanho)
+                raise
+
+            for caminho, df_saida in saidas.items():
+                gravados[caminho] = len(df_saida)
+            novas = [df['ID_PESQUISA'] for df in saidas.values()]
+            self._gravar_pesquisas(pd.concat([pd.Series(armazenadas), *novas], ignore_index=True))
+
+        caminho_principal = self.caminho_processado(self.ARQUIVO_SAIDA)
+        if gravados.get(caminho_principal):
+            from services.DataLoader import DataLoader
+
+            with self.timer.etapa("agregados"):
+                DataLoader.atualizar_cubo(caminho_principal, saidas[caminho_principal])
+
+        return gravados
@@ -0,0 +1,49 @@
+import pandas as pd
+
+from pipeline.BasePipeline import BasePipeline
+
+
+class CursosPipeline(BasePipeline):
+    """Gera o dataset processado da Avaliação dos Cursos.
+
+    Reproduz `Analise_cursos2024.ipynb`: mantém só o nome do curso, junta o
+    eixo/dimensão da pergunta e calcula `VALOR_RESPOSTA`. As respostas vazias
+    são mantidas (e recebem -1), como no notebook.
+    """
+
+    NOME = "cursos"
+    PASTA_RAW = "Cursos{ano}_dados_raw"
+    ARQUIVO_PESQUISA = "dados_pesquisa_cursos{ano}.csv"
+    ARQUIVO_PERGUNTAS = "info_perguntas_cursos{ano}.csv"
+    ARQUIVO_DIMENSOES = "info_dimensoes_cursos{ano}.csv"
+    ARQUIVO_SAIDA = "Cursos{ano}/processed_cursos_{ano}.csv"
+    COLUNAS_SAIDA = [
+        'EIXO_NUM', 'DIMENSAO_NUM', 'EIXO_NOME', 'DIMENSAO_NOME', 'ID_PESQUISA', 'ID_PERGUNTA',
+        'ID_QUESTIONARIO', 'QUESTIONARIO', 'PERGUNTA', 'RESPOSTA', 'VALOR_RESPOSTA', 'SITUACAO',
+        'MULTIPLA_ESCOLHA', 'CURSO', 'COD_CURSO', 'SETOR_CURSO', 'CL_PERGUNTA', 'Ordem', 'Tipo_Perg',
+    ]
+
+    def carregar_auxiliares(self):
+        """Lê perguntas e dimensões e monta a tabela de junção."""
+        perguntas = self.ler_tabela(self.ARQUIVO_PERGUNTAS)
+        dimensoes = self.ler_tabela(self.ARQUIVO_DIMENSOES)
+
+        with self.timer.etapa("auxiliares"):
+            self.perguntas = self.perguntas_com_dimensoes(perguntas, dimensoes)
+
+    def transformar_bloco(self, bloco: pd.DataFrame) -> pd.DataFrame:
+        """Limpa o curso e enriquece um bloco de respostas."""
+        with self.timer.etapa("enriquecer"):
+            bloco['CURSO'] = bloco['CURSO'].str.strip().str.split(" - ", n=1).str[0]
+            bloco = pd.merge(bloco, self.perguntas, on='ID_PERGUNTA', how='left')
+            bloco['VALOR_RESPOSTA'] = self.valor_resposta(bloco['RESPOSTA'])
+
+        return bloco
+
+    def finalizar(self, df: pd.DataFrame) -> dict:
+        """Monta as colunas finais."""
+        df = df.rename(columns={'EIXO': 'EIXO_NUM', 'DIMENSAO': 'DIMENSAO_NUM'})
+        df['EIXO_NOME'] = self.nome_eixo(df['EIXO_NUM'])
+        df['DIMENSAO_NOME'] = df['QUESTIONARIO']
+
+        return {self.caminho_processado(self.ARQUIVO_SAIDA): df[self.COLUNAS_SAIDA]}
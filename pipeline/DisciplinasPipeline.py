@@ -0,0 +1,109 @@
+import pandas as pd
+
+from pipeline.BasePipeline import BasePipeline, NUMEROS_DIMENSOES
+
+# "Um aluno (ID_PESQUISA) respondendo uma pergunta (ID_PERGUNTA) sobre uma
+# matéria (NOME_DISCIPLINA) dada por um professor (CODPROF)".
+COLUNAS_UNICIDADE = ['ID_PESQUISA', 'NOME_DISCIPLINA', 'ID_PERGUNTA', 'CODPROF']
+
+COLUNAS_DISCIPLINAS = ['NOME_DISCIPLINA', 'COD_CURSO', 'CURSO', 'IDPROGRAMA', 'LOCAL', 'MODALIDADE']
+
+# Respostas separadas no arquivo de erros após a investigação dos notebooks.
+PESQUISAS_COM_ERRO = [39045]
+DISCIPLINAS_COM_ERRO = ['CM300', 'CQ211', 'CQ256', 'ET170']
+
+
+class DisciplinasPipeline(BasePipeline):
+    """Gera o dataset processado da Avaliação das Disciplinas (Presencial/EAD).
+
+    Reproduz `preprocessing_dados_presencial.ipynb` e
+    `preprocessing_dados_ead2025.ipynb`: deduplica as respostas, junta os dados
+    da disciplina (curso, modalidade, local) e da pergunta (eixo, dimensão),
+    calcula `VALOR_RESPOSTA` e separa as respostas marcadas como erro.
+    """
+
+    ARQUIVO_DISCIPLINAS = ""
+    ARQUIVO_PERGUNTAS = ""
+    ARQUIVO_DIMENSOES = ""
+    ARQUIVO_ERROS = ""
+
+    def carregar_auxiliares(self):
+        """Lê disciplinas e perguntas/dimensões e monta as tabelas de junção."""
+        disciplinas = self.ler_tabela(self.ARQUIVO_DISCIPLINAS)
+        perguntas = self.ler_tabela(self.ARQUIVO_PERGUNTAS)
+        dimensoes = self.ler_tabela(self.ARQUIVO_DIMENSOES)
+
+        with self.timer.etapa("auxiliares"):
+            partes = self.separar_curso(disciplinas['CURSO'])
+            disciplinas = disciplinas.assign(CURSO=partes[0], MODALIDADE=partes[1], LOCAL=partes[2])
+            self.disciplinas = disciplinas[COLUNAS_DISCIPLINAS].drop_duplicates()
+            self.perguntas = self.perguntas_com_dimensoes(perguntas, dimensoes)
+
+    def transformar_bloco(self, bloco: pd.DataFrame) -> pd.DataFrame:
+        """Deduplica e enriquece um bloco de respostas."""
+        bloco = self.deduplicar(bloco.rename(columns={'CURSO': 'TEMP'}), COLUNAS_UNICIDADE)
+
+        with self.timer.etapa("enriquecer"):
+            bloco = pd.merge(bloco, self.disciplinas, on=['NOME_DISCIPLINA', 'COD_CURSO'], how='left')
+            bloco = pd.merge(bloco, self.perguntas, on='ID_PERGUNTA', how='left')
+            bloco['VALOR_RESPOSTA'] = self.valor_resposta(bloco['RESPOSTA'])
+
+        return bloco
+
+    def finalizar(self, df: pd.DataFrame) -> dict:
+        """Separa as respostas com erro e monta as colunas finais."""
+        erro = (df['ID_PESQUISA'].isin(PESQUISAS_COM_ERRO) & df['COD_DISCIPLINA'].isin(DISCIPLINAS_COM_ERRO)).to_numpy()
+        df_erros = df[erro]
+
+        df_final = df[~erro].rename(columns={'EIXO': 'EIXO_NUM', 'DIMENSAO': 'DIMENSAO_NOME'})
+        df_final['EIXO_NOME'] = self.nome_eixo(df_final['EIXO_NUM'])
+        df_final['DIMENSAO_NUM'] = df_final['Tipo_Perg'].map(NUMEROS_DIMENSOES)
+
+        return {
+            self.caminho_processado(self.ARQUIVO_SAIDA): df_final[self.COLUNAS_SAIDA],
+            self.caminho_processado(self.ARQUIVO_ERROS): df_erros,
+        }
+
+    def arquivos_saida(self) -> list:
+        """Retorna os caminhos do dataset processado e do arquivo de erros."""
+        return [self.caminho_processado(self.ARQUIVO_SAIDA), self.caminho_processado(self.ARQUIVO_ERROS)]
+
+
+class PresencialPipeline(DisciplinasPipeline):
+    """Avaliação das Disciplinas Presenciais."""
+
+    NOME = "presencial"
+    PASTA_RAW = "Presencial{ano}_dados_raw"
+    ARQUIVO_PESQUISA = "dados_presencial_pesquisa{ano}.csv"
+    ARQUIVO_DISCIPLINAS = "dados_presencial_disciplinas{ano}.csv"
+    ARQUIVO_PERGUNTAS = "info_perguntas_presencial{ano}.csv"
+    ARQUIVO_DIMENSOES = "info_dimensoes_presencial{ano}.csv"
+    ARQUIVO_SAIDA = "Presencial{ano}/processed_presencial_{ano}.csv"
+    ARQUIVO_ERROS = "Presencial{ano}/processed_erros_presencial_{ano}.csv"
+    COLUNAS_SAIDA = [
+        'EIXO_NUM', 'EIXO_NOME', 'DIMENSAO_NUM', 'DIMENSAO_NOME', 'ID_PESQUISA', 'ID_QUESTIONARIO',
+        'QUESTIONARIO', 'ID_PERGUNTA', 'PERGUNTA', 'RESPOSTA', 'VALOR_RESPOSTA', 'SITUACAO',
+        'COD_DISCIPLINA', 'NOME_DISCIPLINA', 'COD_CURSO', 'MULTIPLA_ESCOLHA', 'TEMP', 'SETOR_CURSO',
+        'DEPARTAMENTO', 'CODPROF', 'CURSO', 'IDPROGRAMA', 'LOCAL', 'MODALIDADE', 'CL_PERGUNTA',
+        'Ordem', 'Tipo_Perg',
+    ]
+
+
+class EADPipeline(DisciplinasPipeline):
+    """Avaliação das Disciplinas EAD."""
+
+    NOME = "ead"
+    PASTA_RAW = "EAD{ano}_dados_raw"
+    ARQUIVO_PESQUISA = "dados_ead_pesquisa{ano}.csv"
+    ARQUIVO_DISCIPLINAS = "dados_disciplinas{ano}.csv"
+    ARQUIVO_PERGUNTAS = "info_perguntas_ead{ano}.csv"
+    ARQUIVO_DIMENSOES = "info_dimensoes_ead{ano}.csv"
+    ARQUIVO_SAIDA = "EAD{ano}/processed_ead_{ano}.csv"
+    ARQUIVO_ERROS = "EAD{ano}/processed_erros_ead_{ano}.csv"
+    COLUNAS_SAIDA = [
+        'EIXO_NUM', 'EIXO_NOME', 'DIMENSAO_NOME', 'DIMENSAO_NUM', 'COD_CURSO', 'CURSO', 'MODALIDADE',
+        'LOCAL', 'ID_PESQUISA', 'ID_QUESTIONARIO', 'QUESTIONARIO', 'ID_PERGUNTA', 'PERGUNTA',
+        'RESPOSTA', 'SITUACAO', 'COD_DISCIPLINA', 'NOME_DISCIPLINA', 'MULTIPLA_ESCOLHA', 'TEMP',
+        'SETOR_CURSO', 'DEPARTAMENTO', 'CODPROF', 'IDPROGRAMA', 'CL_PERGUNTA', 'Ordem', 'Tipo_Perg',
+        'VALOR_RESPOSTA',
+    ]
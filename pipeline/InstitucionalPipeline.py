@@ -0,0 +1,64 @@
+import pandas as pd
+
+from pipeline.BasePipeline import BasePipeline, NUMEROS_DIMENSOES
+
+RESPOSTAS_VALIDAS = ['Concordo', 'Discordo', 'Desconheço']
+
+
+class InstitucionalPipeline(BasePipeline):
+    """Gera o dataset processado da Avaliação Institucional.
+
+    Reproduz `preprocessing_dados_institucional.ipynb`: junta a sigla/eixo do
+    grupo de perguntas, a unidade gestora da lotação e a ordem da pergunta,
+    e mantém só as respostas Concordo/Discordo/Desconheço.
+    """
+
+    NOME = "institucional"
+    PASTA_RAW = "Institucional{ano}_dados_raw"
+    ARQUIVO_PESQUISA = "dados_institucional_pesquisa{ano}.csv"
+    ARQUIVO_INFO_PERGUNTAS = "dados_institucional_info_perguntas{ano}.csv"
+    ARQUIVO_UNIDADES = "dados_institucional_unidades{ano}.csv"
+    ARQUIVO_PERGUNTAS = "dados_institucional_perguntas{ano}.csv"
+    ARQUIVO_SAIDA = "Institucional{ano}/processed_Institucional_{ano}.csv"
+    # DIMENSAO_NOME aparece duas vezes, como no CSV gerado pelo notebook.
+    COLUNAS_SAIDA = [
+        'EIXO_NUM', 'EIXO_NOME', 'DIMENSAO_NUM', 'DIMENSAO_NOME', 'DIMENSAO_NOME', 'ID_PESQUISA',
+        'ID_QUESTIONARIO', 'QUESTIONARIO', 'ID_PERGUNTA', 'PERGUNTA', 'RESPOSTA', 'SITUACAO',
+        'LOTACAO', 'SIGLA_LOTACAO', 'Tipo_Perg', 'UNIDADE GESTORA', 'Ordem',
+    ]
+
+    def carregar_auxiliares(self):
+        """Lê grupos de perguntas, unidades e ordem das perguntas."""
+        info_perguntas = self.ler_tabela(self.ARQUIVO_INFO_PERGUNTAS)
+        unidades = self.ler_tabela(self.ARQUIVO_UNIDADES)
+        perguntas = self.ler_tabela(self.ARQUIVO_PERGUNTAS)
+
+        with self.timer.etapa("auxiliares"):
+            info_perguntas = info_perguntas.loc[:, ~info_perguntas.columns.str.contains('^Unnamed')]
+            self.info_perguntas = info_perguntas.rename(columns={'Grupo_de_Perguntas': 'QUESTIONARIO'})
+            self.unidades = unidades[['SIGLA_LOTACAO', 'UNIDADE GESTORA']]
+            self.perguntas = perguntas[['ID_PERGUNTA', 'Ordem']]
+
+    def transformar_bloco(self, bloco: pd.DataFrame) -> pd.DataFrame:
+        """Enriquece um bloco de respostas e descarta respostas fora do padrão."""
+        with self.timer.etapa("enriquecer"):
+            bloco = pd.merge(bloco, self.info_perguntas, on='QUESTIONARIO', how='left')
+            bloco = pd.merge(bloco, self.unidades, on='SIGLA_LOTACAO', how='left')
+            bloco = pd.merge(bloco, self.perguntas, on='ID_PERGUNTA', how='left')
+
+            # Pergunta 74 foi incluída depois: as seguintes andam uma posição.
+            bloco.loc[bloco['Ordem'] > 73, 'Ordem'] += 1
+            bloco['Ordem'] = bloco['Ordem'].fillna(74)
+
+            bloco = bloco[bloco['RESPOSTA'].isin(RESPOSTAS_VALIDAS)]
+
+        return bloco
+
+    def finalizar(self, df: pd.DataFrame) -> dict:
+        """Monta as colunas finais."""
+        df = df.rename(columns={'EIXO': 'EIXO_NUM', 'DIMENSAO': 'DIMENSAO_NUM'})
+        df['EIXO_NOME'] = self.nome_eixo(df['EIXO_NUM'])
+        df['DIMENSAO_NUM'] = df['Tipo_Perg'].map(NUMEROS_DIMENSOES)
+        df['DIMENSAO_NOME'] = df['QUESTIONARIO']
+
+        return {self.caminho_processado(self.ARQUIVO_SAIDA): df[self.COLUNAS_SAIDA]}
@@ -0,0 +1,32 @@
+import time
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Acumula o tempo gasto em cada etapa de um pipeline.
+
+    Uma etapa pode ser medida várias vezes (ex.: uma vez por bloco lido);
+    os tempos são somados.
+    """
+
+    def __init__(self):
+        self.tempos = {}
+
+    @contextmanager
+    def etapa(self, nome: str):
+        """Mede o bloco `with` e soma o tempo à etapa `nome`."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + time.perf_counter() - inicio
+
+    def total(self) -> float:
+        """Retorna a soma dos tempos de todas as etapas."""
+        return sum(self.tempos.values())
+
+    def relatorio(self) -> str:
+        """Retorna uma linha por etapa com o tempo em segundos."""
+        linhas = [f"  {nome:<12} {segundos:8.2f}s" for nome, segundos in self.tempos.items()]
+        linhas.append(f"  {'total':<12} {self.total():8.2f}s")
+        return "\n".join(linhas)
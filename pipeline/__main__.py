@@ -0,0 +1,78 @@
+"""Gera os datasets processados a partir de `data/raw`.
+
+    python -m pipeline todos
+    python -m pipeline presencial ead --ano 2025 --parquet
+    python -m pipeline ead --incremental --arquivo nova_exportacao.csv
+    python -m pipeline presencial --ano 2025 --periodo 2025/1
+"""
+import argparse
+import os
+import time
+
+from pipeline.BasePipeline import CHUNKSIZE_PADRAO
+from pipeline.CursosPipeline import CursosPipeline
+from pipeline.DisciplinasPipeline import EADPipeline, PresencialPipeline
+from pipeline.InstitucionalPipeline import InstitucionalPipeline
+
+# (classe, ano padrão) de cada dataset.
+PIPELINES = {
+    PresencialPipeline.NOME: (PresencialPipeline, 2025),
+    EADPipeline.NOME: (EADPipeline, 2025),
+    InstitucionalPipeline.NOME: (InstitucionalPipeline, 2025),
+    CursosPipeline.NOME: (CursosPipeline, 2024),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pipeline", description=__doc__.splitlines()[0])
+    parser.add_argument("datasets", nargs="+", choices=[*PIPELINES, "todos"])
+    parser.add_argument("--ano", type=int, help="ano da extração (padrão: o do dataset atual)")
+    parser.add_argument("--raw", default="data/raw", help="pasta dos dados brutos")
+    parser.add_argument("--saida", default="data/processed", help="pasta dos dados processados")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE_PADRAO, help="linhas lidas por bloco")
+    parser.add_argument(
+        "--incremental", action="store_true", help="acrescenta só as pesquisas (ID_PESQUISA) ainda não processadas"
+    )
+    parser.add_argument("--arquivo", help="exportação de pesquisa a ler (padrão: a do ano na pasta raw)")
+    parser.add_argument("--parquet", action="store_true", help="gera também o .parquet e o cubo de cada saída")
+    parser.add_argument("--periodo", help="publica o dataset gerado como a partição deste período em data/store (ex.: 2025/1)")
+    args = parser.parse_args(argv)
+
+    nomes = list(PIPELINES) if "todos" in args.datasets else list(dict.fromkeys(args.datasets))
+    if args.arquivo and len(nomes) > 1:
+        parser.error("--arquivo só pode ser usado com um único dataset")
+    arquivo = os.path.abspath(args.arquivo) if args.arquivo else None
+
+    for nome in nomes:
+        classe, ano_padrao = PIPELINES[nome]
+        pipeline = classe(args.ano or ano_padrao, raw_dir=args.raw, processed_dir=args.saida, chunksize=args.chunksize)
+
+        inicio = time.perf_counter()
+        if args.incremental:
+            gravados = pipeline.executar_incremental(arquivo)
+        else:
+            gravados = pipeline.executar(arquivo)
+        print(f"[{nome}] {pipeline.linhas_lidas} linhas lidas em {time.perf_counter() - inicio:.2f}s")
+        for caminho, linhas in gravados.items():
+            print(f"  {caminho}: {linhas} linhas{' acrescentadas' if args.incremental else ''}")
+
+        if args.parquet:
+            from services.DataLoader import DataLoader
+
+            with pipeline.timer.etapa("parquet"):
+                for caminho in gravados:
+                    DataLoader.exportar_parquet(caminho)
+                    DataLoader.exportar_cubo(caminho)
+
+        if args.periodo:
+            from services.DataLoader import DataLoader
+
+            with pipeline.timer.etapa("store"):
+                particao = DataLoader.exportar_periodo(pipeline.caminho_processado(pipeline.ARQUIVO_SAIDA), nome, args.periodo)
+            print(f"  {particao}")
+
+        print(pipeline.timer.relatorio())
+
+
+if __name__ == "__main__":
+    main()
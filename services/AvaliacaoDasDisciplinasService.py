@@ -1,17 +1,36 @@
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import functools
+from services.DataExporter import DataExporter
 from services.DataLoader  import DataLoader
+from services.EixoSummary import EixoSummary
+from services.FigureCache import CACHE_FIGURAS
+from services.FilterState import FilterState
+from services.OptionIndex import OptionIndex
 
 
 
-class AvaliacaoDasDisciplinasService(DataLoader):
+class AvaliacaoDasDisciplinasService(DataLoader, FilterState):
     """Serviço para analisar dados de avaliação das disciplinas.
 
     Fornece métodos para calcular métricas e gerar gráficos das avaliações
     das disciplinas para os conjuntos 'Presencial' e 'EAD'.
     """
 
+    COLUNAS = [
+        'ID_PESQUISA', 'EIXO_NOME', 'DIMENSAO_NUM', 'DIMENSAO_NOME', 'PERGUNTA',
+        'RESPOSTA', 'VALOR_RESPOSTA', 'NOME_DISCIPLINA', 'CURSO', 'SETOR_CURSO',
+    ]
+
+    # Filtros e respostas das métricas comparadas com o ano anterior (ver `PeriodComparison`).
+    CHAVES_COMPARACAO = ['NOME_DISCIPLINA', 'CURSO', 'SETOR_CURSO']
+    VALORES_COMPARACAO = {'concordancia': 1, 'discordancia': -1, 'desconhecimento': 0}
+
+    # Colunas e rótulo das opções do seletor de disciplina (ver `OptionIndex`).
+    COLUNAS_OPCOES = ['NOME_DISCIPLINA', 'CURSO', 'SETOR_CURSO']
+    FORMATO_OPCAO = "Disciplina:{} - Curso: {} - Setor: {}"
+
     def __init__(self,
                 df_load_dados_avaliacao_disciplinas_presencial = None,
                 df_load_dados_avaliacao_disciplinas_EAD = None, 
@@ -20,6 +39,7 @@ class AvaliacaoDasDisciplinasService(DataLoader):
                 setor_value = None,
                 dimensao_value = None,
                 tipo_disciplina_value = None,
+                periodo = None,
                  ):
         """Inicializa o serviço com DataFrames opcionais e valores de filtro.
 
@@ -33,12 +53,23 @@ class AvaliacaoDasDisciplinasService(DataLoader):
             Valores de filtro usados pelos métodos do serviço.
         tipo_disciplina_value : str | None
             'Presencial' ou 'EAD' para selecionar o conjunto de dados.
+        periodo : str | None
+            Ano/semestre a carregar, ex.: '2025/2' (ver `DataLoader.periodos_disponiveis`).
+            None usa os arquivos atuais.
         """
+        self.periodo = periodo
+        self._path_presencial = None
+        self._path_EAD = None
+
         if df_load_dados_avaliacao_disciplinas_presencial is None:
-            df_load_dados_avaliacao_disciplinas_presencial = DataLoader.load_dados_disciplinas_presencial()
+            df_load_dados_avaliacao_disciplinas_presencial = DataLoader.load_periodo("presencial", periodo, columns=self.COLUNAS)
+            self._path_presencial = DataLoader.caminho_dados("presencial", periodo)
+            self._registrar_fonte("df_presencial", functools.partial(DataLoader.load_periodo, "presencial", periodo, columns=self.COLUNAS))
 
         if df_load_dados_avaliacao_disciplinas_EAD is None: 
-            df_load_dados_avaliacao_disciplinas_EAD = DataLoader.load_dados_disciplinas_EAD()
+            df_load_dados_avaliacao_disciplinas_EAD = DataLoader.load_periodo("ead", periodo, columns=self.COLUNAS)
+            self._path_EAD = DataLoader.caminho_dados("ead", periodo)
+            self._registrar_fonte("df_EAD", functools.partial(DataLoader.load_periodo, "ead", periodo, columns=self.COLUNAS))
         
     
         self.df_presencial = df_load_dados_avaliacao_disciplinas_presencial
@@ -61,6 +92,26 @@ class AvaliacaoDasDisciplinasService(DataLoader):
             df_disciplinas = self.df_EAD
 
         return df_disciplinas
+
+    def _versao_dados(self) -> str:
+        """Identifica o dataset selecionado (ver `DataLoader.versao`)."""
+        return DataLoader.versao(self.df_disciplinas())
+
+    def _cubo(self):
+        """Retorna o cubo de contagens do conjunto de dados selecionado."""
+        if self.tipo_disciplina_value == 'Presencial':
+            return DataLoader.cubo(self.df_presencial, self._path_presencial)
+        return DataLoader.cubo(self.df_EAD, self._path_EAD)
+
+    def _filtros_disciplina_curso_setor(self) -> dict:
+        """Retorna os filtros de disciplina/curso/setor no formato do cubo."""
+        if self.disciplina_value == "Todas":
+            return {}
+        return {
+            "NOME_DISCIPLINA": self.disciplina_value,
+            "CURSO": self.curso_value,
+            "SETOR_CURSO": self.setor_value,
+        }
     
     def _total_respostas_ano_atual(self):
         """Retorna o número total de respostas no conjunto de dados selecionado."""
@@ -77,13 +128,12 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         Retorna 0 caso não haja respostas.
         """
-        df = self.df_disciplinas()
         total = self._total_respostas_ano_atual()
 
         if total == 0:
             return 0
 
-        concordo = df['VALOR_RESPOSTA'].eq(1).sum()
+        concordo = self._cubo().contagem_por('VALOR_RESPOSTA').get(1, 0)
         return (concordo / total) * 100
 
     def get_discordancia_atual(self) -> float:
@@ -91,13 +141,12 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         Retorna 0 caso não haja respostas.
         """
-        df = self.df_disciplinas()
         total = self._total_respostas_ano_atual()
 
         if total == 0:
             return 0
 
-        discordo = df['VALOR_RESPOSTA'].eq(-1).sum()
+        discordo = self._cubo().contagem_por('VALOR_RESPOSTA').get(-1, 0)
         return (discordo / total) * 100
 
     def get_desconhecimento(self) -> float:
@@ -105,74 +154,96 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         Retorna 0 caso não haja respostas.
         """
-        df = self.df_disciplinas()
         total = self._total_respostas_ano_atual()
 
         if total == 0:
             return 0
 
-        desconheco = df['VALOR_RESPOSTA'].eq(0).sum()
+        desconheco = self._cubo().contagem_por('VALOR_RESPOSTA').get(0, 0)
         return (desconheco / total) * 100
 
+    @FilterState.memoizado('tipo_disciplina_value')
+    def _comparacao(self):
+        """Retorna as métricas pré-agregadas do mesmo período do ano anterior, ou None se não houver."""
+        tipo = "presencial" if self.tipo_disciplina_value == 'Presencial' else "ead"
+        anterior = DataLoader.periodo_anterior(tipo, self.periodo)
+        if anterior is None:
+            return None
+        return DataLoader.comparacao(tipo, anterior, self.CHAVES_COMPARACAO, 'VALOR_RESPOSTA', self.VALORES_COMPARACAO)
+
+    def metricas_ano_passado(self) -> dict | None:
+        """Retorna as métricas gerais do ano anterior (formato de `metricas_filtradas`), ou None."""
+        comparacao = self._comparacao()
+        return comparacao.metricas() if comparacao is not None else None
+
+    @FilterState.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
+    def metricas_filtradas_ano_passado(self) -> dict | None:
+        """Retorna as métricas do ano anterior para os mesmos filtros, ou None."""
+        comparacao = self._comparacao()
+        return comparacao.metricas(self._filtros_disciplina_curso_setor()) if comparacao is not None else None
+
     def total_respondentes_ano_passado(self): 
-        qtd_respondentes_ano_atual = self.get_total_respondentes_ano_atual()
-        qtd_respondentes_ano_passado = 2000
-        pct_comparacao_ano_atual =(qtd_respondentes_ano_atual/qtd_respondentes_ano_passado - 1)*100
-        return pct_comparacao_ano_atual,qtd_respondentes_ano_passado
+        """Compara o total de respondentes com o do ano anterior.
+
+        Retorna (percentual_de_comparacao, qtd_respondentes_ano_passado), ou
+        (None, None) se não houver dados do ano anterior.
+        """
+        anterior = self.metricas_ano_passado()
+        if not anterior or not anterior["respondentes"]:
+            return None, None
+
+        qtd_respondentes_ano_passado = anterior["respondentes"]
+        pct_comparacao_ano_atual = (self.get_total_respondentes_ano_atual() / qtd_respondentes_ano_passado - 1) * 100
+        return pct_comparacao_ano_atual, qtd_respondentes_ano_passado
     
     def satisfacao_ano_passado(self):
-            pct_satisfacao_ano_passado = 40
-            return pct_satisfacao_ano_passado
+        """Retorna a porcentagem de concordância do ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["concordancia"][0] if anterior else None
     
     def insatisfacao_ano_passado(self):
-            pct_insatisfacao_ano_passado = 40
-            return pct_insatisfacao_ano_passado
+        """Retorna a porcentagem de discordância do ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["discordancia"][0] if anterior else None
     
     def desconhecimento_ano_passado(self):
-            pct_desconhecimento_ano_passado = 20
-            return pct_desconhecimento_ano_passado
+        """Retorna a porcentagem de desconhecimento do ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["desconhecimento"][0] if anterior else None
     
+    def opcoes_disciplina_curso_setor(self) -> OptionIndex:
+        """Retorna o índice das combinações disciplina/curso/setor do conjunto selecionado.
+
+        Os IDs do índice são as opções do seletor; ver `filtros_do_id`.
+        """
+        return DataLoader.opcoes(self.df_disciplinas(), self.COLUNAS_OPCOES, self.FORMATO_OPCAO)
+
     def formatacao_disciplina_curso_setor(self) -> list:
         """Retorna uma lista formatada com rótulos únicos disciplina/curso/setor.
 
         O primeiro elemento é 'Todas as disciplinas'.
         """
-        df = self.df_disciplinas().copy()
-
-        for col in ["NOME_DISCIPLINA", "CURSO", "SETOR_CURSO"]:
-            df[col] = df[col].astype(str).str.strip()
+        return ["Todas as disciplinas"] + self.opcoes_disciplina_curso_setor().rotulos()
 
-        df = df[['NOME_DISCIPLINA', 'CURSO', 'SETOR_CURSO']].drop_duplicates()
+    def filtros_do_id(self, opcao_id: int | None) -> dict:
+        """Converte um ID de `opcoes_disciplina_curso_setor` (None: todas) em `disciplina_value`/`curso_value`/`setor_value`."""
+        if opcao_id is None:
+            return {"disciplina_value": "Todas", "curso_value": "Todas", "setor_value": "Todas"}
 
-        opcoes = [
-            f"Disciplina:{row.NOME_DISCIPLINA} - Curso: {row.CURSO} - Setor: {row.SETOR_CURSO}"
-            for row in df.itertuples()
-        ]
+        disciplina, curso, setor = self.opcoes_disciplina_curso_setor().valores(opcao_id)
+        return {"disciplina_value": disciplina, "curso_value": curso, "setor_value": setor}
 
-        return ["Todas as disciplinas"] + sorted(opcoes)
-    
+    @FilterState.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
     def df_filtrado_pela_disciplina_curso_setor(self) -> pd.DataFrame:
         """Filtra o conjunto de dados selecionado por disciplina, curso e setor.
 
         Se `self.disciplina_value` for 'Todas', nenhum filtro é aplicado.
+        As colunas textuais já chegam sem espaços nas pontas (ver `DataLoader.aplicar_schema`).
         """
-        df = self.df_disciplinas().copy()
-
-        for col in ["NOME_DISCIPLINA", "CURSO", "SETOR_CURSO"]:
-            df[col] = df[col].astype(str).str.strip()
-
-        filtros = {
-            "NOME_DISCIPLINA": self.disciplina_value,
-            "CURSO": self.curso_value,
-            "SETOR_CURSO": self.setor_value,
-        }
-
-        for coluna, valor in filtros.items():
-            if self.disciplina_value != "Todas":
-                df = df[df[coluna] == valor]
-
-        return df
+        df = self.df_disciplinas()
+        return DataLoader.indice(df).selecionar(df, self._filtros_disciplina_curso_setor())
     
+    @CACHE_FIGURAS.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
     def grafico_distribuicao_total_donut(self):
         """Cria um gráfico donut mostrando a distribuição geral de respostas.
 
@@ -186,15 +257,13 @@ class AvaliacaoDasDisciplinasService(DataLoader):
             'Desconheço': '#95a5a6'
         }
 
-        df_filtered = self.df_filtrado_pela_disciplina_curso_setor()
-        total_resp = len(df_filtered)
+        df_pizza = self._cubo().contagens_por(filtros=self._filtros_disciplina_curso_setor())
+        df_pizza = df_pizza.rename(columns={"COUNT": "CONTAGEM"})
+        total_resp = int(df_pizza["CONTAGEM"].sum())
 
         if total_resp == 0:
             return None
 
-        df_pizza = df_filtered["RESPOSTA"].value_counts().reset_index()
-        df_pizza.columns = ["RESPOSTA", "CONTAGEM"]
-
         fig_donut = px.pie(
             df_pizza,
             values='CONTAGEM',
@@ -223,122 +292,93 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         return total_resp, fig_donut
     
-    def get_respondentes_filtrados(self):
-        """Retorna (respondentes_unicos, total_respostas) para os filtros atuais."""
-        df = self.df_filtrado_pela_disciplina_curso_setor()
-
-        if df.empty:
-            return 0, 0
+    @FilterState.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
+    def metricas_filtradas(self) -> dict:
+        """Calcula todas as métricas dos filtros atuais de uma só vez.
+
+        Resolve os filtros uma única vez pelo índice (`DataLoader.indice`) para contar os
+        respondentes únicos e faz uma única consulta ao cubo para as contagens.
+        Retorna um dict com `respondentes`, `total_respostas` e as tuplas
+        (percentual, total) `concordancia`, `discordancia` e `desconhecimento`.
+        """
+        df = self.df_disciplinas()
+        filtros = self._filtros_disciplina_curso_setor()
 
-        total_respondentes = df['ID_PESQUISA'].nunique()
-        total_respostas = len(df)
+        ids = df['ID_PESQUISA']
+        posicoes = DataLoader.indice(df).posicoes(filtros)
+        if posicoes is not None:
+            ids = ids.iloc[posicoes]
+        total_respostas = len(ids)
+        respondentes = ids.nunique()
 
-        return total_respondentes, total_respostas
+        contagens = self._cubo().contagem_por('VALOR_RESPOSTA', filtros)
 
-    def get_concordancia_filtrado(self):
-        """Retorna (percentual_concordancia, total_concordancia) para os dados filtrados."""
-        df = self.df_filtrado_pela_disciplina_curso_setor()
-        _, total_respostas = self.get_respondentes_filtrados()
+        metricas = {"respondentes": respondentes, "total_respostas": total_respostas}
+        for nome, valor in (("concordancia", 1), ("discordancia", -1), ("desconhecimento", 0)):
+            quantidade = contagens.get(valor, 0)
+            if total_respostas == 0:
+                metricas[nome] = (0, 0)
+            else:
+                metricas[nome] = ((quantidade / total_respostas) * 100, quantidade)
 
-        if total_respostas == 0:
-            return 0, 0
+        return metricas
 
-        total_concordo = df['VALOR_RESPOSTA'].eq(1).sum()
-        pct = (total_concordo / total_respostas) * 100
+    def get_respondentes_filtrados(self):
+        """Retorna (respondentes_unicos, total_respostas) para os filtros atuais."""
+        metricas = self.metricas_filtradas()
+        return metricas["respondentes"], metricas["total_respostas"]
 
-        return pct, total_concordo
+    def get_concordancia_filtrado(self):
+        """Retorna (percentual_concordancia, total_concordancia) para os dados filtrados."""
+        return self.metricas_filtradas()["concordancia"]
 
     def get_discordancia_filtrado(self):
         """Retorna (percentual_discordancia, total_discordancia) para os dados filtrados."""
-        df = self.df_filtrado_pela_disciplina_curso_setor()
-        _, total_respostas = self.get_respondentes_filtrados()
-
-        if total_respostas == 0:
-            return 0, 0
-
-        total_discordo = df['VALOR_RESPOSTA'].eq(-1).sum()
-        pct = (total_discordo / total_respostas) * 100
-
-        return pct, total_discordo
+        return self.metricas_filtradas()["discordancia"]
 
     def get_desconhecimento_filtrado(self):
         """Retorna (percentual_desconhecimento, total_desconhecimento) para os dados filtrados."""
-        df = self.df_filtrado_pela_disciplina_curso_setor()
-        _, total_respostas = self.get_respondentes_filtrados()
+        return self.metricas_filtradas()["desconhecimento"]
 
-        if total_respostas == 0:
-            return 0, 0
+    @FilterState.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
+    def tabela_frequencias(self) -> pd.DataFrame:
+        """Retorna a frequência absoluta de cada resposta por eixo e pergunta, com os filtros atuais."""
+        return self._cubo().frequencias(['EIXO_NOME', 'PERGUNTA'], self._filtros_disciplina_curso_setor())
 
-        total_desc = df['VALOR_RESPOSTA'].eq(0).sum()
-        pct = (total_desc / total_respostas) * 100
-
-        return pct, total_desc
+    def exportador_dados(self) -> DataExporter:
+        """Retorna o exportador das linhas que atendem aos filtros atuais (ver `DataExporter`)."""
+        df = self.df_disciplinas()
+        return DataExporter(df, DataLoader.indice(df).posicoes(self._filtros_disciplina_curso_setor()))
 
-    def grafico_resumo_por_eixo(self):
-        """Retorna um gráfico de barras empilhadas com a distribuição por eixo (EIXO_NOME)."""
-        COLOR_MAP = {
-            'Concordo': '#2ecc71',
-            'Discordo': '#e74c3c',
-            'Desconheço': '#95a5a6'
-        }
+    @FilterState.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
+    def sentimento_por_respondente(self) -> pd.DataFrame:
+        """Retorna o sentimento de cada respondente nos filtros atuais (ver `RespondentSentiment.tabela`)."""
+        df = self.df_disciplinas()
+        posicoes = DataLoader.indice(df).posicoes(self._filtros_disciplina_curso_setor())
+        return DataLoader.sentimento(df).tabela(posicoes)
 
-        df_filtered = self.df_filtrado_pela_disciplina_curso_setor()
+    @FilterState.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
+    def resumo_por_eixo(self) -> pd.DataFrame | None:
+        """Retorna a distribuição das respostas por eixo (ver `EixoSummary.resumir`), ou None sem dados."""
+        df_grouped = self._cubo().contagens_por(['EIXO_NOME'], self._filtros_disciplina_curso_setor())
 
-        if df_filtered.empty:
+        if df_grouped.empty:
             return None
 
-        df_filtered['EIXO_NOME'] = df_filtered['EIXO_NOME'].fillna(
-            df_filtered['EIXO_NOME'].str.replace("_", " ").str.title()
-        )
-
-        df_grouped = (
-            df_filtered.groupby(['EIXO_NOME', 'RESPOSTA'])
-            .size()
-            .reset_index(name='COUNT')
-        )
+        return EixoSummary.resumir(df_grouped)
 
-        total_por_eixo = (
-            df_filtered.groupby('EIXO_NOME')
-            .size()
-            .reset_index(name='TOTAL')
-        )
-
-        df_merged = pd.merge(df_grouped, total_por_eixo, on='EIXO_NOME')
-        df_merged['PERCENT'] = (df_merged['COUNT'] / df_merged['TOTAL']) * 100
-        df_merged = df_merged.sort_values('EIXO_NOME')
-
-        df_merged["LABEL"] = df_merged.apply(
-            lambda row: f"{row['PERCENT']:.1f}% ({row['COUNT']})", axis=1
-        )
-
-        fig_bar = px.bar(
-            df_merged,
-            x='EIXO_NOME',
-            y="PERCENT",
-            color="RESPOSTA",
-            color_discrete_map=COLOR_MAP,
-            barmode='stack',
-            text="LABEL",
-            height=500
-        )
-
-        fig_bar.update_traces(textposition="inside", insidetextanchor="middle")
-
-        fig_bar.update_layout(
-            title='Distribuição de respostas por eixos',
-            xaxis_title="Eixo",
-            yaxis_title="% das Respostas",
-            legend_title="",
-            margin=dict(l=10, r=10, t=45, b=0),
-            yaxis=dict(range=[0, 100]),
-            xaxis=dict(tickangle=10)
-        )
+    @CACHE_FIGURAS.memoizado('tipo_disciplina_value', 'disciplina_value', 'curso_value', 'setor_value')
+    def grafico_resumo_por_eixo(self):
+        """Retorna um gráfico de barras empilhadas com a distribuição por eixo (EIXO_NOME)."""
+        resumo = self.resumo_por_eixo()
+        if resumo is None:
+            return None
 
-        return fig_bar
+        return EixoSummary.grafico(resumo)
     
+    @CACHE_FIGURAS.memoizado('tipo_disciplina_value', 'curso_value', 'setor_value')
     def grafico_donut_setor(self): 
         """Retorna gráfico donut e total de respostas para o filtro de setor."""
-        df = self.df_disciplinas()
 
         COLOR_MAP = {
             'Concordo': '#2ecc71',
@@ -349,18 +389,14 @@ class AvaliacaoDasDisciplinasService(DataLoader):
         setor_value = self.setor_value
         curso_value = self.curso_value
 
-        if setor_value == "Todas":
-            df_filtered = df.copy()
-        else:
-            df_filtered = df[df['SETOR_CURSO'] == setor_value]
+        filtros = {} if setor_value == "Todas" else {'SETOR_CURSO': setor_value}
 
-        total_resp = len(df_filtered)
+        df_pizza = self._cubo().contagens_por(filtros=filtros)
+        df_pizza = df_pizza.rename(columns={"COUNT": "CONTAGEM"})
+        total_resp = int(df_pizza["CONTAGEM"].sum())
         if total_resp == 0:
             return None
 
-        df_pizza = df_filtered["RESPOSTA"].value_counts().reset_index()
-        df_pizza.columns = ["RESPOSTA", "CONTAGEM"]
-
         fig_donut = px.pie(
             df_pizza,
             values='CONTAGEM',
@@ -386,9 +422,9 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         return total_resp, fig_donut
     
+    @CACHE_FIGURAS.memoizado('tipo_disciplina_value', 'curso_value')
     def grafico_donut_curso(self): 
         """Retorna gráfico donut e total de respostas para o filtro de curso."""
-        df = self.df_disciplinas()
 
         COLOR_MAP = {
             'Concordo': '#2ecc71',
@@ -398,18 +434,14 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         curso_value = self.curso_value
 
-        if curso_value == "Todas":
-            df_filtered = df.copy()
-        else:
-            df_filtered = df[df['CURSO'] == curso_value]
+        filtros = {} if curso_value == "Todas" else {'CURSO': curso_value}
 
-        total_resp = len(df_filtered)
+        df_pizza = self._cubo().contagens_por(filtros=filtros)
+        df_pizza = df_pizza.rename(columns={"COUNT": "CONTAGEM"})
+        total_resp = int(df_pizza["CONTAGEM"].sum())
         if total_resp == 0:
             return None
 
-        df_pizza = df_filtered["RESPOSTA"].value_counts().reset_index()
-        df_pizza.columns = ["RESPOSTA", "CONTAGEM"]
-
         fig_donut = px.pie(
             df_pizza,
             values='CONTAGEM',
@@ -435,15 +467,10 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         return total_resp, fig_donut
 
+    @CACHE_FIGURAS.memoizado('tipo_disciplina_value')
     def grafico_distribuicao_geral_sentimento(self): 
         """Retorna histograma do sentimento médio por respondente."""
-        df = self.df_disciplinas()
-        df['valor'] = df['VALOR_RESPOSTA']
-        agg = df.groupby('ID_PESQUISA').agg(
-            n_answers=('valor', 'count'),
-            mean_sentiment=('valor', 'mean'),
-            pct_negative=('valor', lambda x: (x == -1).mean()),
-        ).reset_index()
+        agg = DataLoader.sentimento(self.df_disciplinas()).tabela()
 
         fig3 = px.histogram(
             agg,
@@ -464,35 +491,43 @@ class AvaliacaoDasDisciplinasService(DataLoader):
 
         return fig3
     
-    def grafico_saldo_opiniao_dimensao(self):
-        """Retorna figura mostrando o saldo de opinião por pergunta para uma dimensão.
+    @FilterState.memoizado('tipo_disciplina_value', 'dimensao_value')
+    def saldo_opiniao_dimensao(self) -> pd.DataFrame | None:
+        """Retorna o percentual de cada resposta por pergunta da dimensão selecionada.
 
-        Se `self.dimensao_value` não estiver definida ou colunas necessárias
-        estiverem ausentes, a função retorna None.
+        Índice `PERGUNTA`, uma coluna por resposta (sempre com Concordo, Discordo e
+        Desconheço), ordenado por Concordo. Retorna None sem dimensão selecionada
+        ou sem dados.
         """
-        df = self.df_disciplinas()
         dim_sel = self.dimensao_value
         if not dim_sel:
             return None
 
-        if 'DIMENSAO_NOME' not in df.columns:
+        cubo = self._cubo()
+        if 'DIMENSAO_NOME' not in cubo.dimensoes:
             return None
 
-        df_filtered = df[df["DIMENSAO_NOME"] == dim_sel]
-        if df_filtered.empty:
+        stats_pct = cubo.percentuais_por('PERGUNTA', {"DIMENSAO_NOME": dim_sel})
+        if stats_pct.empty:
             return None
 
-        stats_pct = pd.crosstab(
-            df_filtered['PERGUNTA'],
-            df_filtered['RESPOSTA'],
-            normalize='index'
-        ) * 100
-
         for col in ['Concordo', 'Discordo', 'Desconheço']:
             if col not in stats_pct.columns:
                 stats_pct[col] = 0.0
 
-        stats_pct = stats_pct.sort_values('Concordo', ascending=True)
+        return stats_pct.sort_values('Concordo', ascending=True)
+
+    @CACHE_FIGURAS.memoizado('tipo_disciplina_value', 'dimensao_value')
+    def grafico_saldo_opiniao_dimensao(self):
+        """Retorna figura mostrando o saldo de opinião por pergunta para uma dimensão.
+
+        Se `self.dimensao_value` não estiver definida ou colunas necessárias
+        estiverem ausentes, a função retorna None.
+        """
+        dim_sel = self.dimensao_value
+        stats_pct = self.saldo_opiniao_dimensao()
+        if stats_pct is None:
+            return None
 
         questions = stats_pct.index.tolist()
         concordo_list = stats_pct['Concordo'].tolist()
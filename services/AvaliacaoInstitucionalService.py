@@ -1,22 +1,38 @@
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+import functools
+from services.DataExporter import DataExporter
 from services.DataLoader  import DataLoader
+from services.EixoSummary import EixoSummary
+from services.FigureCache import CACHE_FIGURAS
+from services.FilterState import FilterState
 
 
 
-class AvaliacaoInstitucionalService(DataLoader):
+class AvaliacaoInstitucionalService(DataLoader, FilterState):
     """Serviço para análise dos dados de avaliação institucional.
 
     Fornece métodos para filtrar os dados, calcular métricas de
     respondentes/respostas e gerar gráficos de distribuição e resumo.
     """
+
+    COLUNAS = [
+        'ID_PESQUISA', 'EIXO_NOME', 'DIMENSAO_NUM', 'DIMENSAO_NOME', 'PERGUNTA',
+        'RESPOSTA', 'UNIDADE GESTORA', 'Ordem',
+    ]
+
+    # Filtros e respostas das métricas comparadas com o ano anterior (ver `PeriodComparison`).
+    CHAVES_COMPARACAO = ['EIXO_NOME', 'PERGUNTA']
+    VALORES_COMPARACAO = {'concordancia': 'Concordo', 'discordancia': 'Discordo', 'desconhecimento': 'Desconheço'}
+
     def __init__(
         self, 
         eixos_value=None,
         perguntas_value=None,
         dimensao_value = None,
         df_load_dados_institucional=None,
+        periodo=None,
     ):
         """Inicializa o serviço com filtros e DataFrame opcional.
 
@@ -26,15 +42,48 @@ class AvaliacaoInstitucionalService(DataLoader):
             Valores usados para filtrar os dados nas visualizações.
         df_load_dados_institucional : pd.DataFrame | None
             DataFrame com os dados institucionais. Se None, é carregado via DataLoader.
+        periodo : str | None
+            Ano a carregar (ver `DataLoader.periodos_disponiveis`). None usa o arquivo atual.
         """
+        self.periodo = periodo
+        self._path = None
         if df_load_dados_institucional is None:
-            df_load_dados_institucional = DataLoader.load_dados_institucional()
+            df_load_dados_institucional = DataLoader.load_periodo("institucional", periodo, columns=self.COLUNAS)
+            self._path = DataLoader.caminho_dados("institucional", periodo)
+            self._registrar_fonte("df_load_dados_institucional", functools.partial(DataLoader.load_periodo, "institucional", periodo, columns=self.COLUNAS))
 
         self.df_load_dados_institucional = df_load_dados_institucional
         self.eixos_value = eixos_value
         self.perguntas_value = perguntas_value
         self.dimensao_value = dimensao_value
     
+    def _versao_dados(self) -> str:
+        """Identifica o dataset institucional (ver `DataLoader.versao`)."""
+        return DataLoader.versao(self.df_load_dados_institucional)
+
+    def _cubo(self):
+        """Retorna o cubo de contagens dos dados institucionais."""
+        return DataLoader.cubo(self.df_load_dados_institucional, self._path)
+
+    def _filtros_eixo_pergunta(self) -> dict:
+        """Retorna os filtros de eixo/pergunta atuais no formato do cubo."""
+        eixo_value = self.eixos_value
+        pergunta_value = self.perguntas_value
+
+        if isinstance(eixo_value, str):
+            eixo_value = [eixo_value]
+        if isinstance(pergunta_value, str):
+            pergunta_value = [pergunta_value]
+
+        filtros = {}
+        if eixo_value and "Todos" not in eixo_value:
+            filtros["EIXO_NOME"] = list(eixo_value)
+        if pergunta_value and "Todos" not in pergunta_value:
+            filtros["PERGUNTA"] = [p.split(" - ", 1)[1] for p in pergunta_value]
+
+        return filtros
+
+    @FilterState.memoizado()
     def formatar_eixos(self) -> list:
         """Retorna lista de eixos disponíveis (iniciando por 'Todos')."""
         df = self.df_load_dados_institucional
@@ -42,6 +91,23 @@ class AvaliacaoInstitucionalService(DataLoader):
 
         return ['Todos'] + list_eixos
     
+    @FilterState.memoizado('eixos_value')
+    def formatar_perguntas(self) -> list:
+        """Retorna as perguntas dos eixos selecionados como 'Ordem - PERGUNTA' (iniciando por 'Todos').
+
+        É o formato esperado em `perguntas_value`.
+        """
+        df = self.df_load_dados_institucional
+        pares = df[['EIXO_NOME', 'Ordem', 'PERGUNTA']].drop_duplicates()
+
+        eixos = self._filtros_eixo_pergunta().get("EIXO_NOME")
+        if eixos:
+            pares = pares[pares['EIXO_NOME'].isin(eixos)]
+
+        perguntas_unicas = (pares['Ordem'].astype(int).astype(str) + ' - ' + pares['PERGUNTA'].astype(str)).unique().tolist()
+        return ['Todos'] + sorted(perguntas_unicas, key=lambda x: int(x.split(' - ')[0]))
+
+    @FilterState.memoizado('eixos_value', 'perguntas_value')
     def filtrar_dados_institucionais(self):
         """Filtra os dados institucionais por eixo e pergunta.
 
@@ -49,24 +115,12 @@ class AvaliacaoInstitucionalService(DataLoader):
         `self.perguntas_value`. Se o valor for 'Todos' ou vazio, não aplica
         o respectivo filtro.
         """
-        df = self.df_load_dados_institucional.copy()
-
-        eixo_value = self.eixos_value
-        pergunta_value = self.perguntas_value
-
-        if isinstance(eixo_value, str):
-            eixo_value = [eixo_value]
-        if isinstance(pergunta_value, str):
-            pergunta_value = [pergunta_value]
-
-        if not eixo_value or "Todos" in eixo_value:
-            df_filtered = df.copy()
-        else:
-            df_filtered = df[df["EIXO_NOME"].isin(eixo_value)].sort_values(by="Ordem")
+        df = self.df_load_dados_institucional
+        filtros = self._filtros_eixo_pergunta()
 
-        if pergunta_value and "Todos" not in pergunta_value:
-            perguntas_extraidas = [p.split(" - ", 1)[1] for p in pergunta_value]
-            df_filtered = df_filtered[df_filtered["PERGUNTA"].isin(perguntas_extraidas)]
+        df_filtered = DataLoader.indice(df).selecionar(df, filtros)
+        if "EIXO_NOME" in filtros:
+            df_filtered = df_filtered.sort_values(by="Ordem")
 
         return df_filtered
     
@@ -76,65 +130,85 @@ class AvaliacaoInstitucionalService(DataLoader):
         qtd_respondentes_atual = df['ID_PESQUISA'].nunique()
         return qtd_respondentes_atual
     
+    @FilterState.memoizado()
+    def _comparacao(self):
+        """Retorna as métricas pré-agregadas do mesmo período do ano anterior, ou None se não houver."""
+        anterior = DataLoader.periodo_anterior("institucional", self.periodo)
+        if anterior is None:
+            return None
+        return DataLoader.comparacao(
+            "institucional", anterior, self.CHAVES_COMPARACAO, 'RESPOSTA', self.VALORES_COMPARACAO
+        )
+
+    def metricas_ano_passado(self) -> dict | None:
+        """Retorna as métricas gerais do ano anterior (formato de `metricas_filtradas`), ou None."""
+        comparacao = self._comparacao()
+        return comparacao.metricas() if comparacao is not None else None
+
+    @FilterState.memoizado('eixos_value', 'perguntas_value')
+    def metricas_filtradas_ano_passado(self) -> dict | None:
+        """Retorna as métricas do ano anterior para os mesmos filtros de eixo/pergunta, ou None."""
+        comparacao = self._comparacao()
+        return comparacao.metricas(self._filtros_eixo_pergunta()) if comparacao is not None else None
+
     def total_respondentes_ano_passado(self): 
-        """Compara o número de respondentes com um valor fixo do ano anterior.
+        """Compara o número de respondentes com o do ano anterior.
 
-        Retorna (percentual_de_comparacao, qtd_respondentes_ano_passado).
+        Retorna (percentual_de_comparacao, qtd_respondentes_ano_passado), ou
+        (None, None) se não houver dados do ano anterior.
         """
-        qtd_respondentes_ano_atual = self.total_respondentes_ano_atual()
-        qtd_respondentes_ano_passado = 500
-        pct_comparacao_ano_atual = (qtd_respondentes_ano_atual / qtd_respondentes_ano_passado - 1) * 100
+        anterior = self.metricas_ano_passado()
+        if not anterior or not anterior["respondentes"]:
+            return None, None
+
+        qtd_respondentes_ano_passado = anterior["respondentes"]
+        pct_comparacao_ano_atual = (self.total_respondentes_ano_atual() / qtd_respondentes_ano_passado - 1) * 100
         return pct_comparacao_ano_atual, qtd_respondentes_ano_passado
     
     def total_respostas_ano_atual(self): 
         """Retorna o total de respostas registradas no ano atual."""
-        df = self.df_load_dados_institucional[['RESPOSTA']]
-        total_respostas = len(df)
+        total_respostas = len(self.df_load_dados_institucional)
         return total_respostas
 
     def satisfacao_ano_atual(self):
         """Retorna a porcentagem de respostas 'Concordo' no ano atual."""
-        df = self.df_load_dados_institucional[['RESPOSTA']]
         total_respostas = self.total_respostas_ano_atual()
+        contagens = self._cubo().contagem_por('RESPOSTA')
 
-        pct_satisfacao_ano_atual = (df['RESPOSTA'].eq('Concordo').sum() / total_respostas) * 100
+        pct_satisfacao_ano_atual = (contagens.get('Concordo', 0) / total_respostas) * 100
 
         return pct_satisfacao_ano_atual
     
-    def satisfacao_ano_passado(self): 
-        """Retorna valor fixo de satisfação para o ano passado (placeholder)."""
-        pct_satisfacao_ano_passado = 50
-        return pct_satisfacao_ano_passado
-    
     def satisfacao_ano_passado(self):
-        """(Sobrescrito) Retorna valor fixo de satisfação anterior."""
-        pct_satisfacao_ano_passado = 40
-        return pct_satisfacao_ano_passado
+        """Retorna a porcentagem de 'Concordo' no ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["concordancia"][0] if anterior else None
     
     def insatisfacao_ano_passado(self):
-        """Retorna valor fixo de insatisfação no ano passado (placeholder)."""
-        pct_insatisfacao_ano_passado = 40
-        return pct_insatisfacao_ano_passado
+        """Retorna a porcentagem de 'Discordo' no ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["discordancia"][0] if anterior else None
     
     def desconhecimento_ano_passado(self):
-        """Retorna valor fixo de desconhecimento no ano passado (placeholder)."""
-        pct_desconhecimento_ano_passado = 20
-        return pct_desconhecimento_ano_passado
+        """Retorna a porcentagem de 'Desconheço' no ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["desconhecimento"][0] if anterior else None
     
     def insatisfacao_ano_atual(self):
         """Retorna a porcentagem de respostas 'Discordo' no ano atual."""
-        df = self.df_load_dados_institucional[['RESPOSTA']]
         total_respostas = self.total_respostas_ano_atual()
-        pct_insatisfacao_ano_atual = (df['RESPOSTA'].eq('Discordo').sum() / total_respostas) * 100
+        contagens = self._cubo().contagem_por('RESPOSTA')
+        pct_insatisfacao_ano_atual = (contagens.get('Discordo', 0) / total_respostas) * 100
         return pct_insatisfacao_ano_atual
            
     def desconhecimento_ano_atual(self): 
         """Retorna a porcentagem de respostas 'Desconheço' no ano atual."""
-        df = self.df_load_dados_institucional[['RESPOSTA']]
         total_respostas = self.total_respostas_ano_atual()
-        pct_desconhecimento_ano_atual = (df['RESPOSTA'].eq('Desconheço').sum() / total_respostas) * 100
+        contagens = self._cubo().contagem_por('RESPOSTA')
+        pct_desconhecimento_ano_atual = (contagens.get('Desconheço', 0) / total_respostas) * 100
         return pct_desconhecimento_ano_atual
     
+    @CACHE_FIGURAS.memoizado('eixos_value', 'perguntas_value')
     def grafico_distribuicao_total_donut(self):
         """Gera um gráfico donut com a distribuição geral de respostas.
 
@@ -146,15 +220,13 @@ class AvaliacaoInstitucionalService(DataLoader):
             'Desconheço': '#95a5a6'
         }
 
-        df_filtered = self.filtrar_dados_institucionais()
-        total_resp = len(df_filtered)
+        df_pizza = self._cubo().contagens_por(filtros=self._filtros_eixo_pergunta())
+        df_pizza = df_pizza.rename(columns={"COUNT": "CONTAGEM"})
+        total_resp = int(df_pizza["CONTAGEM"].sum())
 
         if total_resp == 0:
             return None
 
-        df_pizza = df_filtered["RESPOSTA"].value_counts().reset_index()
-        df_pizza.columns = ["RESPOSTA", "CONTAGEM"]
-
         fig_donut = px.pie(
             df_pizza,
             values='CONTAGEM',
@@ -175,145 +247,105 @@ class AvaliacaoInstitucionalService(DataLoader):
 
         return total_resp, fig_donut
     
-    def get_respondentes_filtrados(self):
-        """Retorna (respondentes_unicos, total_respostas) após aplicar filtros."""
-        df = self.filtrar_dados_institucionais()
-        if df.empty or 'ID_PESQUISA' not in df.columns:
-            return 0, 0
-
-        total_respondentes = df['ID_PESQUISA'].nunique()
-        total_respostas = len(df)
+    @FilterState.memoizado('eixos_value', 'perguntas_value')
+    def metricas_filtradas(self) -> dict:
+        """Calcula todas as métricas dos filtros atuais de uma só vez.
+
+        Resolve os filtros uma única vez pelo índice (`DataLoader.indice`) para contar os
+        respondentes únicos e faz uma única consulta ao cubo para as contagens.
+        Retorna um dict com `respondentes`, `total_respostas` e as tuplas
+        (percentual, total) `concordancia`, `discordancia` e `desconhecimento`.
+        """
+        df = self.df_load_dados_institucional
+        filtros = self._filtros_eixo_pergunta()
 
-        return total_respondentes, total_respostas
+        ids = df['ID_PESQUISA']
+        posicoes = DataLoader.indice(df).posicoes(filtros)
+        if posicoes is not None:
+            ids = ids.iloc[posicoes]
+        total_respostas = len(ids)
+        respondentes = ids.nunique()
 
-    def get_concordancia_filtrado(self):
-        """Retorna (percentual_concordancia, total_concordancia) para os dados filtrados."""
-        df = self.filtrar_dados_institucionais()
-        _, total_respostas = self.get_respondentes_filtrados()
+        contagens = self._cubo().contagem_por('RESPOSTA', filtros)
 
-        if df.empty or 'RESPOSTA' not in df.columns:
-            return 0, 0
+        metricas = {"respondentes": respondentes, "total_respostas": total_respostas}
+        for nome, valor in (("concordancia", "Concordo"), ("discordancia", "Discordo"), ("desconhecimento", "Desconheço")):
+            quantidade = contagens.get(valor, 0)
+            if total_respostas == 0:
+                metricas[nome] = (0, 0)
+            else:
+                metricas[nome] = ((quantidade / total_respostas) * 100, quantidade)
 
-        total_concordo = df['RESPOSTA'].eq('Concordo').sum()
+        return metricas
 
-        if total_respostas == 0:
-            return 0, 0
+    def get_respondentes_filtrados(self):
+        """Retorna (respondentes_unicos, total_respostas) após aplicar filtros."""
+        metricas = self.metricas_filtradas()
+        return metricas["respondentes"], metricas["total_respostas"]
 
-        pct = (total_concordo / total_respostas) * 100
-        return pct, total_concordo
+    def get_concordancia_filtrado(self):
+        """Retorna (percentual_concordancia, total_concordancia) para os dados filtrados."""
+        return self.metricas_filtradas()["concordancia"]
 
     def get_discordancia_filtrado(self):
         """Retorna (percentual_discordancia, total_discordancia) para os dados filtrados."""
-        df = self.filtrar_dados_institucionais()
-        _, total_respostas = self.get_respondentes_filtrados()
-
-        if df.empty or 'RESPOSTA' not in df.columns:
-            return 0, 0
-
-        total_discordo = df['RESPOSTA'].eq('Discordo').sum()
-
-        if total_respostas == 0:
-            return 0, 0
-
-        pct = (total_discordo / total_respostas) * 100
-        return pct, total_discordo
+        return self.metricas_filtradas()["discordancia"]
 
     def get_desconhecimento_filtrado(self):
         """Retorna (percentual_desconhecimento, total_desconhecimento) para os dados filtrados."""
-        df = self.filtrar_dados_institucionais()
-        _, total_respostas = self.get_respondentes_filtrados()
+        return self.metricas_filtradas()["desconhecimento"]
 
-        if df.empty or 'RESPOSTA' not in df.columns:
-            return 0, 0
+    @FilterState.memoizado('eixos_value', 'perguntas_value')
+    def tabela_frequencias(self) -> pd.DataFrame:
+        """Retorna a frequência absoluta de cada resposta por eixo e pergunta, com os filtros atuais."""
+        return self._cubo().frequencias(['EIXO_NOME', 'PERGUNTA'], self._filtros_eixo_pergunta())
 
-        total_desc = df['RESPOSTA'].eq('Desconheço').sum()
+    def exportador_dados(self) -> DataExporter:
+        """Retorna o exportador das linhas que atendem aos filtros atuais (ver `DataExporter`)."""
+        df = self.df_load_dados_institucional
+        return DataExporter(df, DataLoader.indice(df).posicoes(self._filtros_eixo_pergunta()))
 
-        if total_respostas == 0:
-            return 0, 0
+    @FilterState.memoizado('eixos_value', 'perguntas_value')
+    def sentimento_por_respondente(self) -> pd.DataFrame:
+        """Retorna o sentimento de cada respondente nos filtros atuais (ver `RespondentSentiment.tabela`)."""
+        df = self.df_load_dados_institucional
+        posicoes = DataLoader.indice(df).posicoes(self._filtros_eixo_pergunta())
+        return DataLoader.sentimento(df).tabela(posicoes)
 
-        pct = (total_desc / total_respostas) * 100
-        return pct, total_desc
+    @FilterState.memoizado('eixos_value', 'perguntas_value')
+    def resumo_por_eixo(self) -> pd.DataFrame | None:
+        """Retorna a distribuição das respostas por eixo (ver `EixoSummary.resumir`), ou None sem dados."""
+        df_grouped = self._cubo().contagens_por(['EIXO_NOME'], self._filtros_eixo_pergunta())
 
+        if df_grouped.empty:
+            return None
+
+        return EixoSummary.resumir(df_grouped)
+
+    @CACHE_FIGURAS.memoizado('eixos_value', 'perguntas_value')
     def grafico_resumo_por_eixo(self):
         """Gera um gráfico de barras empilhadas com a distribuição por eixo.
 
         Retorna o objeto de figura Plotly ou None se não houver dados.
         """
-        COLOR_MAP = {
-            'Concordo': '#2ecc71',
-            'Discordo': '#e74c3c',
-            'Desconheço': '#95a5a6'
-        }
-
-        df_filtered = self.filtrar_dados_institucionais()
-
-        if df_filtered.empty:
+        resumo = self.resumo_por_eixo()
+        if resumo is None:
             return None
 
-        df_filtered['EIXO_NOME'] = df_filtered['EIXO_NOME'].fillna(
-            df_filtered['EIXO_NOME'].str.replace("_", " ").str.title()
-        )
-
-        df_grouped = (
-            df_filtered.groupby(['EIXO_NOME', 'RESPOSTA'])
-            .size()
-            .reset_index(name='COUNT')
-        )
-
-        total_por_eixo = (
-            df_filtered.groupby('EIXO_NOME')
-            .size()
-            .reset_index(name='TOTAL')
-        )
-
-        df_merged = pd.merge(df_grouped, total_por_eixo, on='EIXO_NOME')
-        df_merged['PERCENT'] = (df_merged['COUNT'] / df_merged['TOTAL']) * 100
-        df_merged = df_merged.sort_values('EIXO_NOME')
-
-        df_merged["LABEL"] = df_merged.apply(
-            lambda row: f"{row['PERCENT']:.1f}% ({row['COUNT']})", axis=1
-        )
-
-        fig_bar = px.bar(
-            df_merged,
-            x='EIXO_NOME',
-            y="PERCENT",
-            color="RESPOSTA",
-            color_discrete_map=COLOR_MAP,
-            barmode='stack',
-            text="LABEL",
-            height=500
-        )
-
-        fig_bar.update_traces(textposition="inside", insidetextanchor="middle")
-
-        fig_bar.update_layout(
-            title='Distribuição de respostas por eixos',
-            xaxis_title="Eixo",
-            yaxis_title="% das Respostas",
-            legend_title="",
-            margin=dict(l=10, r=10, t=45, b=0),
-            yaxis=dict(range=[0, 100]),
-            xaxis=dict(tickangle=10)
-        )
-
-        return fig_bar
+        return EixoSummary.grafico(resumo)
 
     def preparar_dados_unidade_gestora(self):
         """Prepara DataFrame com contagem de respostas por unidade gestora."""
-        df = self.filtrar_dados_institucionais()
-        df = df[['ID_PESQUISA', 'UNIDADE GESTORA']]
-        df = df.dropna(subset=['UNIDADE GESTORA'])
-
         dataframe_fig = (
-            df.groupby('UNIDADE GESTORA')
-            .size()
+            self._cubo()
+            .contagem_por('UNIDADE GESTORA', self._filtros_eixo_pergunta())
             .reset_index(name='TOTAL_RESPOSTAS')
             .sort_values('TOTAL_RESPOSTAS', ascending=True)
         )
 
         return dataframe_fig
 
+    @CACHE_FIGURAS.memoizado('eixos_value', 'perguntas_value')
     def grafico_barra_unidade_gestora(self):
         """Gera gráfico de barras horizontais com top 10 unidades gestoras."""
         dataframe_fig = self.preparar_dados_unidade_gestora()
@@ -339,6 +371,7 @@ class AvaliacaoInstitucionalService(DataLoader):
         )
         return fig_bar
     
+    @CACHE_FIGURAS.memoizado()
     def grafico_donut_top10(self):
         """Gera gráfico donut mostrando participação do top 10 unidades gestoras."""
         df = self.df_load_dados_institucional[['ID_PESQUISA', 'UNIDADE GESTORA']].dropna()
@@ -347,7 +380,7 @@ class AvaliacaoInstitucionalService(DataLoader):
         total_geral = df_unique['ID_PESQUISA'].nunique()
 
         df_contagem = (
-            df_unique.groupby('UNIDADE GESTORA')['ID_PESQUISA']
+            df_unique.groupby('UNIDADE GESTORA', observed=True)['ID_PESQUISA']
             .count()
             .reset_index(name='TOTAL_PESSOAS')
         )
@@ -380,37 +413,43 @@ class AvaliacaoInstitucionalService(DataLoader):
 
         return fig_donut
 
-    def grafico_saldo_opiniao_dimensao(self):
-        """Gera figura com saldo de opinião por pergunta para a dimensão selecionada.
+    @FilterState.memoizado('dimensao_value')
+    def saldo_opiniao_dimensao(self) -> pd.DataFrame | None:
+        """Retorna o percentual de cada resposta por pergunta da dimensão selecionada.
 
-        Se `self.dimensao_value` não estiver definida ou a coluna necessária
-        estiver ausente, retorna None.
+        Índice `PERGUNTA`, uma coluna por resposta (sempre com Concordo, Discordo e
+        Desconheço), ordenado por Concordo. Retorna None sem dimensão selecionada
+        ou sem dados.
         """
-        df = self.df_load_dados_institucional.copy()
-
         dim_sel = self.dimensao_value
         if not dim_sel:
             return None
 
-        if 'DIMENSAO_NOME' not in df.columns:
+        cubo = self._cubo()
+        if 'DIMENSAO_NOME' not in cubo.dimensoes:
             return None
 
-        df_filtered = df[df["DIMENSAO_NOME"] == dim_sel]
-
-        if df_filtered.empty:
+        stats_pct = cubo.percentuais_por('PERGUNTA', {"DIMENSAO_NOME": dim_sel})
+        if stats_pct.empty:
             return None
 
-        stats_pct = pd.crosstab(
-            df_filtered['PERGUNTA'],
-            df_filtered['RESPOSTA'],
-            normalize='index'
-        ) * 100
-
         for col in ['Concordo', 'Discordo', 'Desconheço']:
             if col not in stats_pct.columns:
                 stats_pct[col] = 0.0
 
-        stats_pct = stats_pct.sort_values('Concordo', ascending=True)
+        return stats_pct.sort_values('Concordo', ascending=True)
+
+    @CACHE_FIGURAS.memoizado('dimensao_value')
+    def grafico_saldo_opiniao_dimensao(self):
+        """Gera figura com saldo de opinião por pergunta para a dimensão selecionada.
+
+        Se `self.dimensao_value` não estiver definida ou a coluna necessária
+        estiver ausente, retorna None.
+        """
+        dim_sel = self.dimensao_value
+        stats_pct = self.saldo_opiniao_dimensao()
+        if stats_pct is None:
+            return None
 
         questions = stats_pct.index.tolist()
         concordo_list = stats_pct['Concordo'].tolist()
@@ -1,20 +1,41 @@
+from services.DataExporter import DataExporter
 from services.DataLoader  import DataLoader
+from services.EixoSummary import EixoSummary
+from services.FigureCache import CACHE_FIGURAS
+from services.FilterState import FilterState
+from services.OptionIndex import OptionIndex
+import functools
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 import textwrap
 
-class AvaliacaoDosCursosService(DataLoader):
+class AvaliacaoDosCursosService(DataLoader, FilterState):
     """Serviço para análise das avaliações por curso.
 
     Fornece métodos para calcular métricas de respondentes e respostas,
     além de gerar gráficos de distribuição e radar por dimensão.
     """
+
+    COLUNAS = [
+        'ID_PESQUISA', 'EIXO_NOME', 'DIMENSAO_NOME', 'ID_PERGUNTA', 'PERGUNTA',
+        'RESPOSTA', 'VALOR_RESPOSTA', 'CURSO', 'SETOR_CURSO',
+    ]
+
+    # Filtros e respostas das métricas comparadas com o ano anterior (ver `PeriodComparison`).
+    CHAVES_COMPARACAO = ['CURSO', 'SETOR_CURSO']
+    VALORES_COMPARACAO = {'concordancia': 1, 'discordancia': -1, 'desconhecimento': 0}
+
+    # Colunas e rótulo das opções do seletor de curso (ver `OptionIndex`).
+    COLUNAS_OPCOES = ['CURSO', 'SETOR_CURSO']
+    FORMATO_OPCAO = "Curso: {} - Setor: {}"
+
     def __init__(self,
                 df_load_dados_curso = None,
                 curso_value = None,
                 setor_value = None,
                 dimensao_value = None, 
+                periodo = None,
                 ):
         """Inicializa o serviço com DataFrame opcional e filtros.
 
@@ -24,14 +45,38 @@ class AvaliacaoDosCursosService(DataLoader):
             DataFrame com os dados do curso; carregado via DataLoader se None.
         curso_value, setor_value, dimensao_value : opcionais
             Valores usados para filtrar os dados nas visualizações.
+        periodo : str | None
+            Ano a carregar (ver `DataLoader.periodos_disponiveis`). None usa o arquivo atual.
         """
+        self.periodo = periodo
+        self._path = None
         if df_load_dados_curso is None:
-            df_load_dados_curso = DataLoader.load_dados_curso()
+            df_load_dados_curso = DataLoader.load_periodo("cursos", periodo, columns=self.COLUNAS)
+            self._path = DataLoader.caminho_dados("cursos", periodo)
+            self._registrar_fonte("df", functools.partial(DataLoader.load_periodo, "cursos", periodo, columns=self.COLUNAS))
 
         self.df = df_load_dados_curso
         self.curso_value = curso_value
+        self.setor_value = setor_value
         self.dimensao_value = dimensao_value
 
+    def _versao_dados(self) -> str:
+        """Identifica o dataset de cursos (ver `DataLoader.versao`)."""
+        return DataLoader.versao(self.df)
+
+    def _cubo(self):
+        """Retorna o cubo de contagens dos dados de cursos."""
+        return DataLoader.cubo(self.df, self._path)
+
+    def _filtros_curso(self) -> dict:
+        """Retorna os filtros de curso/setor atuais no formato do cubo."""
+        filtros = {}
+        if self.curso_value != 'Todos':
+            filtros["CURSO"] = self.curso_value
+        if self.setor_value and self.setor_value != 'Todos':
+            filtros["SETOR_CURSO"] = self.setor_value
+        return filtros
+
     def get_total_respondentes(self) -> int:
         """Retorna o número de respondentes únicos (ID_PESQUISA)."""
         return self.df["ID_PESQUISA"].nunique()
@@ -47,7 +92,7 @@ class AvaliacaoDosCursosService(DataLoader):
         if total == 0:
             return 0
 
-        concordancia = df["VALOR_RESPOSTA"].eq(1).sum()
+        concordancia = self._cubo().contagem_por("VALOR_RESPOSTA").get(1, 0)
         return (concordancia / total) * 100
 
 
@@ -61,7 +106,7 @@ class AvaliacaoDosCursosService(DataLoader):
         if total == 0:
             return 0
 
-        discordancia = df["VALOR_RESPOSTA"].eq(-1).sum()
+        discordancia = self._cubo().contagem_por("VALOR_RESPOSTA").get(-1, 0)
         return (discordancia / total) * 100
 
 
@@ -75,62 +120,91 @@ class AvaliacaoDosCursosService(DataLoader):
         if total == 0:
             return 0
 
-        desconhecimento = df["VALOR_RESPOSTA"].eq(0).sum()
+        desconhecimento = self._cubo().contagem_por("VALOR_RESPOSTA").get(0, 0)
         return (desconhecimento / total) * 100
 
     
+    @FilterState.memoizado()
+    def _comparacao(self):
+        """Retorna as métricas pré-agregadas do mesmo período do ano anterior, ou None se não houver."""
+        tipo = "cursos"
+        anterior = DataLoader.periodo_anterior(tipo, self.periodo)
+        if anterior is None:
+            return None
+        return DataLoader.comparacao(tipo, anterior, self.CHAVES_COMPARACAO, 'VALOR_RESPOSTA', self.VALORES_COMPARACAO)
+
+    def metricas_ano_passado(self) -> dict | None:
+        """Retorna as métricas gerais do ano anterior (formato de `metricas_filtradas`), ou None."""
+        comparacao = self._comparacao()
+        return comparacao.metricas() if comparacao is not None else None
+
+    @FilterState.memoizado('curso_value', 'setor_value')
+    def metricas_filtradas_ano_passado(self) -> dict | None:
+        """Retorna as métricas do ano anterior para os mesmos filtros, ou None."""
+        comparacao = self._comparacao()
+        return comparacao.metricas(self._filtros_curso()) if comparacao is not None else None
+
     def total_respondentes_ano_passado(self): 
-        """Compara o total de respondentes com um valor fixo do ano anterior.
+        """Compara o total de respondentes com o do ano anterior.
 
-        Retorna (percentual_de_comparacao, qtd_respondentes_ano_passado).
+        Retorna (percentual_de_comparacao, qtd_respondentes_ano_passado), ou
+        (None, None) se não houver dados do ano anterior.
         """
-        qtd_respondentes_ano_atual = self.get_total_respondentes()
-        qtd_respondentes_ano_passado = 1000
-        pct_comparacao_ano_atual = (qtd_respondentes_ano_atual / qtd_respondentes_ano_passado - 1) * 100
+        anterior = self.metricas_ano_passado()
+        if not anterior or not anterior["respondentes"]:
+            return None, None
+
+        qtd_respondentes_ano_passado = anterior["respondentes"]
+        pct_comparacao_ano_atual = (self.get_total_respondentes() / qtd_respondentes_ano_passado - 1) * 100
         return pct_comparacao_ano_atual, qtd_respondentes_ano_passado
     
     def satisfacao_ano_passado(self):
-        """Retorna valor fixo de satisfação do ano passado (placeholder)."""
-        pct_satisfacao_ano_passado = 40
-        return pct_satisfacao_ano_passado
+        """Retorna a porcentagem de concordância do ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["concordancia"][0] if anterior else None
     
     def insatisfacao_ano_passado(self):
-        """Retorna valor fixo de insatisfação do ano passado (placeholder)."""
-        pct_insatisfacao_ano_passado = 40
-        return pct_insatisfacao_ano_passado
+        """Retorna a porcentagem de discordância do ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["discordancia"][0] if anterior else None
     
     def desconhecimento_ano_passado(self):
-        """Retorna valor fixo de desconhecimento do ano passado (placeholder)."""
-        pct_desconhecimento_ano_passado = 20
-        return pct_desconhecimento_ano_passado
+        """Retorna a porcentagem de desconhecimento do ano anterior, ou None se não houver dados."""
+        anterior = self.metricas_ano_passado()
+        return anterior["desconhecimento"][0] if anterior else None
     
+    def opcoes_curso_setor(self) -> OptionIndex:
+        """Retorna o índice das combinações curso/setor (ver `OptionIndex`).
+
+        Os IDs do índice são as opções do seletor; ver `filtros_do_id`.
+        """
+        return DataLoader.opcoes(self.df, self.COLUNAS_OPCOES, self.FORMATO_OPCAO)
+
     def formatacao_curso_setor(self) -> list:
         """Retorna lista formatada de cursos e seus setores.
 
         O primeiro elemento é 'Todos os cursos'.
         """
-        df = self.df[['CURSO', 'SETOR_CURSO']].drop_duplicates()
+        return ["Todos os cursos"] + self.opcoes_curso_setor().rotulos()
 
-        opcoes = [
-            f"Curso: {row.CURSO} - Setor: {row.SETOR_CURSO}"
-            for row in df.itertuples()
-        ]
-        return ["Todos os cursos"] + sorted(opcoes)
+    def filtros_do_id(self, opcao_id: int | None) -> dict:
+        """Converte um ID de `opcoes_curso_setor` (None: todos) em `curso_value`/`setor_value`."""
+        if opcao_id is None:
+            return {"curso_value": "Todos", "setor_value": "Todos"}
 
+        curso_value, setor_value = self.opcoes_curso_setor().valores(opcao_id)
+        return {"curso_value": curso_value, "setor_value": setor_value}
+
+    @FilterState.memoizado('curso_value', 'setor_value')
     def df_curso_filtrado_selecionado(self) -> pd.DataFrame:
-        """Retorna o DataFrame filtrado pelo curso selecionado.
+        """Retorna o DataFrame filtrado pelo curso e setor selecionados.
 
-        Se `self.curso_value` for 'Todos', retorna o DataFrame completo.
+        Se ambos forem 'Todos', retorna o DataFrame completo.
         """
         df = self.df
-        curso_value = self.curso_value
-        if curso_value == 'Todos':
-            df_curso = df
-        else:
-            df_curso = df[df["CURSO"] == curso_value]
-
-        return df_curso
+        return DataLoader.indice(df).selecionar(df, self._filtros_curso())
     
+    @CACHE_FIGURAS.memoizado('curso_value', 'setor_value')
     def grafico_distribuicao_total_donut(self):
         """Gera gráfico donut com a distribuição de respostas por curso.
 
@@ -144,15 +218,13 @@ class AvaliacaoDosCursosService(DataLoader):
             'Desconheço': '#95a5a6'
         }
 
-        df_filtered = self.df_curso_filtrado_selecionado()
-        total_resp = len(df_filtered)
+        df_pizza = self._cubo().contagens_por(filtros=self._filtros_curso())
+        df_pizza = df_pizza.rename(columns={"COUNT": "CONTAGEM"})
+        total_resp = int(df_pizza["CONTAGEM"].sum())
 
         if total_resp == 0:
             return None
 
-        df_pizza = df_filtered["RESPOSTA"].value_counts().reset_index()
-        df_pizza.columns = ["RESPOSTA", "CONTAGEM"]
-
         fig_donut = px.pie(
             df_pizza,
             values='CONTAGEM',
@@ -180,129 +252,214 @@ class AvaliacaoDosCursosService(DataLoader):
 
         return total_resp, fig_donut
     
+    @FilterState.memoizado('curso_value', 'setor_value')
+    def tabela_frequencias(self) -> pd.DataFrame:
+        """Retorna a frequência absoluta de cada resposta por eixo e pergunta, com os filtros atuais."""
+        return self._cubo().frequencias(['EIXO_NOME', 'PERGUNTA'], self._filtros_curso())
+
+    def exportador_dados(self) -> DataExporter:
+        """Retorna o exportador das linhas que atendem aos filtros atuais (ver `DataExporter`)."""
+        df = self.df
+        return DataExporter(df, DataLoader.indice(df).posicoes(self._filtros_curso()))
+
+    @FilterState.memoizado('curso_value', 'setor_value')
+    def sentimento_por_respondente(self) -> pd.DataFrame:
+        """Retorna o sentimento de cada respondente nos filtros atuais (ver `RespondentSentiment.tabela`)."""
+        df = self.df
+        posicoes = DataLoader.indice(df).posicoes(self._filtros_curso())
+        return DataLoader.sentimento(df).tabela(posicoes)
+
+    @FilterState.memoizado('curso_value', 'setor_value')
+    def resumo_por_eixo(self) -> pd.DataFrame | None:
+        """Retorna a distribuição das respostas por eixo (ver `EixoSummary.resumir`), ou None sem dados."""
+        df_grouped = self._cubo().contagens_por(['EIXO_NOME'], self._filtros_curso())
+
+        if df_grouped.empty:
+            return None
+
+        return EixoSummary.resumir(df_grouped)
+
+    @CACHE_FIGURAS.memoizado('curso_value', 'setor_value')
     def grafico_resumo_por_eixo(self):
         """Gera um gráfico de barras empilhadas com a distribuição por eixo.
 
         Retorna uma figura Plotly com porcentagens por resposta em cada eixo.
         """
-        COLOR_MAP = {
-            'Concordo': '#2ecc71',
-            'Discordo': '#e74c3c',
-            'Desconheço': '#95a5a6'
-        }
-        df_filtered = self.df_curso_filtrado_selecionado()
+        resumo = self.resumo_por_eixo()
+        if resumo is None:
+            return None
+
+        return EixoSummary.grafico(resumo)
+    
+    @FilterState.memoizado('dimensao_value')
+    def saldo_opiniao_dimensao(self) -> pd.DataFrame | None:
+        """Retorna o percentual de cada resposta por pergunta da dimensão selecionada.
 
-        if df_filtered.empty:
+        Índice `PERGUNTA`, uma coluna por resposta (sempre com Concordo, Discordo e
+        Desconheço), ordenado por Concordo. Retorna None sem dimensão selecionada
+        ou sem dados.
+        """
+        dim_sel = self.dimensao_value
+        if not dim_sel:
             return None
 
-        df_grouped = (
-            df_filtered.groupby(['EIXO_NOME', 'RESPOSTA'])
-            .size()
-            .reset_index(name='COUNT')
-        )
+        cubo = self._cubo()
+        if 'DIMENSAO_NOME' not in cubo.dimensoes:
+            return None
 
-        total_por_eixo = (
-            df_filtered.groupby('EIXO_NOME')
-            .size()
-            .reset_index(name='TOTAL')
-        )
+        stats_pct = cubo.percentuais_por('PERGUNTA', {"DIMENSAO_NOME": dim_sel})
+        if stats_pct.empty:
+            return None
 
-        df_merged = pd.merge(df_grouped, total_por_eixo, on='EIXO_NOME')
-        df_merged['PERCENT'] = (df_merged['COUNT'] / df_merged['TOTAL']) * 100
-        df_merged = df_merged.sort_values('EIXO_NOME')
+        for col in ['Concordo', 'Discordo', 'Desconheço']:
+            if col not in stats_pct.columns:
+                stats_pct[col] = 0.0
 
-        df_merged["LABEL"] = df_merged.apply(
-            lambda row: f"{row['PERCENT']:.1f}% ({row['COUNT']})", axis=1
-        )
+        return stats_pct.sort_values('Concordo', ascending=True)
 
-        fig_bar = px.bar(
-            df_merged,
-            x='EIXO_NOME',
-            y="PERCENT",
-            color="RESPOSTA",
-            color_discrete_map=COLOR_MAP,
-            barmode='stack',
-            text="LABEL",
-            height=500
-        )
+    @CACHE_FIGURAS.memoizado('dimensao_value')
+    def grafico_saldo_opiniao_dimensao(self):
+        """Gera figura divergente com o saldo de opinião por pergunta da dimensão selecionada.
 
-        fig_bar.update_traces(
-            textposition="inside",
-            insidetextanchor="middle"
-        )
+        Retorna None se `self.dimensao_value` não estiver definida ou não houver dados.
+        """
+        dim_sel = self.dimensao_value
+        stats_pct = self.saldo_opiniao_dimensao()
+        if stats_pct is None:
+            return None
 
-        fig_bar.update_layout(
-            title = 'Distribuição de respostas por eixos',
-            xaxis_title="Eixo",
-            yaxis_title="% das Respostas",
-            legend_title="",
-            margin=dict(l=10, r=10, t=45, b=0),
-            yaxis=dict(range=[0, 100]),
-            xaxis=dict(tickangle=10)
+        questions = stats_pct.index.tolist()
+        concordo_list = stats_pct['Concordo'].tolist()
+        discordo_list = stats_pct['Discordo'].tolist()
+        desconheco_list = stats_pct['Desconheço'].tolist()
+
+        def quebrar_texto(texto, max_chars=50):
+            if len(texto) <= max_chars:
+                return texto
+            return "<br>".join(textwrap.wrap(texto, width=max_chars))
+
+        questions_formatted = [quebrar_texto(q) for q in questions]
+
+        discordo_neg_list = [-x for x in discordo_list]
+
+        # Desconheço dividido ao meio, metade de cada lado do zero.
+        desconheco_metade = [x / 2 for x in desconheco_list]
+        desconheco_metade_neg = [-x for x in desconheco_metade]
+
+        hover_desconheco = [f"Desconheço: {x:.1f}%" for x in desconheco_list]
+        label_desconheco = [f"{x:.1f}%" if x > 1 else "" for x in desconheco_list]
+
+        fig_div = go.Figure()
+
+        fig_div.add_trace(go.Bar(
+            y=questions_formatted, x=desconheco_metade_neg,
+            name='Desconheço', orientation='h', marker_color='#95a5a6',
+            legendgroup='grp_desc', showlegend=True,
+            hoverinfo='text', hovertext=hover_desconheco,
+            visible='legendonly'
+        ))
+
+        fig_div.add_trace(go.Bar(
+            y=questions_formatted, x=desconheco_metade,
+            name='Desconheço', orientation='h', marker_color='#95a5a6',
+            legendgroup='grp_desc', showlegend=False,
+            text=label_desconheco, textposition='inside',
+            hoverinfo='text', hovertext=hover_desconheco,
+            visible='legendonly'
+        ))
+
+        fig_div.add_trace(go.Bar(
+            y=questions_formatted, x=discordo_neg_list,
+            name='Discordo', orientation='h', marker_color='#e74c3c',
+            text=[f"{x:.1f}%" if x > 1 else "" for x in discordo_list],
+            textposition='inside', insidetextanchor='middle',
+            hoverinfo='text+y', hovertext=[f"Discordo: {x:.1f}%" for x in discordo_list]
+        ))
+
+        fig_div.add_trace(go.Bar(
+            y=questions_formatted, x=concordo_list,
+            name='Concordo', orientation='h', marker_color='#2ecc71',
+            text=[f"{x:.1f}%" if x > 1 else "" for x in concordo_list],
+            textposition='inside', insidetextanchor='middle',
+            hoverinfo='text+y', hovertext=[f"Concordo: {x:.1f}%" for x in concordo_list]
+        ))
+
+        fig_div.update_layout(
+            barmode='relative',
+            title=f"Saldo de Opinião: {dim_sel}",
+            xaxis_title="% Rejeição <---> % Aprovação",
+            yaxis=dict(title=""),
+            legend_title_text='Resposta',
+            height=max(400, len(questions) * 60 + 100),
+            margin=dict(l=10, r=10, t=80, b=20)
         )
 
-        return fig_bar
-    
+        fig_div.add_vline(x=0, line_width=1, line_color="black", opacity=0.3)
+
+        return fig_div
+
+    @FilterState.memoizado('curso_value', 'setor_value')
+    def metricas_filtradas(self) -> dict:
+        """Calcula todas as métricas do curso selecionado de uma só vez.
+
+        Resolve o filtro uma única vez pelo índice (`DataLoader.indice`) para contar os
+        respondentes únicos e faz uma única consulta ao cubo para as contagens.
+        Os percentuais usam como base as respostas com `VALOR_RESPOSTA`.
+        Retorna um dict com `respondentes`, `total_respostas` e as tuplas
+        (percentual, total) `concordancia`, `discordancia` e `desconhecimento`.
+        """
+        df = self.df
+        filtros = self._filtros_curso()
+
+        ids = df["ID_PESQUISA"]
+        posicoes = DataLoader.indice(df).posicoes(filtros)
+        if posicoes is not None:
+            ids = ids.iloc[posicoes]
+        respondentes = ids.nunique()
+
+        contagens = self._cubo().contagem_por("VALOR_RESPOSTA", filtros)
+        total_respostas = int(contagens.sum())
+
+        metricas = {"respondentes": respondentes, "total_respostas": total_respostas}
+        for nome, valor in (("concordancia", 1), ("discordancia", -1), ("desconhecimento", 0)):
+            quantidade = contagens.get(valor, 0)
+            if total_respostas == 0:
+                metricas[nome] = (0, 0)
+            else:
+                metricas[nome] = ((quantidade / total_respostas) * 100, quantidade)
+
+        return metricas
+
     def get_total_respondentes_filtrado(self) -> int:
         """Retorna número de respondentes únicos no DataFrame filtrado."""
-        df = self.df_curso_filtrado_selecionado()
-        if df.empty:
-            return 0
-        return df["ID_PESQUISA"].nunique()
+        return self.metricas_filtradas()["respondentes"]
     
     def get_total_respostas_filtrado(self) -> int:
         """Retorna o total de linhas/respostas no DataFrame filtrado."""
-        df = self.df_curso_filtrado_selecionado()
-        return len(df)
+        return self._cubo().total(self._filtros_curso())
 
     def get_concordancia_filtrado(self):
         """Calcula porcentagem e total de concordância no conjunto filtrado.
 
         Retorna (percentual, total_concordo). Se vazio, retorna (0, 0).
         """
-        df = self.df_curso_filtrado_selecionado()
-        total = len(df)
-
-        if total == 0:
-            return 0, 0
-
-        total_concordo = df["VALOR_RESPOSTA"].eq(1).sum()
-        pct = (total_concordo / total) * 100
-
-        return pct, total_concordo
+        return self.metricas_filtradas()["concordancia"]
 
     def get_discordancia_filtrado(self):
         """Calcula porcentagem e total de discordância no conjunto filtrado.
 
         Retorna (percentual, total_discordo). Se vazio, retorna (0, 0).
         """
-        df = self.df_curso_filtrado_selecionado()
-        total = len(df)
-
-        if total == 0:
-            return 0, 0
-
-        total_discordo = df["VALOR_RESPOSTA"].eq(-1).sum()
-        pct = (total_discordo / total) * 100
-
-        return pct, total_discordo
+        return self.metricas_filtradas()["discordancia"]
 
     def get_desconhecimento_filtrado(self):
         """Calcula porcentagem e total de desconhecimento no conjunto filtrado.
 
         Retorna (percentual, total_desconheco). Se vazio, retorna (0, 0).
         """
-        df = self.df_curso_filtrado_selecionado()
-        total = len(df)
-
-        if total == 0:
-            return 0, 0
-
-        total_desconheco = df["VALOR_RESPOSTA"].eq(0).sum()
-        pct = (total_desconheco / total) * 100
-
-        return pct, total_desconheco
+        return self.metricas_filtradas()["desconhecimento"]
 
+    @CACHE_FIGURAS.memoizado('curso_value', 'setor_value', 'dimensao_value')
     def grafico_radar_dimensao_curso(self):
         """Gera gráfico radar comparando médias do Curso vs Setor por ID_PERGUNTA.
 
@@ -0,0 +1,211 @@
+import io
+import itertools
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Linhas convertidas por bloco da exportação.
+TAMANHO_BLOCO = int(os.environ.get("DASHBOARD_EXPORTACAO_BLOCO") or 50_000)
+
+# Bytes lidos por vez do arquivo XLSX montado em disco.
+TAMANHO_LEITURA = 1 << 20
+
+# Máximo de linhas de dados por planilha do XLSX (o limite do Excel menos o cabeçalho).
+MAX_LINHAS_PLANILHA = 1_048_575
+
+# Formato -> (extensão, tipo MIME).
+FORMATOS = {
+    "csv": ("csv", "text/csv"),
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+    "xlsx": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+# Avaliação -> filtro da query string da API -> (atributo do serviço, valor padrão).
+# As opções aceitas por filtro ficam em `api.MetricsAPI.AVALIACOES`.
+FILTROS_CONSULTA = {
+    "institucional": {
+        "eixo": ("eixos_value", None),
+        "pergunta": ("perguntas_value", None),
+        "dimensao": ("dimensao_value", None),
+    },
+    "cursos": {
+        "curso": ("curso_value", "Todos"),
+        "setor": ("setor_value", "Todos"),
+        "dimensao": ("dimensao_value", None),
+    },
+    "disciplinas": {
+        "tipo": ("tipo_disciplina_value", "Presencial"),
+        "disciplina": ("disciplina_value", "Todas"),
+        "curso": ("curso_value", "Todas"),
+        "setor": ("setor_value", "Todas"),
+        "dimensao": ("dimensao_value", None),
+    },
+}
+
+# Valor da query string que representa um filtro nulo (linhas sem valor na coluna, ver `filtro_nulo`).
+VALOR_NULO = "__nulo__"
+
+
+def parametros_do_servico(avaliacao: str, servico) -> dict:
+    """Parâmetros da query string (parâmetro -> lista de valores) com os filtros atuais de `servico`.
+
+    Filtros no valor padrão ficam de fora; é o inverso de `MetricsAPI._aplicar_filtros`.
+    """
+    parametros = {}
+    for nome, (atributo, padrao) in FILTROS_CONSULTA[avaliacao].items():
+        valor = getattr(servico, atributo, None)
+        valores = [valor] if not isinstance(valor, (list, tuple)) else list(valor)
+        valores = [
+            VALOR_NULO if pd.isna(v) else str(v)
+            for v in valores if v is not None and v != "" and v not in ("Todos", "Todas")
+        ]
+        if valores and valores != [padrao]:
+            parametros[nome] = valores
+    return parametros
+
+
+class _Buffer(io.RawIOBase):
+    """Destino de escrita que acumula os bytes até `esvaziar` (usado pelo ParquetWriter)."""
+
+    def __init__(self):
+        self._partes = []
+        self._posicao = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, dados) -> int:
+        self._partes.append(bytes(dados))
+        self._posicao += len(dados)
+        return len(dados)
+
+    def tell(self) -> int:
+        return self._posicao
+
+    def esvaziar(self) -> bytes:
+        dados = b"".join(self._partes)
+        self._partes.clear()
+        return dados
+
+
+class DataExporter:
+    """Exporta as linhas filtradas de um DataFrame em blocos (CSV, Parquet ou XLSX).
+
+    As linhas vêm das `posicoes` de um filtro (ver `FilterIndex.posicoes`;
+    None: todas) e são convertidas `TAMANHO_BLOCO` por vez: cada formato é um
+    gerador de pedaços de bytes, então nem o recorte filtrado nem o arquivo
+    inteiro ficam em memória. O CSV e o Parquet saem direto dos blocos; o XLSX
+    (requer openpyxl) é montado em um arquivo temporário, linha a linha, e lido
+    em pedaços.
+    """
+
+    def __init__(self, df: pd.DataFrame, posicoes: np.ndarray | None = None, colunas: list | None = None):
+        self.df = df if colunas is None else df[[c for c in colunas if c in df.columns]]
+        self.posicoes = posicoes
+
+    def __len__(self) -> int:
+        return len(self.df) if self.posicoes is None else len(self.posicoes)
+
+    @staticmethod
+    def disponivel(formato: str) -> bool:
+        """Indica se `formato` pode ser gerado neste ambiente (o XLSX requer openpyxl)."""
+        if formato != "xlsx":
+            return formato in FORMATOS
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def blocos(self, tamanho: int = TAMANHO_BLOCO):
+        """Gera as linhas filtradas em DataFrames de até `tamanho` linhas, na ordem original."""
+        for inicio in range(0, len(self), tamanho):
+            if self.posicoes is None:
+                yield self.df.iloc[inicio:inicio + tamanho]
+            else:
+                yield self.df.iloc[self.posicoes[inicio:inicio + tamanho]]
+
+    def exportar(self, formato: str):
+        """Retorna o gerador de pedaços de bytes do arquivo em `formato`.
+
+        Gera ValueError para formato desconhecido ou indisponível.
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato desconhecido: {formato!r} (use {', '.join(FORMATOS)})")
+        if not self.disponivel(formato):
+            raise ValueError("A exportação em .xlsx requer o pacote openpyxl (pip install openpyxl).")
+        return getattr(self, formato)()
+
+    def csv(self):
+        """Gera o CSV (UTF-8 com BOM, para o Excel reconhecer a acentuação) em pedaços."""
+        yield "\ufeff".encode("utf-8")
+        yield self.df.iloc[:0].to_csv(index=False).encode("utf-8")
+        for bloco in self.blocos():
+            yield bloco.to_csv(index=False, header=False).encode("utf-8")
+
+    @staticmethod
+    def _schema(bloco: pd.DataFrame) -> pa.Schema:
+        """Schema Parquet inferido dos valores de `bloco`; colunas sem nenhum valor viram texto."""
+        schema = pa.Schema.from_pandas(bloco, preserve_index=False)
+        for i, campo in enumerate(schema):
+            if pa.types.is_null(campo.type):
+                schema = schema.set(i, campo.with_type(pa.string()))
+        return schema
+
+    def parquet(self):
+        """Gera o Parquet em pedaços: um row group por bloco, escrito assim que convertido.
+
+        O schema vem do primeiro bloco: um recorte vazio não diz o tipo das
+        colunas object (texto, números...), que o pyarrow infere dos valores.
+        """
+        destino = _Buffer()
+        blocos = self.blocos()
+        primeiro = next(blocos, self.df.iloc[:0])
+        schema = self._schema(primeiro)
+        with pq.ParquetWriter(destino, schema, compression="zstd") as escritor:
+            for bloco in itertools.chain([primeiro], blocos):
+                escritor.write_table(pa.Table.from_pandas(bloco, schema=schema, preserve_index=False))
+                if dados := destino.esvaziar():
+                    yield dados
+        yield destino.esvaziar()
+
+    def xlsx(self):
+        """Gera o XLSX em pedaços, com uma planilha nova a cada `MAX_LINHAS_PLANILHA` linhas."""
+        from openpyxl import Workbook
+
+        livro = Workbook(write_only=True)
+        colunas = [str(c) for c in self.df.columns]
+        planilha, linhas = None, MAX_LINHAS_PLANILHA
+
+        for bloco in self.blocos():
+            # Valores ausentes viram células vazias; numpy -> tipos Python.
+            valores = bloco.astype(object).where(bloco.notna(), None).itertuples(index=False, name=None)
+            for linha in valores:
+                if linhas == MAX_LINHAS_PLANILHA:
+                    planilha = livro.create_sheet(f"dados_{len(livro.worksheets) + 1}" if livro.worksheets else "dados")
+                    planilha.append(colunas)
+                    linhas = 0
+                planilha.append(linha)
+                linhas += 1
+        if planilha is None:
+            livro.create_sheet("dados").append(colunas)
+
+        with tempfile.TemporaryFile() as arquivo:
+            livro.save(arquivo)
+            arquivo.seek(0)
+            while dados := arquivo.read(TAMANHO_LEITURA):
+                yield dados
+
+    @staticmethod
+    def nome_arquivo(base: str, formato: str) -> str:
+        """Retorna `base` com a extensão de `formato`."""
+        return f"{base}.{FORMATOS[formato][0]}"
+
+    @staticmethod
+    def tipo_mime(formato: str) -> str:
+        """Retorna o tipo MIME de `formato`."""
+        return FORMATOS[formato][1]
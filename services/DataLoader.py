@@ -1,4 +1,21 @@
-import pandas as pd 
+import hashlib
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from services.FilterIndex import FilterIndex
+from services.OptionIndex import OptionIndex
+from services.PeriodComparison import PeriodComparison
+from services.RespondentSentiment import RespondentSentiment
+from services.ResponseCube import ResponseCube, filtro_nulo, mascara_filtros
 
 PATH_TO_DIR = "data/processed/"
 PATH_DADOS_INSTITUCIONAL = PATH_TO_DIR + "Institucional2025/processed_Institucional_2025.csv"
@@ -6,27 +23,850 @@ PATH_DADOS_DISCIPLINAS_PRESENCIAL = PATH_TO_DIR + "Presencial2025/processed_pres
 PATH_DADOS_DISCIPLINAS_EAD = PATH_TO_DIR + "EAD2025/processed_ead_2025.csv"
 PATH_DADOS_CURSOS = PATH_TO_DIR + "Cursos2024/processed_cursos_2024.csv"
 
+# Armazenamento particionado por tipo de pesquisa e período:
+# data/store/<tipo>/periodo=<periodo>/ ('2025/2' vira 'periodo=2025-2'). Cada
+# publicação é uma versão imutável em versoes/<id>/dados.parquet (id: início do
+# SHA-256 do Parquet) e o arquivo ATUAL da partição guarda o id publicado.
+# Arquivos gerados depois a partir de uma versão (ex.: tabelas de comparação)
+# ficam em derivados/<id>/, fora da pasta imutável da versão.
+# Partições antigas, sem ATUAL, têm o dados.parquet direto na pasta.
+STORE_DIR = "data/store"
+ARQUIVO_VERSAO_ATUAL = "ATUAL"
+
+# Segundos que uma versão substituída é mantida antes de ser apagada (sessões
+# e outros processos ainda podem estar lendo) e intervalo entre as coletas.
+RETENCAO_VERSOES = int(os.environ.get("DASHBOARD_RETENCAO_VERSOES") or 3600)
+INTERVALO_COLETA = 60
+
+# Arquivo único (legado) de cada tipo e o período a que ele corresponde.
+PATHS_POR_TIPO = {
+    "institucional": PATH_DADOS_INSTITUCIONAL,
+    "presencial": PATH_DADOS_DISCIPLINAS_PRESENCIAL,
+    "ead": PATH_DADOS_DISCIPLINAS_EAD,
+    "cursos": PATH_DADOS_CURSOS,
+}
+PERIODOS_LEGADO = {
+    "institucional": "2025",
+    "presencial": "2025/2",
+    "ead": "2025/2",
+    "cursos": "2024",
+}
+
+# Quantos períodos de cada tipo ficam carregados ao mesmo tempo no registro.
+MAX_PERIODOS_CARREGADOS = int(os.environ.get("DASHBOARD_MAX_PERIODOS") or 3)
+
+# Ordem das linhas em cada partição: filtros por essas colunas em `load_periodo`
+# descartam row groups inteiros pelas estatísticas do Parquet.
+COLUNAS_ORDENACAO_STORE = ["SETOR_CURSO", "CURSO"]
+
+# Colunas comuns aos quatro conjuntos processados.
+_SCHEMA_COMUM = {
+    "EIXO_NUM": "int8",
+    "EIXO_NOME": "category",
+    "DIMENSAO_NUM": "int8",
+    "DIMENSAO_NOME": "category",
+    "ID_PESQUISA": "int32",
+    "ID_QUESTIONARIO": "int32",
+    "QUESTIONARIO": "category",
+    "ID_PERGUNTA": "int32",
+    "PERGUNTA": "category",
+    "RESPOSTA": "category",
+    "SITUACAO": "category",
+    "Tipo_Perg": "category",
+    "Ordem": "float32",
+}
+
+_SCHEMA_DISCIPLINAS = {
+    **_SCHEMA_COMUM,
+    "VALOR_RESPOSTA": "int8",
+    "COD_DISCIPLINA": "category",
+    "NOME_DISCIPLINA": "category",
+    "CURSO": "category",
+    "SETOR_CURSO": "category",
+    "DEPARTAMENTO": "category",
+    "MODALIDADE": "category",
+    "LOCAL": "category",
+    "MULTIPLA_ESCOLHA": "category",
+    "CL_PERGUNTA": "category",
+    "TEMP": "category",
+}
+
+# Schema declarado de cada dataset processado (coluna -> dtype compacto).
+SCHEMAS = {
+    PATH_DADOS_INSTITUCIONAL: {
+        **_SCHEMA_COMUM,
+        "LOTACAO": "category",
+        "SIGLA_LOTACAO": "category",
+        "UNIDADE GESTORA": "category",
+    },
+    PATH_DADOS_DISCIPLINAS_PRESENCIAL: _SCHEMA_DISCIPLINAS,
+    PATH_DADOS_DISCIPLINAS_EAD: _SCHEMA_DISCIPLINAS,
+    PATH_DADOS_CURSOS: {
+        **_SCHEMA_COMUM,
+        "VALOR_RESPOSTA": "int8",
+        "CURSO": "category",
+        "SETOR_CURSO": "category",
+        "MULTIPLA_ESCOLHA": "category",
+        "CL_PERGUNTA": "category",
+    },
+}
+
+
+class DatasetRegistry:
+    """Registro de datasets compartilhado por todo o processo.
+
+    Cada arquivo é lido uma única vez e o mesmo DataFrame é devolvido para
+    todas as sessões e serviços. Os DataFrames devolvidos devem ser tratados
+    como somente leitura. A entrada é invalidada quando o `mtime`/tamanho do
+    arquivo muda e o conteúdo (hash SHA-256) também mudou. O hash vira a
+    versão do DataFrame (ver `DataLoader.versao`), e o arquivo de origem de
+    cada DataFrame vivo fica registrado (ver `em_uso`).
+    """
+
+    # Leituras repetidas quando o arquivo muda durante a leitura (cópia em andamento).
+    TENTATIVAS_LEITURA = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._locks_por_chave = {}
+        self._entradas = {}
+        self._estatisticas = {}
+        self._derivados = {}
+        self._origens = {}
+
+    @staticmethod
+    def _assinatura(path: str) -> tuple:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _hash_arquivo(path: str) -> str:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for bloco in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(bloco)
+        return sha.hexdigest()
+
+    def _lock_da_chave(self, chave) -> threading.Lock:
+        with self._lock:
+            if chave not in self._locks_por_chave:
+                self._locks_por_chave[chave] = threading.Lock()
+                self._estatisticas[chave] = {
+                    "hits": 0,
+                    "misses": 0,
+                    "loads": 0,
+                    "load_time": 0.0,
+                }
+            return self._locks_por_chave[chave]
+
+    def obter(self, path: str, leitor, chave=None) -> pd.DataFrame:
+        """Retorna o DataFrame de `path`, lendo com `leitor(path)` só quando necessário.
+
+        `chave` identifica a entrada no registro (padrão: o próprio `path`).
+        """
+        chave = path if chave is None else chave
+        lock = self._lock_da_chave(chave)
+        estatisticas = self._estatisticas[chave]
+
+        with lock:
+            assinatura = self._assinatura(path)
+            entrada = self._entradas.get(chave)
+
+            if entrada is not None and entrada["assinatura"] == assinatura:
+                estatisticas["hits"] += 1
+                entrada["uso"] = time.monotonic()
+                return entrada["df"]
+
+            if entrada is not None:
+                # O arquivo foi tocado: só recarrega se o conteúdo mudou de fato.
+                digest = self._hash_arquivo(path)
+                if digest == entrada["hash"]:
+                    entrada["assinatura"] = assinatura
+                    estatisticas["hits"] += 1
+                    entrada["uso"] = time.monotonic()
+                    return entrada["df"]
+            else:
+                digest = None
+
+            estatisticas["misses"] += 1
+            inicio = time.perf_counter()
+            for _ in range(self.TENTATIVAS_LEITURA):
+                df = leitor(path)
+                lida = assinatura
+                assinatura = self._assinatura(path)
+                if assinatura == lida:
+                    break
+                # O arquivo foi reescrito durante a leitura: a leitura pode estar incompleta.
+                digest = None
+            else:
+                raise RuntimeError(f"{path} mudou durante todas as {self.TENTATIVAS_LEITURA} leituras")
+            estatisticas["load_time"] += time.perf_counter() - inicio
+            estatisticas["loads"] += 1
+
+            digest = digest if digest is not None else self._hash_arquivo(path)
+            self._entradas[chave] = {
+                "assinatura": assinatura,
+                "hash": digest,
+                "df": df,
+                "uso": time.monotonic(),
+            }
+
+        with self._lock:
+            self._origens[id(df)] = path
+            weakref.finalize(df, self._origens.pop, id(df), None)
+        self.derivado(df, "versao", lambda: digest[:16])
+        return df
+
+    def derivado(self, df: pd.DataFrame, nome: str, construtor):
+        """Retorna um artefato derivado de `df` (cubo, índice...), construindo-o uma vez.
+
+        Os derivados vivem enquanto o DataFrame existir: quando o registro troca
+        o DataFrame (arquivo alterado), os derivados antigos são descartados junto.
+        """
+        chave = id(df)
+        with self._lock:
+            derivados = self._derivados.get(chave)
+            if derivados is None:
+                derivados = self._derivados[chave] = {}
+                weakref.finalize(df, self._derivados.pop, chave, None)
+            if nome in derivados:
+                return derivados[nome]
+
+        valor = construtor()
+        with self._lock:
+            return derivados.setdefault(nome, valor)
+
+    def invalidar(self, chave=None):
+        """Remove uma entrada (ou todas, se `chave` for None) do registro."""
+        with self._lock:
+            if chave is None:
+                self._entradas.clear()
+                return
+
+            for existente in list(self._entradas):
+                if existente == chave or existente.startswith(f"{chave}["):
+                    del self._entradas[existente]
+
+    def descartar_prefixo(self, prefixo: str, exceto: str | None = None):
+        """Remove as entradas cujo nome começa com `prefixo` e não com `exceto`."""
+        with self._lock:
+            for chave in list(self._entradas):
+                if chave.startswith(prefixo) and not (exceto and chave.startswith(exceto)):
+                    del self._entradas[chave]
+
+    def em_uso(self) -> set:
+        """Retorna os arquivos de origem dos DataFrames ainda vivos no processo.
+
+        Inclui os que já saíram do registro mas continuam referenciados (ex.: por
+        serviços guardados em sessões).
+        """
+        with self._lock:
+            return set(self._origens.values())
+
+    def descartar_antigas(self, prefixo: str, manter: int):
+        """Mantém só as `manter` entradas usadas mais recentemente cujo nome começa com `prefixo`."""
+        with self._lock:
+            chaves = sorted(
+                (chave for chave in self._entradas if chave.startswith(prefixo)),
+                key=lambda chave: self._entradas[chave]["uso"],
+                reverse=True,
+            )
+            for chave in chaves[manter:]:
+                del self._entradas[chave]
+
+    def entradas(self) -> dict:
+        """Retorna um dicionário chave -> DataFrame com os datasets carregados."""
+        with self._lock:
+            return {chave: entrada["df"] for chave, entrada in self._entradas.items()}
+
+    def estatisticas(self) -> dict:
+        """Retorna contadores de hit/miss/carga por entrada e o total agregado."""
+        with self._lock:
+            por_chave = {chave: dict(valores) for chave, valores in self._estatisticas.items()}
+
+        total = {"hits": 0, "misses": 0, "loads": 0, "load_time": 0.0}
+        for valores in por_chave.values():
+            for nome in total:
+                total[nome] += valores[nome]
+
+        return {"total": total, "datasets": por_chave}
+
+
+_REGISTRY = DatasetRegistry()
+_VERSOES = itertools.count(1)
+_ULTIMA_COLETA = 0.0
+
+# Um lock por arquivo derivado gerado sob demanda (ver `DataLoader._lock_geracao`).
+_LOCK_GERACAO = threading.Lock()
+_LOCKS_GERACAO = {}
+
+
 class DataLoader:
-    def __init__(self): 
-        pass 
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def caminho_parquet(path: str) -> str:
+        """Retorna o caminho do arquivo Parquet correspondente a um CSV processado."""
+        return os.path.splitext(path)[0] + ".parquet"
+
+    @staticmethod
+    def caminho_cubo(path: str) -> str:
+        """Retorna o caminho do cubo de contagens persistido de um dataset processado."""
+        return os.path.splitext(path)[0] + "_cubo.parquet"
+
+    @staticmethod
+    def caminho_derivado(path: str, sufixo: str) -> str:
+        """Retorna onde guardar um arquivo gerado sob demanda a partir do dataset `path`.
+
+        O nome é o de `path` sem extensão mais `sufixo`. Para uma versão do
+        armazenamento (`versoes/<id>/dados.parquet`), fica em `derivados/<id>/`
+        na partição, pois a pasta da versão não muda depois de publicada (ver
+        `ativar_versao`); para os demais, ao lado de `path`.
+        """
+        pasta, nome = os.path.split(path)
+        versoes, versao = os.path.split(pasta)
+        nome = os.path.splitext(nome)[0] + sufixo
+        if os.path.basename(versoes) == "versoes":
+            return os.path.join(os.path.dirname(versoes), "derivados", versao, nome)
+        return os.path.join(pasta, nome)
+
+    @staticmethod
+    def _resolver_arquivo(path: str) -> str:
+        """Prefere o Parquet irmão do CSV quando ele existe e não é mais antigo que o CSV."""
+        if path.endswith(".parquet"):
+            return path
+
+        parquet = DataLoader.caminho_parquet(path)
+        if os.path.exists(parquet) and (
+            not os.path.exists(path) or os.path.getmtime(parquet) >= os.path.getmtime(path)
+        ):
+            return parquet
+
+        return path
+
+    @staticmethod
+    def aplicar_schema(df: pd.DataFrame, schema: dict | None) -> pd.DataFrame:
+        """Converte as colunas de `df` para os dtypes compactos declarados em `schema`.
+
+        Colunas textuais têm espaços nas pontas removidos antes de virarem
+        `category`. Colunas inteiras com valores ausentes usam o dtype anulável
+        equivalente (ex.: `Int8`). Colunas ausentes em `df` são ignoradas.
+        """
+        if not schema:
+            return df
+
+        for coluna, dtype in schema.items():
+            if coluna not in df.columns or df[coluna].dtype == dtype:
+                continue
+
+            serie = df[coluna]
+            if dtype == "category":
+                if serie.dtype == object:
+                    serie = serie.str.strip()
+                df[coluna] = serie.astype("category")
+            elif dtype.startswith("int") and serie.isna().any():
+                df[coluna] = serie.astype(dtype.capitalize())
+            else:
+                df[coluna] = serie.astype(dtype)
+
+        return df
 
     @staticmethod
-    def load_dados_institucional(path: str = PATH_DADOS_INSTITUCIONAL) -> pd.DataFrame:
-        df = pd.read_csv(path)
+    def _ler_arquivo(path: str, columns: list | None = None, schema: dict | None = None) -> pd.DataFrame:
+        if path.endswith(".parquet"):
+            df = pd.read_parquet(path, columns=columns)
+        else:
+            df = pd.read_csv(path, usecols=columns)
+        return DataLoader.aplicar_schema(df, schema)
+
+    @staticmethod
+    def _carregar(path: str, columns: list | None = None) -> pd.DataFrame:
+        """Lê o dataset (Parquet ou CSV) via registro, apenas com as colunas pedidas."""
+        arquivo = DataLoader._resolver_arquivo(path)
+        colunas = list(columns) if columns is not None else None
+        chave = arquivo if colunas is None else f"{arquivo}[{','.join(colunas)}]"
+        schema = SCHEMAS.get(path)
+
+        return _REGISTRY.obter(
+            arquivo,
+            lambda p: DataLoader._ler_arquivo(p, columns=colunas, schema=schema),
+            chave=chave,
+        )
+
+    @staticmethod
+    def load_dados_institucional(path: str = PATH_DADOS_INSTITUCIONAL, columns: list | None = None) -> pd.DataFrame:
+        df = DataLoader._carregar(path, columns)
         return df
-    
+
     @staticmethod
-    def load_dados_disciplinas_presencial(path: str = PATH_DADOS_DISCIPLINAS_PRESENCIAL) -> pd.DataFrame:
-        df = pd.read_csv(path)
+    def load_dados_disciplinas_presencial(path: str = PATH_DADOS_DISCIPLINAS_PRESENCIAL, columns: list | None = None) -> pd.DataFrame:
+        df = DataLoader._carregar(path, columns)
         return df
-    
+
     @staticmethod
-    def load_dados_disciplinas_EAD(path: str = PATH_DADOS_DISCIPLINAS_EAD) -> pd.DataFrame:
-        df = pd.read_csv(path)
+    def load_dados_disciplinas_EAD(path: str = PATH_DADOS_DISCIPLINAS_EAD, columns: list | None = None) -> pd.DataFrame:
+        df = DataLoader._carregar(path, columns)
         return df
-    
+
+    @staticmethod
+    def load_dados_curso(path: str = PATH_DADOS_CURSOS, columns: list | None = None) -> pd.DataFrame:
+        df = DataLoader._carregar(path, columns)
+        return df
+
     @staticmethod
-    def load_dados_curso(path: str = PATH_DADOS_CURSOS) -> pd.DataFrame: 
-        df = pd.read_csv(path)
-        return df 
-    
\ No newline at end of file
+    def pasta_periodo(tipo: str, periodo: str) -> str:
+        """Retorna a pasta da partição de `tipo` (ex.: 'presencial') para `periodo` (ex.: '2025/2')."""
+        return os.path.join(STORE_DIR, tipo, f"periodo={periodo.replace('/', '-')}")
+
+    @staticmethod
+    def versao_atual(tipo: str, periodo: str) -> str | None:
+        """Retorna o id da versão publicada da partição (arquivo ATUAL), ou None se não houver."""
+        try:
+            with open(os.path.join(DataLoader.pasta_periodo(tipo, periodo), ARQUIVO_VERSAO_ATUAL), encoding="utf-8") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def caminho_periodo(tipo: str, periodo: str, versao: str | None = None) -> str:
+        """Retorna o Parquet da partição `tipo`/`periodo` na `versao` (padrão: a publicada).
+
+        Sem versão publicada, retorna o `dados.parquet` direto na pasta da partição.
+        """
+        pasta = DataLoader.pasta_periodo(tipo, periodo)
+        versao = versao or DataLoader.versao_atual(tipo, periodo)
+        if versao is None:
+            return os.path.join(pasta, "dados.parquet")
+        return os.path.join(pasta, "versoes", versao, "dados.parquet")
+
+    @staticmethod
+    def periodos_disponiveis(tipo: str) -> list:
+        """Retorna os períodos com dados de `tipo`, do mais recente ao mais antigo.
+
+        Inclui as partições do armazenamento e o período do arquivo legado.
+        """
+        periodos = set()
+        pasta = os.path.join(STORE_DIR, tipo)
+        if os.path.isdir(pasta):
+            for nome in os.listdir(pasta):
+                periodo = nome.removeprefix("periodo=").replace("-", "/")
+                if nome.startswith("periodo=") and os.path.exists(DataLoader.caminho_periodo(tipo, periodo)):
+                    periodos.add(periodo)
+
+        legado = PATHS_POR_TIPO[tipo]
+        if os.path.exists(legado) or os.path.exists(DataLoader.caminho_parquet(legado)):
+            periodos.add(PERIODOS_LEGADO[tipo])
+
+        return sorted(periodos, reverse=True)
+
+    @staticmethod
+    def caminho_dados(tipo: str, periodo: str | None = None) -> str:
+        """Retorna o arquivo de onde `tipo`/`periodo` é lido: a partição ou o arquivo legado.
+
+        `periodo` None equivale ao período do arquivo legado (`PERIODOS_LEGADO`).
+        """
+        periodo = periodo or PERIODOS_LEGADO[tipo]
+        particao = DataLoader.caminho_periodo(tipo, periodo)
+        if os.path.exists(particao):
+            return particao
+        if periodo == PERIODOS_LEGADO[tipo]:
+            return PATHS_POR_TIPO[tipo]
+
+        raise FileNotFoundError(f"Não há dados de '{tipo}' para o período {periodo}")
+
+    @staticmethod
+    def periodo_anterior(tipo: str, periodo: str | None = None) -> str | None:
+        """Retorna o mesmo período do ano anterior ('2025/2' -> '2024/2'), se houver dados dele."""
+        periodo = periodo or PERIODOS_LEGADO[tipo]
+        ano, separador, semestre = periodo.partition("/")
+        anterior = f"{int(ano) - 1}{separador}{semestre}"
+        return anterior if anterior in DataLoader.periodos_disponiveis(tipo) else None
+
+    @staticmethod
+    def comparacao(tipo: str, periodo: str, chaves: list, coluna: str, valores: dict) -> PeriodComparison:
+        """Retorna as métricas pré-agregadas de `tipo`/`periodo` por `chaves` (ver `PeriodComparison`).
+
+        A tabela é gerada uma vez a partir do dataset do período e persistida
+        (ver `caminho_derivado`); depois disso, só ela é lida (e mantida no registro).
+        """
+        arquivo = DataLoader.caminho_dados(tipo, periodo)
+        destino = DataLoader.caminho_derivado(arquivo, f"_comparacao_{coluna}_{'_'.join(chaves)}.parquet".replace(" ", "-"))
+        origem = DataLoader._resolver_arquivo(arquivo)
+
+        def desatualizado() -> bool:
+            return not os.path.exists(destino) or os.path.getmtime(destino) < os.path.getmtime(origem)
+
+        if desatualizado():
+            # Uma geração por arquivo neste processo; entre processos, cada um
+            # grava no próprio temporário e a troca (`os.replace`) é atômica.
+            with DataLoader._lock_geracao(destino):
+                if desatualizado():
+                    colunas = list(dict.fromkeys(['ID_PESQUISA', coluna, *chaves]))
+                    comparacao = PeriodComparison.construir(
+                        DataLoader.load_periodo(tipo, periodo, columns=colunas), chaves, coluna, valores
+                    )
+                    os.makedirs(os.path.dirname(destino), exist_ok=True)
+                    descritor, temporario = tempfile.mkstemp(
+                        prefix=f".{os.path.basename(destino)}.", suffix=".tmp", dir=os.path.dirname(destino)
+                    )
+                    os.close(descritor)
+                    try:
+                        comparacao.salvar(temporario)
+                        os.replace(temporario, destino)
+                    except BaseException:
+                        os.remove(temporario)
+                        raise
+
+        tabela = _REGISTRY.obter(destino, pd.read_parquet)
+        return _REGISTRY.derivado(tabela, "comparacao", lambda: PeriodComparison.de_tabela(tabela))
+
+    @staticmethod
+    def _lock_geracao(destino: str) -> threading.Lock:
+        """Retorna o lock que serializa a geração de `destino` entre as threads do processo."""
+        with _LOCK_GERACAO:
+            return _LOCKS_GERACAO.setdefault(os.path.abspath(destino), threading.Lock())
+
+    @staticmethod
+    def _filtros_parquet(filtros: dict | None):
+        """Converte filtros no formato de `mascara_filtros` para o `filters` do pyarrow.
+
+        Com algum filtro nulo (ver `filtro_nulo`), retorna uma expressão do
+        pyarrow (`is_null`) em vez da lista de condições.
+        """
+        condicoes, nulos = [], []
+        for coluna, valor in (filtros or {}).items():
+            if valor is None:
+                continue
+            if isinstance(valor, (list, tuple, set)):
+                valores = [v for v in valor if not filtro_nulo(v)]
+                if len(valores) < len(valor):
+                    nulos.append((coluna, valores))
+                else:
+                    condicoes.append((coluna, "in", valores))
+            elif filtro_nulo(valor):
+                nulos.append((coluna, []))
+            else:
+                condicoes.append((coluna, "==", valor))
+        if not nulos:
+            return condicoes or None
+
+        expressao = pq.filters_to_expression(condicoes) if condicoes else None
+        for coluna, valores in nulos:
+            parte = pc.field(coluna).is_null(nan_is_null=True)
+            if valores:
+                parte = parte | pc.field(coluna).isin(valores)
+            expressao = parte if expressao is None else expressao & parte
+        return expressao
+
+    @staticmethod
+    def load_periodo(
+        tipo: str,
+        periodo: str | None = None,
+        columns: list | None = None,
+        filtros: dict | None = None,
+    ) -> pd.DataFrame:
+        """Carrega apenas a partição de `tipo` para `periodo`.
+
+        `filtros` (coluna -> valor ou lista, ex.: CURSO/SETOR_CURSO) são aplicados
+        na leitura do Parquet, descartando row groups pelas estatísticas. Sem
+        partição, o período do arquivo legado é lido do arquivo único. Cada tipo
+        mantém no máximo `MAX_PERIODOS_CARREGADOS` leituras no registro.
+        """
+        arquivo = DataLoader.caminho_dados(tipo, periodo)
+        if arquivo == PATHS_POR_TIPO[tipo]:
+            if not filtros:
+                return DataLoader._carregar(arquivo, columns)
+            arquivo = DataLoader._resolver_arquivo(arquivo)
+
+        colunas = list(columns) if columns is not None else None
+        schema = SCHEMAS.get(PATHS_POR_TIPO[tipo])
+        condicoes = DataLoader._filtros_parquet(filtros)
+
+        def ler(path):
+            if path.endswith(".parquet"):
+                df = pd.read_parquet(path, columns=colunas, filters=condicoes)
+                return DataLoader.aplicar_schema(df, schema)
+
+            df = DataLoader._ler_arquivo(path, schema=schema)
+            df = df[mascara_filtros(df, filtros)].reset_index(drop=True)
+            return df if colunas is None else df[colunas]
+
+        chave = arquivo
+        if colunas is not None:
+            chave += f"[{','.join(colunas)}]"
+        if condicoes is not None:
+            chave += f"[{condicoes}]"
+
+        df = _REGISTRY.obter(arquivo, ler, chave=chave)
+        if arquivo.startswith(STORE_DIR):
+            # Versões substituídas saem do registro; quem ainda as usa mantém o próprio DataFrame.
+            versoes = os.path.dirname(os.path.dirname(arquivo))
+            if os.path.basename(versoes) == "versoes":
+                _REGISTRY.descartar_prefixo(os.path.join(versoes, ""), exceto=os.path.dirname(arquivo))
+            _REGISTRY.descartar_antigas(os.path.join(STORE_DIR, tipo, ""), MAX_PERIODOS_CARREGADOS)
+            DataLoader._coletar_periodicamente()
+        return df
+
+    @staticmethod
+    def exportar_periodo(path: str, tipo: str, periodo: str) -> str:
+        """Publica um dataset processado como a partição `tipo`/`periodo` do armazenamento.
+
+        As linhas são ordenadas por setor/curso para que os filtros de
+        `load_periodo` descartem row groups inteiros. O cubo da partição é
+        gerado junto. Retorna o caminho da versão publicada.
+        """
+        return DataLoader.publicar_periodo(pd.read_csv(path), tipo, periodo)
+
+    @staticmethod
+    def publicar_periodo(df: pd.DataFrame, tipo: str, periodo: str) -> str:
+        """Grava `df` (colunas dos processados) como a partição `tipo`/`periodo`.
+
+        Aplica o schema do tipo, descarta colunas repetidas (`X.1`), ordena e
+        publica o resultado como uma nova versão (ver `ativar_versao`).
+        Retorna o caminho do Parquet publicado.
+        """
+        df = DataLoader.aplicar_schema(df, SCHEMAS.get(PATHS_POR_TIPO[tipo]))
+        df = df.loc[:, ~df.columns.str.contains(r"\.\d+$")]
+        ordenacao = [c for c in COLUNAS_ORDENACAO_STORE if c in df.columns]
+        if ordenacao:
+            df = df.sort_values(ordenacao, kind="stable").reset_index(drop=True)
+
+        pasta = DataLoader.preparar_versao(tipo, periodo)
+        arquivo = os.path.join(pasta, "dados.parquet")
+        df.to_parquet(arquivo, engine="pyarrow", compression="zstd", index=False, row_group_size=100_000)
+        ResponseCube.construir(df).salvar(DataLoader.caminho_cubo(arquivo))
+        return DataLoader.ativar_versao(tipo, periodo, pasta)
+
+    @staticmethod
+    def preparar_versao(tipo: str, periodo: str) -> str:
+        """Cria a pasta temporária de uma nova versão da partição (ver `ativar_versao`)."""
+        versoes = os.path.join(DataLoader.pasta_periodo(tipo, periodo), "versoes")
+        os.makedirs(versoes, exist_ok=True)
+        return tempfile.mkdtemp(prefix=".nova-", dir=versoes)
+
+    @staticmethod
+    def ativar_versao(tipo: str, periodo: str, pasta: str) -> str:
+        """Publica a versão montada em `pasta` (com `dados.parquet` e o cubo).
+
+        A pasta é renomeada para o id do conteúdo e o ponteiro ATUAL é trocado
+        de uma vez (`os.replace`): quem lê vê a versão anterior ou a nova,
+        nunca uma parcial. Conteúdo igual a uma versão existente reaproveita
+        essa versão. Retorna o caminho do Parquet publicado.
+        """
+        particao = DataLoader.pasta_periodo(tipo, periodo)
+        versao = DatasetRegistry._hash_arquivo(os.path.join(pasta, "dados.parquet"))[:16]
+        destino = os.path.join(particao, "versoes", versao)
+        if os.path.isdir(destino):
+            shutil.rmtree(pasta)
+        else:
+            os.rename(pasta, destino)
+
+        anterior = DataLoader.versao_atual(tipo, periodo)
+        ponteiro = os.path.join(particao, ARQUIVO_VERSAO_ATUAL)
+        with open(f"{ponteiro}.tmp", "w", encoding="utf-8") as f:
+            f.write(versao)
+        os.replace(f"{ponteiro}.tmp", ponteiro)
+
+        # O mtime da versão substituída marca o início da retenção (ver `coletar_versoes`).
+        if anterior and anterior != versao and os.path.isdir(os.path.join(particao, "versoes", anterior)):
+            os.utime(os.path.join(particao, "versoes", anterior))
+
+        DataLoader.coletar_versoes(tipo, periodo)
+        return os.path.join(destino, "dados.parquet")
+
+    @staticmethod
+    def coletar_versoes(tipo: str | None = None, periodo: str | None = None, retencao: int = RETENCAO_VERSOES) -> list:
+        """Apaga as versões substituídas há mais de `retencao` segundos e que não estão em uso.
+
+        Vale para uma partição, as de um `tipo` ou todas. Uma versão cujo
+        DataFrame ainda está vivo neste processo (sessões abertas) é mantida.
+        Pastas temporárias abandonadas seguem a mesma retenção. Os derivados
+        (`caminho_derivado`) de versões que não existem mais também são
+        apagados. Retorna as pastas apagadas.
+        """
+        if tipo is not None and periodo is not None:
+            particoes = [DataLoader.pasta_periodo(tipo, periodo)]
+        else:
+            if tipo is not None:
+                raizes = [os.path.join(STORE_DIR, tipo)]
+            elif os.path.isdir(STORE_DIR):
+                raizes = [os.path.join(STORE_DIR, nome) for nome in os.listdir(STORE_DIR)]
+            else:
+                raizes = []
+            particoes = [
+                os.path.join(raiz, nome)
+                for raiz in raizes if os.path.isdir(raiz)
+                for nome in os.listdir(raiz) if nome.startswith("periodo=")
+            ]
+
+        em_uso = {os.path.dirname(os.path.abspath(p)) for p in _REGISTRY.em_uso()}
+        limite = time.time() - retencao
+        apagadas = []
+        for particao in particoes:
+            versoes = os.path.join(particao, "versoes")
+            if not os.path.isdir(versoes):
+                continue
+            try:
+                with open(os.path.join(particao, ARQUIVO_VERSAO_ATUAL), encoding="utf-8") as f:
+                    atual = f.read().strip()
+            except FileNotFoundError:
+                atual = None
+
+            for nome in os.listdir(versoes):
+                pasta = os.path.join(versoes, nome)
+                if nome == atual or os.path.abspath(pasta) in em_uso or os.path.getmtime(pasta) > limite:
+                    continue
+                shutil.rmtree(pasta, ignore_errors=True)
+                apagadas.append(pasta)
+
+            derivados = os.path.join(particao, "derivados")
+            if os.path.isdir(derivados):
+                for nome in os.listdir(derivados):
+                    if not os.path.isdir(os.path.join(versoes, nome)):
+                        shutil.rmtree(os.path.join(derivados, nome), ignore_errors=True)
+                        apagadas.append(os.path.join(derivados, nome))
+        return apagadas
+
+    @staticmethod
+    def _coletar_periodicamente():
+        """Roda `coletar_versoes` em todo o armazenamento no máximo a cada `INTERVALO_COLETA` segundos."""
+        global _ULTIMA_COLETA
+        agora = time.monotonic()
+        if agora - _ULTIMA_COLETA < INTERVALO_COLETA:
+            return
+        _ULTIMA_COLETA = agora
+        DataLoader.coletar_versoes()
+
+    @staticmethod
+    def exportar_parquet(path: str) -> str:
+        """Converte um CSV processado para Parquet (colunar, zstd) ao lado do original.
+
+        Retorna o caminho do arquivo Parquet gerado.
+        """
+        df = DataLoader.aplicar_schema(pd.read_csv(path), SCHEMAS.get(path))
+        destino = DataLoader.caminho_parquet(path)
+        df.to_parquet(destino, engine="pyarrow", compression="zstd", index=False)
+        return destino
+
+    @staticmethod
+    def cubo(df: pd.DataFrame, path: str | None = None) -> ResponseCube:
+        """Retorna o cubo de contagens de `df`, construído uma única vez por DataFrame.
+
+        Quando `path` é informado e o cubo persistido (`caminho_cubo(path)`) não é
+        mais antigo que o dataset, ele é lido em vez de agregar `df`.
+        """
+        def construir():
+            if path is not None:
+                arquivo_cubo = DataLoader.caminho_cubo(path)
+                arquivo = DataLoader._resolver_arquivo(path)
+                if os.path.exists(arquivo_cubo) and (
+                    not os.path.exists(arquivo) or os.path.getmtime(arquivo_cubo) >= os.path.getmtime(arquivo)
+                ):
+                    return ResponseCube.ler(arquivo_cubo)
+            return ResponseCube.construir(df)
+
+        return _REGISTRY.derivado(df, "cubo", construir)
+
+    @staticmethod
+    def versao(df: pd.DataFrame) -> str:
+        """Retorna o id do conteúdo de `df`, usado nas chaves de todos os caches.
+
+        DataFrames lidos pelo registro recebem o início do SHA-256 do arquivo:
+        o mesmo conteúdo tem sempre a mesma versão, e um conteúdo novo nunca
+        reaproveita resultados do anterior. Os demais recebem um número único.
+        """
+        return _REGISTRY.derivado(df, "versao", lambda: f"local-{next(_VERSOES)}")
+
+    @staticmethod
+    def indice(df: pd.DataFrame) -> FilterIndex:
+        """Retorna o índice invertido das dimensões de filtro de `df`, construído uma única vez."""
+        return _REGISTRY.derivado(df, "indice", lambda: FilterIndex.construir(df))
+
+    @staticmethod
+    def opcoes(df: pd.DataFrame, colunas: list, formato: str) -> OptionIndex:
+        """Retorna o índice das combinações de `colunas` de `df` (ver `OptionIndex`), construído uma única vez."""
+        return _REGISTRY.derivado(
+            df, ("opcoes", tuple(colunas), formato), lambda: OptionIndex.construir(df, colunas, formato)
+        )
+
+    @staticmethod
+    def sentimento(df: pd.DataFrame) -> RespondentSentiment:
+        """Retorna os respondentes e valores codificados de `df` (ver `RespondentSentiment`), uma única vez."""
+        return _REGISTRY.derivado(df, "sentimento", lambda: RespondentSentiment.construir(df))
+
+    @staticmethod
+    def exportar_cubo(path: str) -> str:
+        """Agrega o dataset processado completo e persiste o cubo de contagens.
+
+        Retorna o caminho do cubo gerado.
+        """
+        arquivo = DataLoader._resolver_arquivo(path)
+        df = DataLoader._ler_arquivo(arquivo, schema=SCHEMAS.get(path))
+        destino = DataLoader.caminho_cubo(path)
+        ResponseCube.construir(df).salvar(destino)
+        return destino
+
+    @staticmethod
+    def atualizar_cubo(path: str, novas: pd.DataFrame) -> str | None:
+        """Soma as contagens de `novas` (respostas recém-ingeridas) ao cubo persistido.
+
+        Retorna o caminho do cubo atualizado, ou None se ainda não houver cubo
+        persistido para o dataset (ver `exportar_cubo`).
+        """
+        destino = DataLoader.caminho_cubo(path)
+        if not os.path.exists(destino):
+            return None
+
+        novas = DataLoader.aplicar_schema(novas.loc[:, ~novas.columns.duplicated()].copy(), SCHEMAS.get(path))
+        cubo = ResponseCube.ler(destino).somar(ResponseCube.construir(novas))
+        temporario = f"{destino}.tmp"
+        cubo.salvar(temporario)
+        os.replace(temporario, destino)
+        return destino
+
+    @staticmethod
+    def estatisticas_cache() -> dict:
+        """Retorna os contadores de hit/miss/tempo de carga do registro de datasets."""
+        return _REGISTRY.estatisticas()
+
+    @staticmethod
+    def relatorio_memoria() -> pd.DataFrame:
+        """Retorna o uso de memória (MB, profundo) de cada dataset carregado no registro."""
+        linhas = [
+            {
+                "dataset": chave,
+                "linhas": len(df),
+                "colunas": df.shape[1],
+                "memoria_mb": df.memory_usage(deep=True).sum() / 1024 ** 2,
+            }
+            for chave, df in _REGISTRY.entradas().items()
+        ]
+        return pd.DataFrame(linhas, columns=["dataset", "linhas", "colunas", "memoria_mb"])
+
+    @staticmethod
+    def limpar_cache(path: str | None = None):
+        """Descarta um dataset (ou todos) do registro compartilhado."""
+        if path is None:
+            _REGISTRY.invalidar()
+            return
+
+        _REGISTRY.invalidar(path)
+        _REGISTRY.invalidar(DataLoader.caminho_parquet(path))
+
+
+PATHS_DADOS_PROCESSADOS = [
+    PATH_DADOS_INSTITUCIONAL,
+    PATH_DADOS_DISCIPLINAS_PRESENCIAL,
+    PATH_DADOS_DISCIPLINAS_EAD,
+    PATH_DADOS_CURSOS,
+]
+
+
+if __name__ == "__main__":
+    # python -m services.DataLoader -> gera os .parquet e os cubos dos datasets processados
+    for path in PATHS_DADOS_PROCESSADOS:
+        inicio = time.perf_counter()
+        destino = DataLoader.exportar_parquet(path)
+        destino_cubo = DataLoader.exportar_cubo(path)
+        print(f"{path} -> {destino}, {destino_cubo} ({time.perf_counter() - inicio:.2f}s)")
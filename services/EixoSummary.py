@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+COLOR_MAP = {
+    'Concordo': '#2ecc71',
+    'Discordo': '#e74c3c',
+    'Desconheço': '#95a5a6'
+}
+
+
+class EixoSummary:
+    """Resumo percentual das respostas por eixo, comum aos três serviços."""
+
+    @staticmethod
+    def resumir(df: pd.DataFrame, coluna: str = 'EIXO_NOME') -> pd.DataFrame:
+        """Calcula contagem, percentual e rótulo por (`coluna`, RESPOSTA).
+
+        `df` pode estar no nível de resposta (uma linha por resposta) ou já
+        agregado com a coluna `COUNT` (ex.: `ResponseCube.contagens_por`).
+        Retorna as colunas `coluna`, RESPOSTA, COUNT, PERCENT e LABEL, ordenadas
+        por `coluna`.
+        """
+        if 'COUNT' in df.columns:
+            resumo = df[[coluna, 'RESPOSTA', 'COUNT']]
+        else:
+            resumo = df.groupby([coluna, 'RESPOSTA'], observed=True).size().reset_index(name='COUNT')
+
+        total = resumo.groupby(coluna, observed=True)['COUNT'].transform('sum')
+        percent = (resumo['COUNT'].to_numpy() / total.to_numpy()) * 100
+        contagem = resumo['COUNT'].to_numpy()
+
+        resumo = resumo.assign(
+            PERCENT=percent,
+            LABEL=np.char.add(
+                np.char.add(np.char.mod('%.1f%% (', percent), contagem.astype(str)), ')'
+            ),
+        )
+        return resumo.sort_values(coluna, kind='stable')
+
+    @staticmethod
+    def grafico(resumo: pd.DataFrame, coluna: str = 'EIXO_NOME'):
+        """Monta o gráfico de barras empilhadas (0-100%) a partir de `resumir`."""
+        fig_bar = px.bar(
+            resumo,
+            x=coluna,
+            y="PERCENT",
+            color="RESPOSTA",
+            color_discrete_map=COLOR_MAP,
+            barmode='stack',
+            text="LABEL",
+            height=500
+        )
+
+        fig_bar.update_traces(textposition="inside", insidetextanchor="middle")
+
+        fig_bar.update_layout(
+            title='Distribuição de respostas por eixos',
+            xaxis_title="Eixo",
+            yaxis_title="% das Respostas",
+            legend_title="",
+            margin=dict(l=10, r=10, t=45, b=0),
+            yaxis=dict(range=[0, 100]),
+            xaxis=dict(tickangle=10)
+        )
+
+        return fig_bar
@@ -0,0 +1,238 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+
+# Banco SQLite dos feedbacks (modo WAL: leituras não esperam as escritas).
+CAMINHO_FEEDBACK = os.environ.get("DASHBOARD_FEEDBACK_DB", "feedback.db")
+
+# Arquivo JSON Lines antigo, importado uma única vez na criação do banco.
+CAMINHO_FEEDBACK_JSON = "feedback_log.json"
+
+# Feedbacks gravados por transação e espera máxima (s) de um feedback no buffer.
+TAMANHO_LOTE = 100
+INTERVALO_GRAVACAO = 1.0
+
+# Tentativas de um lote com o banco ocupado (além do `timeout` da conexão) e
+# espera (s) antes da primeira repetição, dobrada a cada nova tentativa.
+TENTATIVAS_GRAVACAO = 4
+ESPERA_TENTATIVA = 1.0
+
+# Valor do `st.feedback("thumbs")` -> rótulo guardado.
+ROTULOS_FEEDBACK = {1: "Ótimo", 0: "Ruim"}
+
+logger = logging.getLogger("dashboard.feedback")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY,
+    valor TEXT NOT NULL,
+    momento TEXT
+);
+CREATE TABLE IF NOT EXISTS contadores (
+    valor TEXT PRIMARY KEY,
+    total INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
+
+class FeedbackStore:
+    """Armazena os feedbacks da Home em SQLite, com gravação em lotes.
+
+    `registrar` só coloca o feedback em uma fila e retorna; uma thread do
+    processo grava a fila em lotes (até `TAMANHO_LOTE` feedbacks ou
+    `INTERVALO_GRAVACAO` segundos) em uma única transação, que também soma os
+    contadores por valor. O banco usa WAL e `busy_timeout`, então vários
+    processos (ou réplicas) podem gravar no mesmo arquivo. `contagens` lê só
+    os contadores (uma linha por valor) mais o que ainda está no buffer.
+    """
+
+    def __init__(self, caminho: str = CAMINHO_FEEDBACK, caminho_json: str | None = CAMINHO_FEEDBACK_JSON):
+        self.caminho = caminho
+        self.caminho_json = caminho_json
+        self._fila = queue.Queue()
+        self._lock = threading.Lock()
+        self._pendentes = {}
+        self._thread = None
+        self._preparado = False
+        self._lock_preparo = threading.Lock()
+
+    # ------------------------------------------------------------------ banco
+
+    def _conectar(self) -> sqlite3.Connection:
+        conexao = sqlite3.connect(self.caminho, timeout=30, isolation_level=None)
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.execute("PRAGMA synchronous=NORMAL")
+        return conexao
+
+    def _preparar(self, conexao: sqlite3.Connection):
+        """Cria as tabelas e importa o JSON antigo, se ainda não foi importado (uma vez por processo)."""
+        with self._lock_preparo:
+            if self._preparado:
+                return
+
+            conexao.executescript(_SCHEMA)
+            if self.caminho_json and os.path.exists(self.caminho_json):
+                conexao.execute("BEGIN IMMEDIATE")
+                try:
+                    if conexao.execute("SELECT 1 FROM meta WHERE chave = 'importado_json'").fetchone() is None:
+                        valores = self._ler_json()
+                        self._gravar(conexao, [(valor, None) for valor in valores])
+                        conexao.execute("INSERT INTO meta VALUES ('importado_json', ?)", (str(len(valores)),))
+                    conexao.execute("COMMIT")
+                except Exception:
+                    conexao.execute("ROLLBACK")
+                    raise
+
+            self._preparado = True
+
+    def _ler_json(self) -> list:
+        """Lê os valores do JSON Lines antigo; linhas malformadas são registradas no log e ignoradas."""
+        valores = []
+        with open(self.caminho_json, encoding="utf-8") as arquivo:
+            for numero, linha in enumerate(arquivo, 1):
+                if not linha.strip():
+                    continue
+                try:
+                    valor = json.loads(linha)["feedback"]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Linha %d de %s ignorada: %r", numero, self.caminho_json, linha.strip()[:80])
+                    continue
+                if valor is not None:
+                    valores.append(str(valor))
+        return valores
+
+    @staticmethod
+    def _gravar(conexao: sqlite3.Connection, registros: list):
+        """Insere os feedbacks e soma os contadores (dentro da transação do chamador)."""
+        conexao.executemany("INSERT INTO feedback (valor, momento) VALUES (?, ?)", registros)
+        totais = {}
+        for valor, _ in registros:
+            totais[valor] = totais.get(valor, 0) + 1
+        conexao.executemany(
+            "INSERT INTO contadores VALUES (?, ?) ON CONFLICT(valor) DO UPDATE SET total = total + excluded.total",
+            totais.items(),
+        )
+
+    # ------------------------------------------------------------------ gravação
+
+    def _iniciar(self):
+        """Inicia a thread de gravação, ou uma nova se a anterior terminou."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._thread is None:
+                atexit.register(self.descarregar)
+            else:
+                logger.error("A thread de gravação dos feedbacks tinha terminado; iniciando outra")
+            self._thread = threading.Thread(target=self._gravar_continuamente, name="feedback", daemon=True)
+            self._thread.start()
+
+    def _gravar_continuamente(self):
+        """Grava a fila em lotes; um lote que falha é registrado no log e descartado, sem parar a thread."""
+        conexao = None
+        while True:
+            lote = [self._fila.get()]
+            limite = time.monotonic() + INTERVALO_GRAVACAO
+            while len(lote) < TAMANHO_LOTE and (espera := limite - time.monotonic()) > 0:
+                try:
+                    lote.append(self._fila.get(timeout=espera))
+                except queue.Empty:
+                    break
+
+            registros = [item for item in lote if not isinstance(item, threading.Event)]
+            try:
+                if registros:
+                    if conexao is None:
+                        conexao = self._conectar()
+                        self._preparar(conexao)
+                    self._gravar_lote(conexao, registros)
+            except Exception:
+                logger.exception("Falha ao gravar %d feedbacks; lote descartado", len(registros))
+                if conexao is not None:
+                    conexao.close()
+                    conexao = None
+            finally:
+                self._concluir(lote, registros)
+
+    def _gravar_lote(self, conexao: sqlite3.Connection, registros: list):
+        """Grava os `registros` de um lote em uma transação.
+
+        Com o banco ocupado ou travado por outro processo, tenta de novo até
+        `TENTATIVAS_GRAVACAO` vezes; outros erros (banco só leitura, disco...)
+        e a última tentativa sobem para quem chamou.
+        """
+        for tentativa in range(TENTATIVAS_GRAVACAO):
+            try:
+                conexao.execute("BEGIN IMMEDIATE")
+                self._gravar(conexao, registros)
+                conexao.execute("COMMIT")
+                return
+            except sqlite3.OperationalError as erro:
+                if conexao.in_transaction:
+                    conexao.execute("ROLLBACK")
+                if not self._ocupado(erro) or tentativa == TENTATIVAS_GRAVACAO - 1:
+                    raise
+                espera = ESPERA_TENTATIVA * 2 ** tentativa
+                logger.warning("Banco ocupado ao gravar %d feedbacks; nova tentativa em %gs", len(registros), espera)
+                time.sleep(espera)
+
+    @staticmethod
+    def _ocupado(erro: sqlite3.OperationalError) -> bool:
+        """Indica se `erro` é de banco ocupado/travado (passa com o tempo), e não permanente."""
+        return (getattr(erro, "sqlite_errorcode", 0) & 0xFF) in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+    def _concluir(self, lote: list, registros: list):
+        """Tira os `registros` do buffer e libera os marcadores de `descarregar` (Events) do lote."""
+        if registros:
+            with self._lock:
+                for valor, _ in registros:
+                    self._pendentes[valor] -= 1
+        for item in lote:
+            if isinstance(item, threading.Event):
+                item.set()
+            self._fila.task_done()
+
+    def registrar(self, valor: str):
+        """Enfileira um feedback (ex.: 'Ótimo'); a gravação acontece em segundo plano."""
+        self._iniciar()
+        with self._lock:
+            self._pendentes[valor] = self._pendentes.get(valor, 0) + 1
+        self._fila.put((valor, datetime.now(timezone.utc).isoformat(timespec="seconds")))
+
+    def descarregar(self, timeout: float = 10.0) -> bool:
+        """Espera a gravação do que já está na fila. Retorna False se o tempo acabar."""
+        if self._thread is None:
+            return True
+        self._iniciar()
+        marcador = threading.Event()
+        self._fila.put(marcador)
+        return marcador.wait(timeout)
+
+    # ------------------------------------------------------------------ leitura
+
+    def contagens(self) -> dict:
+        """Retorna {valor: total} com os feedbacks gravados (todas as sessões) e os do buffer."""
+        conexao = self._conectar()
+        try:
+            self._preparar(conexao)
+            totais = dict(conexao.execute("SELECT valor, total FROM contadores").fetchall())
+        finally:
+            conexao.close()
+
+        with self._lock:
+            for valor, pendentes in self._pendentes.items():
+                totais[valor] = totais.get(valor, 0) + pendentes
+        return totais
+
+
+FEEDBACK = FeedbackStore()
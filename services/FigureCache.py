@@ -0,0 +1,128 @@
+import functools
+import os
+import threading
+
+import plotly.graph_objects as go
+import plotly.io as pio
+from cachetools import LRUCache
+
+
+class FiguraSerializada:
+    """JSON de uma figura Plotly guardado no cache."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json: str):
+        self.json = json
+
+
+class FigureCache:
+    """Cache LRU de figuras Plotly compartilhado por todas as sessões do processo.
+
+    As figuras são guardadas como JSON (`fig.to_json()`) e reconstruídas a cada
+    leitura, então nenhuma sessão recebe um objeto que outra possa alterar.
+    A chave é (serviço, método, valores dos filtros, versão do dataset).
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _serializar(valor):
+        """Troca as figuras de `valor` (ou de uma tupla) por JSON."""
+        if isinstance(valor, go.Figure):
+            return FiguraSerializada(valor.to_json())
+        if isinstance(valor, tuple):
+            return tuple(FigureCache._serializar(v) for v in valor)
+        return valor
+
+    @staticmethod
+    def _desserializar(valor):
+        """Reconstrói as figuras guardadas por `_serializar`."""
+        if isinstance(valor, FiguraSerializada):
+            return pio.from_json(valor.json)
+        if isinstance(valor, tuple):
+            return tuple(FigureCache._desserializar(v) for v in valor)
+        return valor
+
+    def obter(self, chave, construtor):
+        """Retorna o resultado guardado em `chave` ou o constrói com `construtor()`."""
+        resultado, guardado = self._obter(chave, construtor)
+        return resultado if resultado is not None else self._desserializar(guardado)
+
+    def obter_serializado(self, chave, construtor):
+        """Como `obter`, mas com as figuras como `FiguraSerializada` (sem reconstruí-las)."""
+        return self._obter(chave, construtor)[1]
+
+    def _obter(self, chave, construtor) -> tuple:
+        """Retorna (resultado recém-construído ou None, versão serializada)."""
+        with self._lock:
+            guardado = self._cache.get(chave, self)
+            if guardado is not self:
+                self._hits += 1
+                return None, guardado
+            self._misses += 1
+
+        resultado = construtor()
+        serializado = self._serializar(resultado)
+
+        with self._lock:
+            if chave not in self._cache and len(self._cache) >= self._cache.maxsize:
+                self._evictions += 1
+            self._cache[chave] = serializado
+
+        return resultado, serializado
+
+    def memoizado(self, *atributos):
+        """Decora um método `grafico_*` de serviço para passar pelo cache.
+
+        A chave usa o nome da classe, o nome do método, os valores dos
+        atributos de filtro informados e `self._versao_dados()` (id do conteúdo
+        do dataset): figuras de versões diferentes dos dados nunca se misturam. `metodo.serializado(servico)` retorna o
+        resultado com as figuras ainda em JSON (ver `obter_serializado`).
+        """
+        def decorador(metodo):
+            def chave(servico):
+                return (
+                    type(servico).__name__,
+                    metodo.__name__,
+                    tuple(
+                        tuple(v) if isinstance(v, list) else v
+                        for v in (getattr(servico, a) for a in atributos)
+                    ),
+                    servico._versao_dados(),
+                )
+
+            @functools.wraps(metodo)
+            def wrapper(servico):
+                return self.obter(chave(servico), lambda: metodo(servico))
+
+            wrapper.serializado = lambda servico: self.obter_serializado(chave(servico), lambda: metodo(servico))
+            return wrapper
+
+        return decorador
+
+    def estatisticas(self) -> dict:
+        """Retorna tamanho, hits, misses, evictions e taxa de acerto do cache."""
+        with self._lock:
+            consultas = self._hits + self._misses
+            return {
+                "tamanho": len(self._cache),
+                "capacidade": self._cache.maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "taxa_acerto": self._hits / consultas if consultas else 0.0,
+            }
+
+    def limpar(self):
+        """Descarta todas as figuras guardadas."""
+        with self._lock:
+            self._cache.clear()
+
+
+CACHE_FIGURAS = FigureCache(maxsize=int(os.environ.get("DASHBOARD_CACHE_FIGURAS", "256")))
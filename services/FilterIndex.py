@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+from services.ResponseCube import filtro_nulo
+
+# Dimensões usadas nos filtros das páginas.
+COLUNAS_INDICE = [
+    'CURSO',
+    'SETOR_CURSO',
+    'NOME_DISCIPLINA',
+    'EIXO_NOME',
+    'DIMENSAO_NOME',
+    'PERGUNTA',
+]
+
+
+class FilterIndex:
+    """Índice invertido das dimensões de filtro de um DataFrame.
+
+    Para cada coluna indexada guarda, por valor, as posições (ordenadas, int32)
+    das linhas que têm aquele valor. Uma combinação de filtros é resolvida
+    unindo as listas dos valores de uma mesma coluna (OR, multiselect) e
+    intersectando as listas entre colunas (AND), sem varrer o DataFrame.
+    As linhas sem valor têm uma lista própria, selecionada por um filtro nulo
+    (ver `filtro_nulo`).
+    """
+
+    def __init__(self, listas: dict, n_linhas: int, nulos: dict | None = None):
+        self._listas = listas
+        self._nulos = nulos or {}
+        self.n_linhas = n_linhas
+
+    @classmethod
+    def construir(cls, df: pd.DataFrame, colunas: list | None = None) -> "FilterIndex":
+        """Indexa as colunas de `df` presentes em `colunas` (padrão: `COLUNAS_INDICE`)."""
+        listas, nulos = {}, {}
+        for coluna in colunas or COLUNAS_INDICE:
+            if coluna in df.columns:
+                listas[coluna], nulos[coluna] = cls._indexar_coluna(df[coluna])
+        return cls(listas, len(df), nulos)
+
+    @staticmethod
+    def _indexar_coluna(serie: pd.Series) -> tuple:
+        """Retorna (valor -> posições das linhas com esse valor, posições das linhas nulas)."""
+        codigos, valores = pd.factorize(serie, sort=False)
+        ordem = np.argsort(codigos, kind='stable').astype(np.int32)
+        limites = np.concatenate(([0], np.cumsum(np.bincount(codigos[codigos >= 0], minlength=len(valores)))))
+
+        inicio = len(codigos) - int(limites[-1])  # códigos -1 (nulos) vêm primeiro
+        listas = {
+            valor: ordem[inicio + limites[i]:inicio + limites[i + 1]]
+            for i, valor in enumerate(valores)
+        }
+        return listas, ordem[:inicio]
+
+    def colunas(self) -> list:
+        """Retorna as colunas indexadas."""
+        return list(self._listas)
+
+    def valores(self, coluna: str) -> list:
+        """Retorna os valores indexados de `coluna`."""
+        return list(self._listas[coluna])
+
+    def _posicoes_coluna(self, coluna: str, valor) -> np.ndarray:
+        """Resolve o filtro de uma coluna (valor único ou lista, em OR)."""
+        listas = self._listas[coluna]
+        vazio = np.empty(0, dtype=np.int32)
+        nulos = self._nulos.get(coluna, vazio)
+
+        if not isinstance(valor, (list, tuple, set)):
+            return nulos if filtro_nulo(valor) else listas.get(valor, vazio)
+
+        partes = [listas[v] for v in {v for v in valor if not filtro_nulo(v)} if v in listas]
+        if any(filtro_nulo(v) for v in valor) and len(nulos):
+            partes.append(nulos)
+        if not partes:
+            return vazio
+        if len(partes) == 1:
+            return partes[0]
+        return np.sort(np.concatenate(partes))
+
+    def posicoes(self, filtros: dict | None = None) -> np.ndarray | None:
+        """Retorna as posições das linhas que atendem a todos os filtros indexados.
+
+        `filtros` mapeia coluna -> valor ou lista de valores; valores None são
+        ignorados. Retorna None quando não há filtro (todas as linhas).
+        Colunas não indexadas geram KeyError.
+        """
+        partes = [
+            self._posicoes_coluna(coluna, valor)
+            for coluna, valor in (filtros or {}).items()
+            if valor is not None
+        ]
+        if not partes:
+            return None
+
+        partes.sort(key=len)
+        resultado = partes[0]
+        for parte in partes[1:]:
+            if len(resultado) == 0:
+                break
+            resultado = np.intersect1d(resultado, parte, assume_unique=True)
+
+        return resultado
+
+    def selecionar(self, df: pd.DataFrame, filtros: dict | None = None) -> pd.DataFrame:
+        """Retorna as linhas de `df` que atendem aos filtros, na ordem original."""
+        posicoes = self.posicoes(filtros)
+        if posicoes is None:
+            return df
+        return df.iloc[posicoes]
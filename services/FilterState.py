@@ -0,0 +1,78 @@
+import functools
+
+# Quantidade máxima de resultados memoizados por instância de serviço.
+MAX_MEMO = 64
+
+
+class FilterState:
+    """Base dos serviços de avaliação: filtros mutáveis e resultados memoizados.
+
+    Os serviços vivem enquanto a sessão existir (ver `view/sessao.py`). Os
+    filtros são trocados com `atualizar_filtros`, e os métodos decorados com
+    `memoizado` guardam o resultado por valor dos filtros de que dependem:
+    trocar um filtro só recalcula o que usa aquele filtro.
+    """
+
+    def _registrar_fonte(self, atributo: str, carregador):
+        """Registra que `self.<atributo>` veio de `carregador()` (DataLoader).
+
+        Usado por `desatualizado` para detectar que o dataset foi recarregado.
+        """
+        if not hasattr(self, "_fontes"):
+            self._fontes = []
+        self._fontes.append((atributo, carregador))
+
+    def desatualizado(self) -> bool:
+        """Indica se algum dataset do serviço foi recarregado pelo DataLoader.
+
+        O DataLoader devolve o mesmo objeto enquanto o arquivo não muda, então a
+        verificação é uma comparação de identidade.
+        """
+        return any(carregador() is not getattr(self, atributo) for atributo, carregador in getattr(self, "_fontes", []))
+
+    def atualizar_filtros(self, **filtros) -> bool:
+        """Atualiza os valores de filtro no próprio serviço.
+
+        Aceita apenas atributos já existentes (ex.: `curso_value=...`).
+        Retorna True se algum valor mudou.
+        """
+        mudou = False
+        for nome, valor in filtros.items():
+            if not hasattr(self, nome):
+                raise AttributeError(f"{type(self).__name__} não tem o filtro '{nome}'")
+            if getattr(self, nome) != valor:
+                setattr(self, nome, valor)
+                mudou = True
+        return mudou
+
+    def limpar_memo(self):
+        """Descarta os resultados memoizados."""
+        self.__dict__.pop("_memo", None)
+
+    @staticmethod
+    def memoizado(*atributos):
+        """Memoiza o método pelo valor dos atributos de filtro informados.
+
+        Listas (multiselect) entram na chave como tuplas. O resultado
+        é compartilhado entre chamadas: quem o recebe não deve alterá-lo.
+        """
+        def decorador(metodo):
+            @functools.wraps(metodo)
+            def wrapper(self):
+                memo = self.__dict__.setdefault("_memo", {})
+                chave = (metodo.__name__,) + tuple(
+                    tuple(v) if isinstance(v, list) else v
+                    for v in (getattr(self, a) for a in atributos)
+                )
+                if chave in memo:
+                    return memo[chave]
+
+                resultado = metodo(self)
+                if len(memo) >= MAX_MEMO:
+                    memo.pop(next(iter(memo)))
+                memo[chave] = resultado
+                return resultado
+
+            return wrapper
+
+        return decorador
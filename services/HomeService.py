@@ -1,26 +1,21 @@
-import json
+from services.FeedbackStore import FEEDBACK, ROTULOS_FEEDBACK
+
 
 class DataLogger:
     def __init__(self, feedback_value=None):
         self.feedback_value = feedback_value
 
-    def save_feedback_to_json(self):
-        filename = "feedback_log.json"
-
-        if self.feedback_value == 1:
-            _data = {"feedback": "Ótimo"}
-        elif self.feedback_value == 0:
-            _data = {"feedback": "Ruim"}
-        else:
+    def save_feedback(self):
+        """Registra o feedback no `FeedbackStore` (gravado em segundo plano, em lotes)."""
+        rotulo = ROTULOS_FEEDBACK.get(self.feedback_value)
+        if rotulo is None:
             return {
                 "status": "on holding",
                 "message": "Deixe seu feedback!"
             }
 
         try:
-            with open(filename, 'a+', encoding='utf-8') as f:
-                json_record = json.dumps(_data, ensure_ascii=False)
-                f.write(json_record + '\n')
+            FEEDBACK.registrar(rotulo)
 
             return {
                 "status": "success",
@@ -32,3 +27,9 @@ class DataLogger:
                 "status": "error",
                 "message": f"Erro ao salvar feedback!"
             }
+
+    @staticmethod
+    def contagens() -> dict:
+        """Retorna o total de feedbacks por rótulo ('Ótimo', 'Ruim') de todas as sessões."""
+        totais = FEEDBACK.contagens()
+        return {rotulo: totais.get(rotulo, 0) for rotulo in ROTULOS_FEEDBACK.values()}
@@ -0,0 +1,312 @@
+import io
+import itertools
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pipeline.BasePipeline import CHUNKSIZE_PADRAO, NUMEROS_DIMENSOES, BasePipeline
+from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+from services.DataLoader import COLUNAS_ORDENACAO_STORE, PATHS_POR_TIPO, SCHEMAS, DataLoader
+from services.ResponseCube import ResponseCube
+
+# Envios guardados para o painel do Administrador (os mais antigos saem primeiro).
+MAX_TAREFAS = int(os.environ.get("DASHBOARD_INGESTAO_HISTORICO", "20"))
+
+# Linhas lidas por bloco dos arquivos enviados.
+CHUNKSIZE_INGESTAO = int(os.environ.get("DASHBOARD_INGESTAO_CHUNKSIZE") or CHUNKSIZE_PADRAO)
+
+# Colunas que o dashboard lê de cada tipo (as mesmas dos serviços).
+COLUNAS_OBRIGATORIAS = {
+    "institucional": AvaliacaoInstitucionalService.COLUNAS,
+    "cursos": AvaliacaoDosCursosService.COLUNAS,
+    "presencial": AvaliacaoDasDisciplinasService.COLUNAS,
+    "ead": AvaliacaoDasDisciplinasService.COLUNAS,
+}
+
+# Colunas que podem faltar no arquivo porque são derivadas de outra (ver `_derivar`).
+COLUNAS_DERIVADAS = {
+    "VALOR_RESPOSTA": "RESPOSTA",
+    "EIXO_NOME": "EIXO_NUM",
+    "DIMENSAO_NUM": "Tipo_Perg",
+}
+
+# '2026' ou '2026/1'.
+FORMATO_PERIODO = re.compile(r"^\d{4}(/[12])?$")
+
+logger = logging.getLogger("dashboard.ingestao")
+
+
+class _Tarefa:
+    """Estado de um envio: etapa atual, progresso (0 a 1) e resultado."""
+
+    __slots__ = ("id", "tipo", "periodo", "arquivo", "etapa", "progresso", "linhas", "mensagem", "criada", "inicio", "fim")
+
+    def __init__(self, id_: int, tipo: str, periodo: str, arquivo: str):
+        self.id = id_
+        self.tipo = tipo
+        self.periodo = periodo
+        self.arquivo = arquivo
+        self.etapa = "na fila"
+        self.progresso = 0.0
+        self.linhas = 0
+        self.mensagem = ""
+        self.criada = datetime.now().strftime("%H:%M:%S")
+        self.inicio = None
+        self.fim = None
+
+    def resumo(self) -> dict:
+        """Retorna uma cópia do estado para exibição."""
+        resumo = {nome: getattr(self, nome) for nome in self.__slots__ if nome not in ("inicio", "fim")}
+        if self.inicio is not None:
+            resumo["segundos"] = (self.fim or time.perf_counter()) - self.inicio
+        return resumo
+
+
+class IngestionWorker:
+    """Processa em segundo plano os arquivos enviados na aba Administrador.
+
+    `enviar` só registra o envio e devolve o ID da tarefa: a leitura acontece
+    em uma thread própria, um arquivo por vez, sem prender o rerun de quem
+    enviou nem o das outras sessões. Cada arquivo (CSV ou XLSX, com as colunas
+    dos processados) tem o cabeçalho validado antes da leitura, é lido em
+    blocos de `CHUNKSIZE_INGESTAO` linhas, recebe as colunas derivadas que
+    faltarem (`VALOR_RESPOSTA`, `EIXO_NOME`, `DIMENSAO_NUM`, como no pipeline)
+    e é gravado em um Parquet temporário da nova versão da partição, com o
+    cubo somado bloco a bloco (o DataFrame do arquivo inteiro nunca é
+    montado). Esse Parquet é reescrito ordenado por setor/curso, como em
+    `DataLoader.publicar_periodo`, para os filtros de `load_periodo`
+    descartarem row groups. Só no fim a versão é ativada
+    (`DataLoader.ativar_versao`); um erro em qualquer etapa deixa a partição
+    anterior intacta.
+    """
+
+    def __init__(self):
+        self._tarefas = deque(maxlen=MAX_TAREFAS)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._executor = None
+
+    # ------------------------------------------------------------------ envio
+
+    def enviar(self, tipo: str, periodo: str, arquivo: str, conteudo: bytes) -> int:
+        """Agenda a ingestão de `conteudo` (arquivo `arquivo`) como `tipo`/`periodo`.
+
+        Gera ValueError para tipo, período ou extensão inválidos. Retorna o ID da tarefa.
+        """
+        if tipo not in COLUNAS_OBRIGATORIAS:
+            raise ValueError(f"Tipo de avaliação desconhecido: {tipo!r}")
+        periodo = (periodo or "").strip()
+        if not FORMATO_PERIODO.match(periodo):
+            raise ValueError(f"Período inválido: {periodo!r} (use '2026' ou '2026/1')")
+        if not arquivo.lower().endswith((".csv", ".xlsx")):
+            raise ValueError(f"Formato não suportado: {arquivo!r} (envie .csv ou .xlsx)")
+
+        with self._lock:
+            tarefa = _Tarefa(next(self._ids), tipo, periodo, arquivo)
+            self._tarefas.append(tarefa)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingestao")
+            self._executor.submit(self._executar, tarefa, conteudo)
+        return tarefa.id
+
+    def tarefas(self) -> list:
+        """Retorna o estado de cada envio guardado, do mais recente ao mais antigo."""
+        with self._lock:
+            return [tarefa.resumo() for tarefa in reversed(self._tarefas)]
+
+    def em_andamento(self) -> bool:
+        """Indica se há envio na fila ou sendo processado."""
+        with self._lock:
+            return any(tarefa.fim is None for tarefa in self._tarefas)
+
+    # ------------------------------------------------------------------ leitura
+
+    @staticmethod
+    def _leitor_csv(conteudo: bytes):
+        """Retorna (colunas, blocos) de um CSV; cada bloco vem com a fração já lida."""
+        colunas = list(pd.read_csv(io.BytesIO(conteudo), nrows=0).columns)
+
+        def blocos():
+            buffer = io.BytesIO(conteudo)
+            for bloco in pd.read_csv(buffer, chunksize=CHUNKSIZE_INGESTAO):
+                yield bloco, buffer.tell() / max(len(conteudo), 1)
+
+        return colunas, blocos()
+
+    @staticmethod
+    def _leitor_xlsx(conteudo: bytes):
+        """Retorna (colunas, blocos) da primeira planilha de um XLSX (requer openpyxl)."""
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("A leitura de .xlsx requer o pacote openpyxl (pip install openpyxl); envie um .csv.") from None
+
+        planilha = load_workbook(io.BytesIO(conteudo), read_only=True, data_only=True).active
+        linhas = planilha.iter_rows(values_only=True)
+        colunas = [str(c).strip() for c in next(linhas, ())]
+        total = max((planilha.max_row or 1) - 1, 1)
+
+        def blocos():
+            lidas = 0
+            while lote := list(itertools.islice(linhas, CHUNKSIZE_INGESTAO)):
+                lidas += len(lote)
+                yield pd.DataFrame(lote, columns=colunas), min(lidas / total, 1.0)
+
+        return colunas, blocos()
+
+    @staticmethod
+    def validar_colunas(tipo: str, colunas: list):
+        """Gera ValueError se faltarem colunas do dashboard que não podem ser derivadas."""
+        presentes = set(colunas)
+        faltando = [
+            coluna for coluna in COLUNAS_OBRIGATORIAS[tipo]
+            if coluna not in presentes and COLUNAS_DERIVADAS.get(coluna) not in presentes
+        ]
+        if faltando:
+            raise ValueError(f"Colunas ausentes para '{tipo}': {', '.join(faltando)}")
+
+    @staticmethod
+    def _derivar(bloco: pd.DataFrame, tipo: str) -> pd.DataFrame:
+        """Completa um bloco com as colunas derivadas e os dtypes numéricos do schema."""
+        def falta(coluna):
+            return coluna not in bloco.columns and COLUNAS_DERIVADAS[coluna] in bloco.columns
+
+        if falta("VALOR_RESPOSTA") and tipo != "institucional":
+            bloco["VALOR_RESPOSTA"] = BasePipeline.valor_resposta(bloco["RESPOSTA"])
+        if falta("EIXO_NOME"):
+            bloco["EIXO_NOME"] = BasePipeline.nome_eixo(bloco["EIXO_NUM"])
+        if falta("DIMENSAO_NUM"):
+            bloco["DIMENSAO_NUM"] = bloco["Tipo_Perg"].map(NUMEROS_DIMENSOES)
+
+        # Só os tipos numéricos do schema: as colunas categóricas são gravadas
+        # como texto (categorias de blocos diferentes não combinam) e voltam a
+        # ser categorias na leitura (`DataLoader.load_periodo`).
+        schema = SCHEMAS.get(PATHS_POR_TIPO[tipo], {})
+        bloco = bloco.loc[:, ~bloco.columns.str.contains(r"\.\d+$")]
+        return DataLoader.aplicar_schema(bloco, {c: d for c, d in schema.items() if d != "category"})
+
+    @staticmethod
+    def _schema(tabela: pa.Table) -> pa.Schema:
+        """Schema do Parquet a partir do primeiro bloco.
+
+        Colunas sem nenhum valor no bloco (lidas como nulas ou como float só
+        com NaN) viram texto, já que o tipo delas não é conhecido.
+        """
+        schema = tabela.schema
+        for i, campo in enumerate(schema):
+            if tabela.column(i).null_count == len(tabela):
+                schema = schema.set(i, campo.with_type(pa.string()))
+        return schema
+
+    # ------------------------------------------------------------------ execução
+
+    def _atualizar(self, tarefa: _Tarefa, **estado):
+        with self._lock:
+            for nome, valor in estado.items():
+                setattr(tarefa, nome, valor)
+
+    @staticmethod
+    def _ordenar(origem: str, destino: str):
+        """Reescreve o Parquet `origem` em `destino` ordenado por `COLUNAS_ORDENACAO_STORE`.
+
+        A ordem é a de `DataLoader.publicar_periodo` (estável, nulos no fim).
+        Só as colunas de ordenação viram DataFrame (categorias); a tabela é
+        lida com os textos codificados em dicionário e gravada em fatias.
+        """
+        schema = pq.read_schema(origem)
+        colunas = [c for c in COLUNAS_ORDENACAO_STORE if c in schema.names]
+        if not colunas:
+            os.replace(origem, destino)
+            return
+
+        textos = [campo.name for campo in schema if pa.types.is_string(campo.type)]
+        tabela = pq.ParquetFile(origem, read_dictionary=textos).read()
+        chaves = tabela.select(colunas).to_pandas()
+        for coluna in colunas:
+            if isinstance(chaves[coluna].dtype, pd.CategoricalDtype):
+                chaves[coluna] = chaves[coluna].cat.reorder_categories(sorted(chaves[coluna].cat.categories))
+        ordem = chaves.sort_values(colunas, kind="stable").index.to_numpy()
+        del chaves
+
+        with pq.ParquetWriter(destino, schema, compression="zstd") as escritor:
+            for inicio in range(0, len(ordem), 100_000):
+                escritor.write_table(tabela.take(ordem[inicio:inicio + 100_000]).cast(schema))
+
+    def _gravar_blocos(self, tarefa: _Tarefa, blocos, arquivo: str) -> str:
+        """Grava os blocos derivados em `arquivo` (Parquet, ordenado) e o cubo somado ao lado; retorna `arquivo`.
+
+        Blocos cujos tipos diferem dos do primeiro (ex.: inteiros que ganham
+        valores ausentes) são convertidos para o schema do arquivo. Os blocos
+        vão para um Parquet temporário na mesma pasta, depois ordenado (ver `_ordenar`).
+        """
+        bruto = os.path.join(os.path.dirname(arquivo), "bruto.parquet")
+        escritor, schema, cubo = None, None, None
+        try:
+            for bloco, fracao in blocos:
+                bloco = self._derivar(bloco, tarefa.tipo)
+                tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+                if escritor is None:
+                    schema = self._schema(tabela)
+                    escritor = pq.ParquetWriter(bruto, schema, compression="zstd")
+                if not tabela.schema.equals(schema):
+                    tabela = tabela.cast(schema)
+                escritor.write_table(tabela, row_group_size=100_000)
+
+                cubo_bloco = ResponseCube.construir(bloco)
+                cubo = cubo_bloco if cubo is None else cubo.somar(cubo_bloco)
+                self._atualizar(tarefa, progresso=0.9 * fracao, linhas=tarefa.linhas + len(bloco))
+        finally:
+            if escritor is not None:
+                escritor.close()
+
+        if cubo is None or tarefa.linhas == 0:
+            raise ValueError("O arquivo não tem linhas de dados")
+
+        self._atualizar(tarefa, etapa="ordenando", progresso=0.9)
+        try:
+            self._ordenar(bruto, arquivo)
+        finally:
+            if os.path.exists(bruto):
+                os.remove(bruto)
+        cubo.salvar(DataLoader.caminho_cubo(arquivo))
+        return arquivo
+
+    def _executar(self, tarefa: _Tarefa, conteudo: bytes):
+        """Lê, transforma e publica um envio (roda na thread de ingestão)."""
+        self._atualizar(tarefa, etapa="validando", inicio=time.perf_counter())
+        try:
+            leitor = self._leitor_xlsx if tarefa.arquivo.lower().endswith(".xlsx") else self._leitor_csv
+            colunas, blocos = leitor(conteudo)
+            self.validar_colunas(tarefa.tipo, colunas)
+
+            self._atualizar(tarefa, etapa="lendo")
+            pasta = DataLoader.preparar_versao(tarefa.tipo, tarefa.periodo)
+            try:
+                arquivo = self._gravar_blocos(tarefa, blocos, os.path.join(pasta, "dados.parquet"))
+                self._atualizar(tarefa, etapa="publicando", progresso=0.95)
+                destino = DataLoader.ativar_versao(tarefa.tipo, tarefa.periodo, pasta)
+            except BaseException:
+                shutil.rmtree(pasta, ignore_errors=True)
+                raise
+            self._atualizar(tarefa, etapa="concluída", progresso=1.0, mensagem=f"Publicado em {destino}")
+        except Exception as erro:
+            if not isinstance(erro, (ValueError, KeyError)):
+                logger.exception("Falha na ingestão de %s", tarefa.arquivo)
+            self._atualizar(tarefa, etapa="erro", mensagem=str(erro))
+        finally:
+            self._atualizar(tarefa, fim=time.perf_counter())
+
+
+INGESTAO = IngestionWorker()
@@ -0,0 +1,118 @@
+import difflib
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Marcas de acentuação que sobram depois da decomposição NFKD.
+_ACENTOS = re.compile('[\u0300-\u036f]')
+
+
+def normalizar(texto: str) -> str:
+    """Remove acentos, caixa e espaços repetidos de `texto` (chave de busca)."""
+    texto = _ACENTOS.sub('', unicodedata.normalize('NFKD', str(texto)))
+    return ' '.join(texto.casefold().split())
+
+
+def _sem_nulos(valores) -> tuple:
+    """Troca os valores ausentes (None, NaN, pd.NA...) de `valores` por `np.nan`."""
+    return tuple(np.nan if pd.isna(v) else v for v in valores)
+
+
+class OptionIndex:
+    """Índice das combinações distintas de colunas de filtro, para seletores com busca.
+
+    Cada combinação (ex.: disciplina, curso, setor) recebe um ID estável para o
+    dataset: a posição do seu rótulo na lista ordenada. O seletor trabalha com
+    IDs e `valores(id)` devolve a tupla estruturada, sem reinterpretar o rótulo.
+    `buscar` filtra os IDs por termos sem acento e sem caixa, aceitando erros
+    de digitação quando nenhum rótulo contém os termos.
+    """
+
+    def __init__(self, colunas: list, combinacoes: list, rotulos: list):
+        self.colunas = list(colunas)
+        self._combinacoes = combinacoes
+        self._rotulos = rotulos
+        self._ids = {combinacao: i for i, combinacao in enumerate(combinacoes)}
+        self._chaves = pd.Series(
+            [normalizar(' '.join(str(v) for v in combinacao)) for combinacao in combinacoes], dtype=object
+        )
+        self._vocabulario = None
+
+    @classmethod
+    def construir(cls, df: pd.DataFrame, colunas: list, formato: str) -> "OptionIndex":
+        """Indexa as combinações distintas de `colunas` em `df`.
+
+        `formato` monta o rótulo de cada combinação com `str.format` (um campo por
+        coluna, na ordem de `colunas`). As combinações ficam ordenadas pelo rótulo.
+        Valores ausentes também formam combinações, com NaN no lugar do valor
+        (um filtro nulo, ver `filtro_nulo`) e 'nan' no rótulo.
+        """
+        grupos = df.groupby(colunas, observed=True, sort=False, dropna=False).size()
+        combinacoes = [_sem_nulos(c if isinstance(c, tuple) else (c,)) for c in grupos.index]
+
+        rotulos = [formato.format(*combinacao) for combinacao in combinacoes]
+        ordem = sorted(range(len(rotulos)), key=rotulos.__getitem__)
+        return cls(colunas, [combinacoes[i] for i in ordem], [rotulos[i] for i in ordem])
+
+    def __len__(self) -> int:
+        return len(self._combinacoes)
+
+    def ids(self) -> list:
+        """Retorna todos os IDs, na ordem dos rótulos."""
+        return list(range(len(self._combinacoes)))
+
+    def rotulo(self, opcao_id: int) -> str:
+        """Retorna o rótulo exibido para `opcao_id`."""
+        return self._rotulos[opcao_id]
+
+    def rotulos(self) -> list:
+        """Retorna os rótulos de todos os IDs, na ordem dos IDs."""
+        return list(self._rotulos)
+
+    def valores(self, opcao_id: int) -> tuple:
+        """Retorna a combinação de valores (na ordem de `colunas`) de `opcao_id`."""
+        return self._combinacoes[opcao_id]
+
+    def id_de(self, *valores) -> int | None:
+        """Retorna o ID da combinação `valores`, ou None se ela não existir."""
+        return self._ids.get(_sem_nulos(valores))
+
+    def _palavras(self) -> list:
+        """Retorna as palavras normalizadas dos rótulos (vocabulário da busca aproximada)."""
+        if self._vocabulario is None:
+            self._vocabulario = sorted({p for chave in self._chaves for p in chave.split()})
+        return self._vocabulario
+
+    def _contem(self, alternativas: list) -> np.ndarray:
+        """Máscara das chaves que contêm alguma das `alternativas`."""
+        mascara = np.zeros(len(self._chaves), dtype=bool)
+        for termo in alternativas:
+            mascara |= self._chaves.str.contains(termo, regex=False).to_numpy()
+        return mascara
+
+    def buscar(self, texto: str | None, limite: int | None = None) -> list:
+        """Retorna os IDs cujos valores contêm todos os termos de `texto`.
+
+        A comparação ignora acentos e caixa. Os IDs em que o primeiro termo começa
+        uma palavra vêm antes dos que só o contêm no meio. Sem nenhum resultado,
+        cada termo é trocado pelas palavras mais parecidas do índice (`difflib`).
+        Sem termos, retorna todos os IDs.
+        """
+        termos = normalizar(texto or '').split()
+        if not termos:
+            return self.ids()[:limite]
+
+        mascara = np.logical_and.reduce([self._contem([termo]) for termo in termos])
+        if not mascara.any():
+            parecidas = [difflib.get_close_matches(termo, self._palavras(), n=3, cutoff=0.75) for termo in termos]
+            if not all(parecidas):
+                return []
+            mascara = np.logical_and.reduce([self._contem(alternativas) for alternativas in parecidas])
+
+        encontrados = np.flatnonzero(mascara)
+        chaves = self._chaves.iloc[encontrados]
+        inicio_palavra = (chaves.str.startswith(termos[0]) | chaves.str.contains(' ' + termos[0], regex=False)).to_numpy()
+        ordenados = np.concatenate((encontrados[inicio_palavra], encontrados[~inicio_palavra]))
+        return ordenados[:limite].tolist()
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+from services.ResponseCube import mascara_filtros
+
+# Métricas percentuais comparadas entre períodos (mesmos nomes de `metricas_filtradas`).
+METRICAS = ("concordancia", "discordancia", "desconhecimento")
+
+
+class PeriodComparison:
+    """Métricas de um período já encerrado, pré-agregadas para as comparações "Ano passado".
+
+    `tabela` tem uma linha por combinação observada das colunas de filtro do
+    serviço (`chaves`), com o total de respostas, a contagem de cada métrica
+    e os `ID_PESQUISA` únicos (ordenados) dos respondentes. Consultar um filtro
+    é filtrar essa tabela pequena: as contagens são somadas e os respondentes
+    únicos saem da união dos ids, sem voltar ao dataset do período.
+    """
+
+    def __init__(self, tabela: pd.DataFrame, chaves: list):
+        self.tabela = tabela
+        self.chaves = chaves
+        self._geral = None
+
+    @classmethod
+    def construir(cls, df: pd.DataFrame, chaves: list, coluna: str, valores: dict) -> "PeriodComparison":
+        """Agrega `df` (nível de resposta) por `chaves`.
+
+        `valores` mapeia cada nome de `METRICAS` para o valor de `coluna` que ele
+        conta (ex.: {'concordancia': 1} em VALOR_RESPOSTA).
+        """
+        contagens = {
+            f"N_{nome.upper()}": (df[coluna] == valores[nome]).to_numpy() for nome in METRICAS
+        }
+        base = df[chaves + ['ID_PESQUISA']].assign(**contagens)
+        grupos = base.groupby(chaves, observed=True, dropna=False)
+
+        tabela = grupos[list(contagens)].sum()
+        tabela.insert(0, 'TOTAL', grupos.size())
+
+        # Ids únicos de cada grupo: ordena por (grupo, id), tira as repetições e corta por grupo.
+        codigos = grupos.ngroup().to_numpy()
+        ids = base['ID_PESQUISA'].to_numpy().astype(np.int32)
+        ordem = np.lexsort((ids, codigos))
+        codigos, ids = codigos[ordem], ids[ordem]
+        unicos = np.ones(len(ids), dtype=bool)
+        unicos[1:] = (codigos[1:] != codigos[:-1]) | (ids[1:] != ids[:-1])
+        codigos, ids = codigos[unicos], ids[unicos]
+        partes = np.split(ids, np.flatnonzero(np.diff(codigos)) + 1)
+        tabela['IDS'] = pd.Series(partes, index=tabela.index, dtype=object)
+        tabela.insert(0, 'RESPONDENTES', tabela['IDS'].map(len))
+
+        return cls(tabela.reset_index(), chaves)
+
+    @classmethod
+    def ler(cls, path: str) -> "PeriodComparison":
+        """Lê uma tabela de comparação persistida em Parquet."""
+        return cls.de_tabela(pd.read_parquet(path))
+
+    @classmethod
+    def de_tabela(cls, tabela: pd.DataFrame) -> "PeriodComparison":
+        """Reconstrói a comparação a partir da tabela (ex.: lida do Parquet)."""
+        chaves = [c for c in tabela.columns if c not in ('RESPONDENTES', 'TOTAL', 'IDS') and not c.startswith('N_')]
+        return cls(tabela, chaves)
+
+    def salvar(self, path: str):
+        """Persiste a tabela em Parquet."""
+        self.tabela.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+
+    @staticmethod
+    def _resumir(linhas: pd.DataFrame, respondentes: int) -> dict:
+        total = int(linhas['TOTAL'].sum())
+        metricas = {"respondentes": respondentes, "total_respostas": total}
+        for nome in METRICAS:
+            quantidade = int(linhas[f"N_{nome.upper()}"].sum())
+            metricas[nome] = ((quantidade / total) * 100 if total else 0, quantidade)
+        return metricas
+
+    def metricas(self, filtros: dict | None = None) -> dict | None:
+        """Retorna as métricas do período para `filtros` (formato de `mascara_filtros`).
+
+        O resultado tem o formato de `metricas_filtradas` dos serviços. Retorna
+        None quando nenhuma resposta do período atende aos filtros.
+        """
+        filtros = {coluna: valor for coluna, valor in (filtros or {}).items() if valor is not None}
+        if not filtros:
+            if self._geral is None:
+                ids = np.unique(np.concatenate(list(self.tabela['IDS']))) if len(self.tabela) else []
+                self._geral = self._resumir(self.tabela, len(ids))
+            return self._geral
+
+        linhas = self.tabela[mascara_filtros(self.tabela, filtros)]
+        if linhas.empty:
+            return None
+        if len(linhas) == 1:
+            respondentes = int(linhas['RESPONDENTES'].iloc[0])
+        else:
+            respondentes = len(np.unique(np.concatenate(list(linhas['IDS']))))
+
+        return self._resumir(linhas, respondentes)
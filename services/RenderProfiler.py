@@ -0,0 +1,215 @@
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pandas as pd
+
+# Execuções (reruns) completas guardadas para o painel do Administrador.
+MAX_EXECUCOES = int(os.environ.get("DASHBOARD_PROFILER_HISTORICO", "200"))
+
+# Chamadas mais lentas de cada execução que entram no log estruturado.
+TOP_LOG = 10
+
+logger = logging.getLogger("dashboard.profiler")
+
+
+class _Execucao:
+    """Tempos de um rerun: por (categoria, nome) e por categoria (só as chamadas externas)."""
+
+    __slots__ = ("pagina", "inicio", "chamadas", "categorias", "pilha")
+
+    def __init__(self, pagina: str):
+        self.pagina = pagina
+        self.inicio = time.perf_counter()
+        self.chamadas = {}
+        self.categorias = {}
+        self.pilha = []
+
+
+class RenderProfiler:
+    """Instrumentação opcional dos reruns do Streamlit.
+
+    Com `DASHBOARD_PROFILER=1`, `instalar` envolve as cargas do DataLoader, os
+    métodos públicos dos serviços e `st.plotly_chart` com cronômetros. Cada
+    rerun aberto com `execucao` acumula tempo e quantidade de chamadas por
+    (categoria, nome); ao fim, o resumo vai para o histórico (painel do
+    Administrador) e para o log `dashboard.profiler` como uma linha JSON.
+    Fora de um rerun (ex.: pré-aquecimento) ou desligado, a medição não faz nada.
+    """
+
+    def __init__(self, ativo: bool = False):
+        self.ativo = ativo
+        self._local = threading.local()
+        self._historico = deque(maxlen=MAX_EXECUCOES)
+        self._lock = threading.Lock()
+        self._instalado = False
+
+    # ------------------------------------------------------------------ medição
+
+    @contextmanager
+    def execucao(self, pagina: str):
+        """Abre a medição de um rerun da `pagina` na thread atual."""
+        if not self.ativo or getattr(self._local, "execucao", None) is not None:
+            yield
+            return
+
+        execucao = _Execucao(pagina)
+        self._local.execucao = execucao
+        try:
+            yield
+        finally:
+            self._local.execucao = None
+            self._registrar(execucao, time.perf_counter() - execucao.inicio)
+
+    @contextmanager
+    def medir(self, categoria: str, nome: str):
+        """Mede o bloco `with` no rerun atual (não faz nada fora de um rerun)."""
+        execucao = getattr(self._local, "execucao", None)
+        if execucao is None:
+            yield
+            return
+
+        # Chamadas aninhadas na mesma categoria (ex.: um método de serviço que usa
+        # outro) contam no nome, mas não de novo no total da categoria.
+        externa = categoria not in execucao.pilha
+        execucao.pilha.append(categoria)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            decorrido = time.perf_counter() - inicio
+            execucao.pilha.pop()
+            chave = (categoria, nome)
+            chamadas, total = execucao.chamadas.get(chave, (0, 0.0))
+            execucao.chamadas[chave] = (chamadas + 1, total + decorrido)
+            if externa:
+                execucao.categorias[categoria] = execucao.categorias.get(categoria, 0.0) + decorrido
+
+    def cronometrado(self, categoria: str, nome: str, funcao):
+        """Retorna `funcao` envolvida por `medir(categoria, nome)`."""
+        @functools.wraps(funcao)
+        def wrapper(*args, **kwargs):
+            with self.medir(categoria, nome):
+                return funcao(*args, **kwargs)
+
+        wrapper.__wrapped_profiler__ = True
+        return wrapper
+
+    # ------------------------------------------------------------------ instalação
+
+    def instrumentar_classe(self, classe, categoria: str, nomes: list | None = None):
+        """Envolve os métodos públicos de `classe` (ou só `nomes`) com `cronometrado`.
+
+        Métodos estáticos continuam estáticos. Métodos já envolvidos são ignorados.
+        """
+        for nome in nomes or [n for n in vars(classe) if not n.startswith("_")]:
+            atributo = vars(classe).get(nome)
+            estatico = isinstance(atributo, staticmethod)
+            funcao = atributo.__func__ if estatico else atributo
+            if not callable(funcao) or getattr(funcao, "__wrapped_profiler__", False):
+                continue
+
+            wrapper = self.cronometrado(categoria, f"{classe.__name__}.{nome}", funcao)
+            setattr(classe, nome, staticmethod(wrapper) if estatico else wrapper)
+
+    def instalar(self):
+        """Instrumenta DataLoader, serviços e `st.plotly_chart` (uma vez por processo)."""
+        with self._lock:
+            if not self.ativo or self._instalado:
+                return
+            self._instalado = True
+
+        import streamlit as st
+
+        from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+        from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+        from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+        from services.DataLoader import DataLoader
+
+        self.instrumentar_classe(DataLoader, "carga", ["load_periodo", "_carregar", "cubo", "indice", "comparacao"])
+        for classe in (AvaliacaoInstitucionalService, AvaliacaoDasDisciplinasService, AvaliacaoDosCursosService):
+            self.instrumentar_classe(classe, "servico")
+
+        plotly_chart = st.plotly_chart
+
+        @functools.wraps(plotly_chart)
+        def plotly_chart_medido(figura, *args, **kwargs):
+            titulo = getattr(getattr(getattr(figura, "layout", None), "title", None), "text", None)
+            with self.medir("grafico", titulo or kwargs.get("key") or "sem título"):
+                return plotly_chart(figura, *args, **kwargs)
+
+        st.plotly_chart = plotly_chart_medido
+
+        if not logger.handlers:
+            destino = os.environ.get("DASHBOARD_PROFILER_LOG")
+            handler = logging.FileHandler(destino, encoding="utf-8") if destino else logging.StreamHandler(sys.stderr)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+
+    # ------------------------------------------------------------------ resultados
+
+    def _registrar(self, execucao: _Execucao, duracao: float):
+        """Guarda o resumo do rerun no histórico e escreve a linha do log."""
+        resumo = {
+            "evento": "rerun",
+            "momento": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "pagina": execucao.pagina,
+            "duracao_s": round(duracao, 6),
+            "categorias": {c: round(t, 6) for c, t in execucao.categorias.items()},
+            "chamadas": [
+                {"categoria": categoria, "nome": nome, "chamadas": chamadas, "tempo_s": round(tempo, 6)}
+                for (categoria, nome), (chamadas, tempo) in sorted(
+                    execucao.chamadas.items(), key=lambda item: item[1][1], reverse=True
+                )
+            ],
+        }
+        with self._lock:
+            self._historico.append(resumo)
+        logger.info(json.dumps({**resumo, "chamadas": resumo["chamadas"][:TOP_LOG]}, ensure_ascii=False))
+
+    def execucoes(self) -> list:
+        """Retorna os resumos dos reruns guardados, do mais antigo ao mais recente."""
+        with self._lock:
+            return list(self._historico)
+
+    def agregado(self) -> pd.DataFrame:
+        """Agrega todas as execuções guardadas por (categoria, nome).
+
+        Colunas: categoria, nome, reruns (em quantos apareceu), chamadas,
+        tempo_total_s, tempo_medio_s (por chamada) e tempo_max_s (maior soma em um rerun).
+        """
+        linhas = [chamada for execucao in self.execucoes() for chamada in execucao["chamadas"]]
+        colunas = ["categoria", "nome", "reruns", "chamadas", "tempo_total_s", "tempo_medio_s", "tempo_max_s"]
+        if not linhas:
+            return pd.DataFrame(columns=colunas)
+
+        agregado = (
+            pd.DataFrame(linhas)
+            .groupby(["categoria", "nome"])
+            .agg(
+                reruns=("tempo_s", "size"),
+                chamadas=("chamadas", "sum"),
+                tempo_total_s=("tempo_s", "sum"),
+                tempo_max_s=("tempo_s", "max"),
+            )
+            .reset_index()
+        )
+        agregado["tempo_medio_s"] = agregado["tempo_total_s"] / agregado["chamadas"]
+        return agregado.sort_values("tempo_total_s", ascending=False)[colunas].reset_index(drop=True)
+
+    def limpar(self):
+        """Descarta o histórico de execuções."""
+        with self._lock:
+            self._historico.clear()
+
+
+PROFILER = RenderProfiler(ativo=os.environ.get("DASHBOARD_PROFILER", "0") == "1")
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+# Valor de cada resposta quando o dataset não tem `VALOR_RESPOSTA` (ex.: institucional).
+VALORES_RESPOSTA = {'Concordo': 1, 'Discordo': -1, 'Desconheço': 0}
+
+# Marca as linhas sem valor de resposta no vetor int8 de valores.
+SEM_VALOR = np.iinfo(np.int8).min
+
+
+class RespondentSentiment:
+    """Sentimento por respondente (`ID_PESQUISA`) com reduções vetorizadas.
+
+    Guarda, para cada linha do dataset, o código do respondente e o valor da
+    resposta (-1 discordância, 0 desconhecimento, 1 concordância). `tabela`
+    agrega todas as linhas, ou só as posições de um filtro (ver
+    `FilterIndex.posicoes`), com `np.bincount`: sem `groupby`, sem funções
+    Python por respondente e sem copiar ou alterar o DataFrame.
+    """
+
+    COLUNAS = ['ID_PESQUISA', 'n_answers', 'mean_sentiment', 'pct_negative', 'pct_unknown']
+
+    def __init__(self, ids: np.ndarray, codigos: np.ndarray, valores: np.ndarray):
+        self.ids = ids
+        self.codigos = codigos
+        self.valores = valores
+        self._completa = None
+
+    @classmethod
+    def construir(cls, df: pd.DataFrame) -> "RespondentSentiment":
+        """Codifica os respondentes e os valores das respostas de `df`.
+
+        Usa `VALOR_RESPOSTA` quando existir; senão, `RESPOSTA` mapeada por
+        `VALORES_RESPOSTA` (respostas fora do mapa ficam sem valor).
+        """
+        codigos, ids = pd.factorize(df['ID_PESQUISA'], sort=True)
+
+        if 'VALOR_RESPOSTA' in df.columns:
+            coluna = df['VALOR_RESPOSTA']
+            if coluna.dtype == np.int8:
+                valores = coluna.to_numpy()
+            else:
+                valores = coluna.fillna(SEM_VALOR).to_numpy(dtype=np.int8)
+        else:
+            respostas = df['RESPOSTA'].astype('category')
+            tabela = np.array(
+                [VALORES_RESPOSTA.get(c, SEM_VALOR) for c in respostas.cat.categories] + [SEM_VALOR], dtype=np.int8
+            )
+            # Código -1 (resposta ausente) cai na última posição, SEM_VALOR.
+            valores = tabela[respostas.cat.codes.to_numpy()]
+
+        return cls(np.asarray(ids), codigos.astype(np.int32), valores)
+
+    def tabela(self, posicoes: np.ndarray | None = None) -> pd.DataFrame:
+        """Retorna uma linha por respondente presente nas `posicoes` (None: todas as linhas).
+
+        Colunas: `ID_PESQUISA`, `n_answers` (respostas com valor), `mean_sentiment`
+        (média dos valores) e as frações `pct_negative` (-1) e `pct_unknown` (0)
+        dessas respostas. A tabela completa é calculada uma única vez.
+        """
+        if posicoes is None and self._completa is not None:
+            return self._completa
+
+        codigos = self.codigos if posicoes is None else self.codigos[posicoes]
+        valores = self.valores if posicoes is None else self.valores[posicoes]
+        n = len(self.ids)
+
+        validas = valores != SEM_VALOR
+        codigos_validos = codigos[validas]
+        valores_validos = valores[validas]
+
+        linhas = np.bincount(codigos, minlength=n)
+        respostas = np.bincount(codigos_validos, minlength=n)
+        soma = np.bincount(codigos_validos, weights=valores_validos, minlength=n)
+        negativas = np.bincount(codigos_validos[valores_validos == -1], minlength=n)
+        desconhecidas = np.bincount(codigos_validos[valores_validos == 0], minlength=n)
+
+        presentes = np.flatnonzero(linhas)
+        respostas = respostas[presentes]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            tabela = pd.DataFrame({
+                'ID_PESQUISA': self.ids[presentes],
+                'n_answers': respostas,
+                'mean_sentiment': soma[presentes] / respostas,
+                'pct_negative': negativas[presentes] / respostas,
+                'pct_unknown': desconhecidas[presentes] / respostas,
+            })
+
+        if posicoes is None:
+            self._completa = tabela
+        return tabela
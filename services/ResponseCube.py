@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+# Dimensões pelas quais os gráficos e métricas agrupam as respostas.
+DIMENSOES_CUBO = [
+    'EIXO_NOME',
+    'DIMENSAO_NOME',
+    'PERGUNTA',
+    'CURSO',
+    'SETOR_CURSO',
+    'NOME_DISCIPLINA',
+    'UNIDADE GESTORA',
+]
+
+
+def filtro_nulo(valor) -> bool:
+    """Indica se o valor de filtro `valor` seleciona as linhas sem valor na coluna (NaN, pd.NA...)."""
+    return valor is not None and not isinstance(valor, (list, tuple, set)) and bool(pd.isna(valor))
+
+
+def mascara_filtros(df: pd.DataFrame, filtros: dict | None = None) -> np.ndarray:
+    """Retorna a máscara booleana das linhas de `df` que atendem aos filtros.
+
+    `filtros` mapeia coluna -> valor (igualdade) ou lista de valores (`isin`).
+    Um valor nulo (NaN) seleciona as linhas sem valor na coluna (ver
+    `filtro_nulo`). Filtros com valor None são ignorados.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for coluna, valor in (filtros or {}).items():
+        if valor is None:
+            continue
+        if isinstance(valor, (list, tuple, set)):
+            valores = [v for v in valor if not filtro_nulo(v)]
+            selecionadas = df[coluna].isin(valores).to_numpy()
+            if len(valores) < len(valor):
+                selecionadas |= df[coluna].isna().to_numpy()
+            mask &= selecionadas
+        elif filtro_nulo(valor):
+            mask &= df[coluna].isna().to_numpy()
+        else:
+            mask &= (df[coluna] == valor).to_numpy()
+
+    return mask
+
+
+class ResponseCube:
+    """Cubo pré-agregado com a contagem de respostas por combinação de dimensões.
+
+    Cada linha de `contagens` é uma combinação observada das dimensões do
+    dataset (ver `DIMENSOES_CUBO`) mais `RESPOSTA` (e `VALOR_RESPOSTA`, quando
+    existir), com a quantidade de linhas na coluna `COUNT`. As consultas
+    filtram e somam o cubo, sem voltar ao DataFrame linha a linha.
+    """
+
+    def __init__(self, contagens: pd.DataFrame, dimensoes: list):
+        self.contagens = contagens
+        self.dimensoes = dimensoes
+
+    @classmethod
+    def construir(cls, df: pd.DataFrame, dimensoes: list | None = None) -> "ResponseCube":
+        """Agrega `df` (nível de resposta) no cubo de contagens."""
+        dimensoes = [d for d in (dimensoes or DIMENSOES_CUBO) if d in df.columns]
+        chaves = dimensoes + [c for c in ['RESPOSTA', 'VALOR_RESPOSTA'] if c in df.columns]
+
+        contagens = (
+            df.groupby(chaves, observed=True, dropna=False)
+            .size()
+            .reset_index(name='COUNT')
+        )
+        return cls(contagens, dimensoes)
+
+    @classmethod
+    def ler(cls, path: str) -> "ResponseCube":
+        """Lê um cubo persistido em Parquet."""
+        contagens = pd.read_parquet(path)
+        dimensoes = [d for d in DIMENSOES_CUBO if d in contagens.columns]
+        return cls(contagens, dimensoes)
+
+    def somar(self, outro: "ResponseCube") -> "ResponseCube":
+        """Retorna um cubo com as contagens deste cubo somadas às de `outro`.
+
+        Usado na ingestão incremental: o cubo das respostas novas é somado ao
+        cubo persistido, sem reagregar o histórico.
+        """
+        chaves = [c for c in self.contagens.columns if c != 'COUNT']
+        contagens = (
+            pd.concat([self.contagens, outro.contagens[self.contagens.columns]], ignore_index=True)
+            .groupby(chaves, observed=True, dropna=False)['COUNT']
+            .sum()
+            .reset_index()
+        )
+        for coluna in chaves:
+            if isinstance(self.contagens[coluna].dtype, pd.CategoricalDtype):
+                contagens[coluna] = contagens[coluna].astype('category')
+
+        return ResponseCube(contagens, self.dimensoes)
+
+    def salvar(self, path: str):
+        """Persiste o cubo em Parquet."""
+        self.contagens.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+
+    def filtrar(self, filtros: dict | None = None) -> pd.DataFrame:
+        """Retorna as linhas do cubo que atendem aos filtros (ver `mascara_filtros`)."""
+        df = self.contagens
+        if not filtros:
+            return df
+
+        return df[mascara_filtros(df, filtros)]
+
+    def contagens_por(self, por: list | None = None, filtros: dict | None = None) -> pd.DataFrame:
+        """Retorna a contagem de respostas agrupada por `por` + `RESPOSTA`.
+
+        O resultado tem as colunas `por`, `RESPOSTA` e `COUNT`.
+        """
+        chaves = list(por or []) + ['RESPOSTA']
+        return (
+            self.filtrar(filtros)
+            .groupby(chaves, observed=True)['COUNT']
+            .sum()
+            .reset_index()
+        )
+
+    def percentuais_por(self, coluna: str, filtros: dict | None = None) -> pd.DataFrame:
+        """Retorna o percentual de cada `RESPOSTA` (colunas) por valor de `coluna` (índice).
+
+        Cada linha soma 100. Retorna um DataFrame vazio se nada atender aos filtros.
+        """
+        contagens = self.contagens_por([coluna], filtros)
+        if contagens.empty:
+            return pd.DataFrame()
+
+        tabela = (
+            contagens.astype({coluna: str, 'RESPOSTA': str})
+            .pivot(index=coluna, columns='RESPOSTA', values='COUNT')
+            .fillna(0)
+        )
+        return tabela.div(tabela.sum(axis=1), axis=0) * 100
+
+    def frequencias(self, por: list, filtros: dict | None = None) -> pd.DataFrame:
+        """Retorna a frequência absoluta de cada `RESPOSTA` (colunas) por combinação de `por`.
+
+        Tem uma linha por combinação observada, as colunas `por`, uma coluna por
+        resposta e o `TOTAL` da linha.
+        """
+        contagens = self.contagens_por(por, filtros)
+        if contagens.empty:
+            return pd.DataFrame(columns=list(por) + ['TOTAL'])
+
+        tabela = contagens.astype({'RESPOSTA': str}).pivot_table(
+            index=por, columns='RESPOSTA', values='COUNT', aggfunc='sum', fill_value=0, observed=True
+        )
+        tabela.columns.name = None
+        tabela['TOTAL'] = tabela.sum(axis=1)
+        return tabela.reset_index()
+
+    def contagem_por(self, coluna: str, filtros: dict | None = None) -> pd.Series:
+        """Retorna uma Series coluna -> total de respostas para os filtros."""
+        return self.filtrar(filtros).groupby(coluna, observed=True)['COUNT'].sum()
+
+    def total(self, filtros: dict | None = None) -> int:
+        """Retorna o total de respostas que atendem aos filtros."""
+        return int(self.filtrar(filtros)['COUNT'].sum())
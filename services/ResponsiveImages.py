@@ -0,0 +1,233 @@
+import hashlib
+import html
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from PIL import Image
+
+# Imagens originais (PNG) e pasta servida pelo Streamlit em `app/static/`
+# (requer `server.enableStaticServing`, ver .streamlit/config.toml).
+PASTA_ORIGEM = os.path.join("data", "imgs")
+PASTA_DESTINO = os.path.join("static", "imgs")
+URL_DESTINO = "app/static/imgs"
+ARQUIVO_MANIFESTO = "manifest.json"
+
+# Larguras geradas (px); nenhuma passa da largura da original.
+LARGURAS = (480, 960, 1440, 1920)
+
+# Formato -> opções do encoder do Pillow, em ordem de preferência do <picture>.
+FORMATOS = {
+    "avif": {"quality": 50, "speed": 6},
+    "webp": {"quality": 80, "method": 6},
+}
+
+# Formatos que o `app/static/` do Streamlit serve com o Content-Type correto: os
+# demais (ex.: .avif) saem como text/plain com `nosniff` e o navegador os recusa.
+FORMATOS_APP_STATIC = ("webp",)
+
+# Formatos gerados por padrão. O AVIF (lento de codificar e não servido pelo
+# `app/static/`) só é gerado com `--avif` ou DASHBOARD_IMAGENS_AVIF=1, para
+# quem serve `static/imgs` por outro servidor.
+FORMATOS_GERADOS = tuple(
+    formato for formato in FORMATOS
+    if formato in FORMATOS_APP_STATIC or (formato == "avif" and os.environ.get("DASHBOARD_IMAGENS_AVIF") == "1")
+)
+
+# Formato e largura do <img> de fallback (navegadores sem suporte a <source>).
+FORMATO_FALLBACK = "webp"
+LARGURA_FALLBACK = 960
+
+logger = logging.getLogger("dashboard.imagens")
+
+
+def _hash(conteudo: bytes) -> str:
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def _gravar(caminho: str, conteudo: bytes):
+    """Grava `conteudo` em `caminho` por um arquivo temporário (troca atômica)."""
+    temporario = f"{caminho}.tmp{os.getpid()}"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+class ResponsiveImages:
+    """Variantes redimensionadas (WebP e, opcionalmente, AVIF) das imagens da Home e seu manifesto.
+
+    `gerar` codifica cada PNG de `origem` em cada largura de `LARGURAS` e nos
+    formatos pedidos (padrão: `FORMATOS_GERADOS`), com o hash do conteúdo no nome do arquivo (o navegador pode
+    guardá-lo sem revalidar), e grava o manifesto (imagem -> dimensões e
+    variantes). Imagens cuja original não mudou reaproveitam as variantes já
+    geradas. `picture` monta o `<picture>` com um `srcset` por formato, para o
+    navegador baixar só a menor variante que cobre a largura exibida.
+    """
+
+    def __init__(self, origem: str = PASTA_ORIGEM, destino: str = PASTA_DESTINO, url: str = URL_DESTINO):
+        self.origem = origem
+        self.destino = destino
+        self.url = url
+        self._manifesto = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ geração
+
+    def _manifesto_gravado(self) -> dict:
+        try:
+            with open(os.path.join(self.destino, ARQUIVO_MANIFESTO), encoding="utf-8") as arquivo:
+                return json.load(arquivo)
+        except (OSError, ValueError):
+            return {"imagens": {}}
+
+    def _atual(self, entrada: dict | None, hash_origem: str, formatos: tuple) -> bool:
+        """Indica se `entrada` do manifesto foi gerada da mesma original e tem os arquivos de `formatos`."""
+        if not entrada or entrada.get("origem") != hash_origem or not set(formatos) <= set(entrada["variantes"]):
+            return False
+        return all(
+            os.path.exists(os.path.join(self.destino, variante["arquivo"]))
+            for formato in formatos for variante in entrada["variantes"][formato]
+        )
+
+    def _codificar(self, nome: str, imagem: Image.Image, formatos: tuple) -> dict:
+        """Gera as variantes de `imagem` em `formatos` e retorna {formato: [{largura, arquivo, bytes}]}."""
+        base = os.path.splitext(nome)[0]
+        larguras = sorted({min(largura, imagem.width) for largura in LARGURAS})
+        variantes = {formato: [] for formato in formatos}
+
+        for largura in larguras:
+            altura = round(imagem.height * largura / imagem.width)
+            redimensionada = imagem if largura == imagem.width else imagem.resize((largura, altura), Image.LANCZOS)
+            for formato in formatos:
+                buffer = io.BytesIO()
+                redimensionada.save(buffer, format=formato.upper(), **FORMATOS[formato])
+                conteudo = buffer.getvalue()
+                arquivo = f"{base}-{largura}.{_hash(conteudo)[:10]}.{formato}"
+                _gravar(os.path.join(self.destino, arquivo), conteudo)
+                variantes[formato].append({"largura": largura, "arquivo": arquivo, "bytes": len(conteudo)})
+        return variantes
+
+    def gerar(self, forcar: bool = False, formatos: tuple | None = None) -> dict:
+        """Gera as variantes que faltam e grava o manifesto; remove as variantes que sobraram.
+
+        `formatos` são os formatos gerados (padrão: `FORMATOS_GERADOS`; o
+        do fallback é sempre incluído). Com `forcar`, todas as imagens são
+        codificadas de novo.
+        """
+        formatos = tuple(f for f in FORMATOS if f in (formatos or FORMATOS_GERADOS) or f == FORMATO_FALLBACK)
+        os.makedirs(self.destino, exist_ok=True)
+        anterior = {} if forcar else self._manifesto_gravado()["imagens"]
+        imagens = {}
+
+        for nome in sorted(os.listdir(self.origem)):
+            if not nome.lower().endswith((".png", ".jpg", ".jpeg")):
+                continue
+            with open(os.path.join(self.origem, nome), "rb") as arquivo:
+                conteudo = arquivo.read()
+            hash_origem = _hash(conteudo)[:16]
+
+            if self._atual(anterior.get(nome), hash_origem, formatos):
+                entrada = anterior[nome]
+                imagens[nome] = {**entrada, "variantes": {f: entrada["variantes"][f] for f in formatos}}
+                continue
+
+            inicio = time.perf_counter()
+            with Image.open(io.BytesIO(conteudo)) as imagem:
+                imagem = imagem.convert("RGBA" if imagem.has_transparency_data else "RGB")
+                imagens[nome] = {
+                    "origem": hash_origem,
+                    "largura": imagem.width,
+                    "altura": imagem.height,
+                    "bytes_origem": len(conteudo),
+                    "variantes": self._codificar(nome, imagem, formatos),
+                }
+            logger.info("%s codificada em %.1fs", nome, time.perf_counter() - inicio)
+
+        manifesto = {"imagens": imagens}
+        _gravar(
+            os.path.join(self.destino, ARQUIVO_MANIFESTO),
+            json.dumps(manifesto, indent=2, ensure_ascii=False).encode("utf-8"),
+        )
+
+        usados = {ARQUIVO_MANIFESTO} | {
+            variante["arquivo"]
+            for entrada in imagens.values() for variantes in entrada["variantes"].values() for variante in variantes
+        }
+        for arquivo in os.listdir(self.destino):
+            if arquivo not in usados:
+                os.remove(os.path.join(self.destino, arquivo))
+        return manifesto
+
+    # ------------------------------------------------------------------ leitura
+
+    def manifesto(self) -> dict:
+        """Retorna o manifesto gravado (relido só quando o arquivo muda); vazio se não existir."""
+        caminho = os.path.join(self.destino, ARQUIVO_MANIFESTO)
+        try:
+            mtime = os.stat(caminho).st_mtime_ns
+        except OSError:
+            return {"imagens": {}}
+
+        with self._lock:
+            if mtime != self._mtime:
+                self._manifesto = self._manifesto_gravado()
+                self._mtime = mtime
+            return self._manifesto
+
+    def disponivel(self, nomes: list) -> bool:
+        """Indica se todas as imagens `nomes` têm variantes no manifesto."""
+        imagens = self.manifesto()["imagens"]
+        return all(nome in imagens for nome in nomes)
+
+    def picture(
+        self, nome: str, alt: str = "", sizes: str = "100vw", prioridade: bool = False, formatos: tuple | None = None
+    ) -> str:
+        """Retorna o `<picture>` da imagem `nome` (uma linha de HTML).
+
+        `formatos` limita os `<source>` (padrão: todos os gerados, na ordem de
+        preferência de `FORMATOS`). Com `prioridade`, a imagem é baixada de imediato
+        (`fetchpriority=high`); sem, só quando estiver perto de aparecer (`loading=lazy`).
+        """
+        entrada = self.manifesto()["imagens"][nome]
+        fontes = "".join(
+            f'<source type="image/{formato}" srcset="{self._srcset(entrada, formato)}" sizes="{sizes}">'
+            for formato in FORMATOS
+            if formato in entrada["variantes"] and (formatos is None or formato in formatos)
+        )
+        fallback = min(
+            entrada["variantes"][FORMATO_FALLBACK],
+            key=lambda variante: abs(variante["largura"] - LARGURA_FALLBACK),
+        )
+        carregamento = 'loading="eager" fetchpriority="high"' if prioridade else 'loading="lazy"'
+        return (
+            f"<picture>{fontes}"
+            f'<img src="{self.url}/{fallback["arquivo"]}" width="{entrada["largura"]}" height="{entrada["altura"]}" '
+            f'alt="{html.escape(alt)}" decoding="async" {carregamento}>'
+            f"</picture>"
+        )
+
+    def _srcset(self, entrada: dict, formato: str) -> str:
+        return ", ".join(f'{self.url}/{v["arquivo"]} {v["largura"]}w' for v in entrada["variantes"][formato])
+
+
+IMAGENS = ResponsiveImages()
+
+
+if __name__ == "__main__":
+    # python -m services.ResponsiveImages [--forcar] [--avif] -> gera as variantes de data/imgs em static/imgs
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    inicio = time.perf_counter()
+    formatos = tuple(FORMATOS) if "--avif" in sys.argv else FORMATOS_GERADOS
+    manifesto = IMAGENS.gerar(forcar="--forcar" in sys.argv, formatos=formatos)
+    for nome, entrada in manifesto["imagens"].items():
+        tamanhos = ", ".join(
+            f"{formato} {min(v['bytes'] for v in variantes) // 1024}-{max(v['bytes'] for v in variantes) // 1024} KB"
+            for formato, variantes in entrada["variantes"].items()
+        )
+        print(f"{nome} ({entrada['bytes_origem'] // 1024} KB) -> {tamanhos}")
+    print(f"Manifesto em {os.path.join(IMAGENS.destino, ARQUIVO_MANIFESTO)} ({time.perf_counter() - inicio:.1f}s)")
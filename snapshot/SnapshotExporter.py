@@ -0,0 +1,337 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import plotly
+
+from api.MetricsAPI import MetricsAPI, json_padrao, metricas_json
+from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+from services.FigureCache import FiguraSerializada
+
+# Seleções (opções do seletor principal) exportadas por tarefa de um processo.
+TAMANHO_LOTE = int(os.environ.get("DASHBOARD_SNAPSHOT_LOTE") or 200)
+
+VISUALIZADOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.html")
+
+
+def _opcoes_institucional(servico) -> list:
+    """Eixos do seletor da view como (rótulo, eixo)."""
+    return [(eixo, eixo) for eixo in servico.formatar_eixos()]
+
+
+def _filtros_eixo(servico, eixo: str) -> dict:
+    """Filtros da view com um eixo de `formatar_eixos` e todas as perguntas."""
+    return {"eixos_value": [eixo], "perguntas_value": ["Todos"]}
+
+
+def _opcoes_cursos(servico) -> list:
+    """Opções do seletor da view como (rótulo, ID de `opcoes_curso_setor`; None: todos)."""
+    indice = servico.opcoes_curso_setor()
+    return [("Todos os cursos", None)] + [(indice.rotulo(opcao_id), opcao_id) for opcao_id in indice.ids()]
+
+
+def _opcoes_disciplinas(servico) -> list:
+    """Opções do seletor da view como (rótulo, ID de `opcoes_disciplina_curso_setor`; None: todas)."""
+    indice = servico.opcoes_disciplina_curso_setor()
+    return [("Todas as disciplinas", None)] + [(indice.rotulo(opcao_id), opcao_id) for opcao_id in indice.ids()]
+
+
+def _dimensoes_institucional(servico) -> list:
+    """Dimensões como no seletor da view ('N - NOME' -> NOME)."""
+    df = servico.df_load_dados_institucional[['DIMENSAO_NUM', 'DIMENSAO_NOME']].drop_duplicates().sort_values('DIMENSAO_NUM')
+    return [(f"{int(row.DIMENSAO_NUM)} - {row.DIMENSAO_NOME}", row.DIMENSAO_NOME) for row in df.itertuples()]
+
+
+def _dimensoes_cursos(servico) -> list:
+    return [(str(dimensao), dimensao) for dimensao in servico.df['DIMENSAO_NOME'].unique().tolist()]
+
+
+def _dimensoes_disciplinas(servico) -> list:
+    dimensoes = servico.df_disciplinas()[['DIMENSAO_NUM', 'DIMENSAO_NOME']].drop_duplicates()['DIMENSAO_NOME']
+    return [(str(dimensao), int(dimensao)) for dimensao in dimensoes.tolist()]
+
+
+# Avaliação -> como percorrer a view: serviço, grupos
+# (filtros fixos, ex.: Presencial/EAD), opções do seletor principal como
+# (rótulo, opção), os filtros de cada opção e o método que os resolve no filtro
+# efetivo do cubo (opções com o mesmo filtro efetivo têm o mesmo resultado), dimensões (rótulo, valor) e os gráficos (nome -> método) gerais e de cada seleção.
+VISOES = {
+    "institucional": {
+        "classe": AvaliacaoInstitucionalService,
+        "grupos": {"geral": {}},
+        "padrao": {"eixos_value": None, "perguntas_value": None, "dimensao_value": None},
+        "opcoes": _opcoes_institucional,
+        "filtros": _filtros_eixo,
+        "filtro_efetivo": "_filtros_eixo_pergunta",
+        "dimensoes": _dimensoes_institucional,
+        "figuras_gerais": {"top10": "grafico_donut_top10"},
+        "figuras_selecao": {
+            "distribuicao": "grafico_distribuicao_total_donut",
+            "eixos": "grafico_resumo_por_eixo",
+            "unidades": "grafico_barra_unidade_gestora",
+        },
+    },
+    "cursos": {
+        "classe": AvaliacaoDosCursosService,
+        "grupos": {"geral": {}},
+        "padrao": {"curso_value": "Todos", "setor_value": "Todos", "dimensao_value": None},
+        "opcoes": _opcoes_cursos,
+        "filtros": AvaliacaoDosCursosService.filtros_do_id,
+        "filtro_efetivo": "_filtros_curso",
+        "dimensoes": _dimensoes_cursos,
+        "figuras_gerais": {},
+        "figuras_selecao": {"distribuicao": "grafico_distribuicao_total_donut", "eixos": "grafico_resumo_por_eixo"},
+    },
+    "disciplinas": {
+        "classe": AvaliacaoDasDisciplinasService,
+        "grupos": {tipo: {"tipo_disciplina_value": tipo} for tipo in ("Presencial", "EAD")},
+        "padrao": {"disciplina_value": "Todas", "curso_value": "Todas", "setor_value": "Todas", "dimensao_value": None},
+        "opcoes": _opcoes_disciplinas,
+        "filtros": AvaliacaoDasDisciplinasService.filtros_do_id,
+        "filtro_efetivo": "_filtros_disciplina_curso_setor",
+        "dimensoes": _dimensoes_disciplinas,
+        "figuras_gerais": {"sentimento": "grafico_distribuicao_geral_sentimento"},
+        "figuras_selecao": {
+            "distribuicao": "grafico_distribuicao_total_donut",
+            "eixos": "grafico_resumo_por_eixo",
+            "setor": "grafico_donut_setor",
+            "curso": "grafico_donut_curso",
+        },
+    },
+}
+
+# Serviços já carregados neste processo, por (avaliação, período).
+_SERVICOS = {}
+
+
+def _slug(texto: str) -> str:
+    """Nome de arquivo estável para um texto qualquer (rótulo ou chave de seleção)."""
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()[:16]
+
+
+def _gravar(destino: str, caminho: str, texto: str):
+    """Grava `texto` em `destino/caminho` de forma atômica."""
+    completo = os.path.join(destino, caminho)
+    os.makedirs(os.path.dirname(completo), exist_ok=True)
+    temporario = f"{completo}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write(texto)
+    os.replace(temporario, completo)
+
+
+def _gravar_json(destino: str, caminho: str, corpo) -> str:
+    _gravar(destino, caminho, json.dumps(corpo, ensure_ascii=False, default=json_padrao))
+    return caminho
+
+
+class SnapshotExporter:
+    """Exporta todas as seleções das views para um pacote estático (JSON + visualizador HTML).
+
+    Para cada avaliação, período e grupo, percorre as opções dos seletores
+    (`formatar_eixos`, `opcoes_curso_setor`, `opcoes_disciplina_curso_setor`,
+    resolvidas pelo ID com `filtros_do_id`) e as listas de dimensões, e grava as métricas (com o ano anterior) e as
+    especificações Plotly das figuras que a view mostraria. As seleções são
+    divididas em lotes executados em processos separados e agrupadas pelo
+    filtro efetivo da view (`filtro_efetivo` em `VISOES`): opções que
+    resolvem no mesmo filtro são calculadas uma vez e apontam para o mesmo
+    arquivo (cada combinação curso/setor e disciplina/curso/setor tem filtro
+    próprio, então lá cada opção gera uma seleção). As figuras são gravadas
+    uma vez por conteúdo (`figuras/<sha1>.json`), já que muitas seleções
+    compartilham a mesma (ex.: o saldo de uma dimensão, que não depende do
+    curso selecionado).
+
+    O pacote pode ser servido por qualquer servidor de arquivos estáticos:
+
+        destino/index.html             visualizador
+        destino/manifesto.json         avaliação -> período -> grupo -> índice
+        destino/<aval>/<periodo>/<grupo>/indice.json
+        destino/<aval>/<periodo>/<grupo>/{geral,selecoes/*,dimensoes/*}.json
+        destino/figuras/<xx>/<sha1>.json
+    """
+
+    def __init__(self, destino: str, avaliacoes: list | None = None, processos: int | None = None,
+                 tamanho_lote: int = TAMANHO_LOTE, periodos: list | None = None, max_selecoes: int | None = None):
+        self.destino = os.path.abspath(destino)
+        self.avaliacoes = avaliacoes or list(VISOES)
+        self.periodos = periodos
+        self.max_selecoes = max_selecoes
+        self.processos = processos or os.cpu_count() or 1
+        self.tamanho_lote = tamanho_lote
+
+    @staticmethod
+    def _servico(avaliacao: str, periodo: str, grupo: str):
+        """Serviço do processo atual para (avaliação, período), com os filtros do grupo aplicados."""
+        servico = _SERVICOS.get((avaliacao, periodo))
+        if servico is None:
+            servico = VISOES[avaliacao]["classe"](periodo=periodo)
+            _SERVICOS[(avaliacao, periodo)] = servico
+        visao = VISOES[avaliacao]
+        servico.atualizar_filtros(**visao["grupos"][grupo], **visao["padrao"])
+        return servico
+
+    def _selecoes(self, servico, visao: dict) -> list:
+        """Agrupa as opções do seletor pelo filtro efetivo; retorna [(chave, opção, rótulos)].
+
+        A chave combina `_versao_dados()` e o filtro efetivo: opções com a mesma
+        chave mostram as mesmas métricas e figuras. Com `max_selecoes`, só as
+        primeiras seleções distintas são mantidas.
+        """
+        versao = servico._versao_dados()
+        selecoes = {}
+        for rotulo, opcao in visao["opcoes"](servico):
+            servico.atualizar_filtros(**visao["filtros"](servico, opcao))
+            filtro = getattr(servico, visao["filtro_efetivo"])()
+            chave = f"{versao}:{json.dumps(filtro, sort_keys=True, ensure_ascii=False, default=str)}"
+            if chave not in selecoes:
+                if self.max_selecoes is not None and len(selecoes) >= self.max_selecoes:
+                    continue
+                selecoes[chave] = (opcao, [])
+            selecoes[chave][1].append(rotulo)
+        servico.atualizar_filtros(**visao["padrao"])
+        return [(chave, opcao, rotulos) for chave, (opcao, rotulos) in selecoes.items()]
+
+    def tarefas(self) -> list:
+        """Divide o trabalho em tarefas (avaliação, período, grupo, parte, itens).
+
+        `parte` é "geral", "dimensoes" (itens: rótulos) ou "selecoes" (itens:
+        seleções distintas de `_selecoes`); as seleções vão em lotes de
+        `tamanho_lote`. Só entram os `periodos` pedidos (padrão: todos).
+        """
+        tarefas = []
+        for avaliacao in self.avaliacoes:
+            visao = VISOES[avaliacao]
+            for periodo in MetricsAPI.periodos(avaliacao):
+                if self.periodos is not None and periodo not in self.periodos:
+                    continue
+                for grupo in visao["grupos"]:
+                    servico = self._servico(avaliacao, periodo, grupo)
+                    selecoes = self._selecoes(servico, visao)
+                    tarefas.append((avaliacao, periodo, grupo, "geral", []))
+                    tarefas.append((avaliacao, periodo, grupo, "dimensoes", [r for r, _ in visao["dimensoes"](servico)]))
+                    for inicio in range(0, len(selecoes), self.tamanho_lote):
+                        tarefas.append((avaliacao, periodo, grupo, "selecoes", selecoes[inicio:inicio + self.tamanho_lote]))
+        _SERVICOS.clear()
+        return tarefas
+
+    def _figura(self, resultado) -> str | None:
+        """Grava a figura de `resultado` (figura ou tupla com uma) e retorna o caminho relativo."""
+        if isinstance(resultado, tuple):
+            resultado = next((item for item in resultado if isinstance(item, FiguraSerializada)), None)
+        if resultado is None:
+            return None
+
+        chave = hashlib.sha1(resultado.json.encode("utf-8")).hexdigest()
+        caminho = f"figuras/{chave[:2]}/{chave}.json"
+        if not os.path.exists(os.path.join(self.destino, caminho)):
+            _gravar(self.destino, caminho, resultado.json)
+        return caminho
+
+    def _figuras(self, servico, metodos: dict) -> dict:
+        """Grava as figuras dos `metodos` (nome -> método `grafico_*`) pelo cache de figuras, já em JSON."""
+        return {
+            nome: self._figura(getattr(type(servico), metodo).serializado(servico))
+            for nome, metodo in metodos.items()
+        }
+
+    def executar_tarefa(self, tarefa: tuple) -> tuple:
+        """Exporta uma tarefa; retorna (tarefa, {rótulo: caminho}) (ou o caminho, para "geral")."""
+        avaliacao, periodo, grupo, parte, itens = tarefa
+        visao = VISOES[avaliacao]
+        servico = self._servico(avaliacao, periodo, grupo)
+        base = f"{avaliacao}/{periodo.replace('/', '-')}/{grupo}"
+
+        if parte == "geral":
+            corpo = {
+                "metricas": metricas_json(servico.metricas_filtradas()),
+                "ano_passado": metricas_json(servico.metricas_ano_passado()),
+                "figuras": self._figuras(servico, visao["figuras_gerais"]),
+            }
+            return tarefa, _gravar_json(self.destino, f"{base}/geral.json", corpo)
+
+        caminhos = {}
+        if parte == "dimensoes":
+            valores = dict(visao["dimensoes"](servico))
+            for rotulo in itens:
+                servico.atualizar_filtros(dimensao_value=valores[rotulo])
+                saldo = servico.saldo_opiniao_dimensao()
+                corpo = {
+                    "rotulo": rotulo,
+                    "perguntas": [] if saldo is None else [
+                        {"pergunta": pergunta, "percentuais": percentuais}
+                        for pergunta, percentuais in zip(saldo.index, saldo.to_dict("records"))
+                    ],
+                    "figuras": self._figuras(servico, {"saldo": "grafico_saldo_opiniao_dimensao"}),
+                }
+                caminhos[rotulo] = _gravar_json(self.destino, f"{base}/dimensoes/{_slug(rotulo)}.json", corpo)
+            return tarefa, caminhos
+
+        for chave, opcao, rotulos in itens:
+            filtros = visao["filtros"](servico, opcao)
+            servico.atualizar_filtros(**filtros)
+            corpo = {
+                "rotulos": rotulos,
+                "filtros": filtros,
+                "metricas": metricas_json(servico.metricas_filtradas()),
+                "ano_passado": metricas_json(servico.metricas_filtradas_ano_passado()),
+                "figuras": self._figuras(servico, visao["figuras_selecao"]),
+            }
+            caminho = _gravar_json(self.destino, f"{base}/selecoes/{_slug(chave)}.json", corpo)
+            caminhos.update(dict.fromkeys(rotulos, caminho))
+        return tarefa, caminhos
+
+    def exportar(self) -> dict:
+        """Gera o pacote completo em `destino` e retorna o manifesto.
+
+        O pacote é montado em `<destino>.tmp` e só então substitui o anterior.
+        """
+        final = self.destino
+        self.destino = f"{final}.tmp"
+        shutil.rmtree(self.destino, ignore_errors=True)
+        inicio = time.perf_counter()
+        try:
+            tarefas = self.tarefas()
+            indices = {}
+            with ProcessPoolExecutor(max_workers=self.processos) as executor:
+                for (avaliacao, periodo, grupo, parte, _), resultado in executor.map(self.executar_tarefa, tarefas):
+                    indice = indices.setdefault((avaliacao, periodo, grupo), {"geral": None, "selecoes": {}, "dimensoes": {}})
+                    if parte == "geral":
+                        indice["geral"] = resultado
+                    else:
+                        indice[parte].update(resultado)
+
+            manifesto = {
+                "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "segundos": round(time.perf_counter() - inicio, 2),
+                "avaliacoes": {},
+            }
+            for (avaliacao, periodo, grupo), indice in indices.items():
+                caminho = f"{avaliacao}/{periodo.replace('/', '-')}/{grupo}/indice.json"
+                manifesto["avaliacoes"].setdefault(avaliacao, {}).setdefault(periodo, {})[grupo] = _gravar_json(
+                    self.destino, caminho, indice
+                )
+            _gravar_json(self.destino, "manifesto.json", manifesto)
+
+            shutil.copy(VISUALIZADOR, os.path.join(self.destino, "index.html"))
+            shutil.copy(
+                os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js"),
+                os.path.join(self.destino, "plotly.min.js"),
+            )
+        except BaseException:
+            shutil.rmtree(self.destino, ignore_errors=True)
+            raise
+        finally:
+            self.destino = final
+
+        antigo = f"{final}.old"
+        shutil.rmtree(antigo, ignore_errors=True)
+        if os.path.exists(final):
+            os.replace(final, antigo)
+        os.replace(f"{final}.tmp", final)
+        shutil.rmtree(antigo, ignore_errors=True)
+        return manifesto
@@ -0,0 +1,46 @@
+"""Exporta todas as seleções do dashboard como um site estático (JSON + HTML).
+
+    python -m snapshot --saida publicado
+    python -m snapshot --saida publicado --avaliacoes cursos disciplinas --processos 8
+    python -m snapshot --saida publicado --avaliacoes disciplinas --periodos 2025/2 --max-selecoes 500
+    python -m http.server --directory publicado 8080
+
+Cada opção dos seletores (eixo, curso/setor, disciplina/curso/setor) e cada
+dimensão de cada período é calculada em processos paralelos e gravada em
+`--saida`, que pode ser servida por qualquer servidor de arquivos estáticos.
+O custo cresce com o número de combinações dos seletores (ver o README):
+`--avaliacoes`, `--periodos` e `--max-selecoes` limitam o que é exportado.
+"""
+import argparse
+import os
+import sys
+
+from snapshot.SnapshotExporter import TAMANHO_LOTE, VISOES, SnapshotExporter
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m snapshot", description=__doc__.splitlines()[0])
+    parser.add_argument("--saida", default="snapshot_estatico", help="pasta do pacote estático (substituída ao final)")
+    parser.add_argument("--avaliacoes", nargs="+", choices=list(VISOES), help="avaliações a exportar (padrão: todas)")
+    parser.add_argument("--periodos", nargs="+", help="períodos a exportar, ex.: 2025/2 (padrão: todos)")
+    parser.add_argument(
+        "--max-selecoes", type=int, help="máximo de seleções distintas por avaliação, período e grupo (padrão: todas)"
+    )
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="processos de exportação")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="seleções por tarefa")
+    args = parser.parse_args(argv)
+
+    exportador = SnapshotExporter(
+        args.saida, args.avaliacoes, processos=args.processos, tamanho_lote=args.lote,
+        periodos=args.periodos, max_selecoes=args.max_selecoes,
+    )
+    manifesto = exportador.exportar()
+
+    for avaliacao, periodos in manifesto["avaliacoes"].items():
+        for periodo, grupos in periodos.items():
+            print(f"{avaliacao} {periodo}: {', '.join(grupos)}", file=sys.stderr)
+    print(f"Pacote em {exportador.destino} ({manifesto['segundos']:.1f}s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
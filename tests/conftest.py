@@ -0,0 +1,9 @@
+import pandas as pd
+import pytest
+
+from tests.dados import gerar_respostas
+
+
+@pytest.fixture
+def respostas() -> pd.DataFrame:
+    return gerar_respostas(3_000)
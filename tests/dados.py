@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+RESPOSTAS = {"Concordo": 1, "Discordo": -1, "Desconheço": 0}
+
+
+def gerar_respostas(linhas: int, seed: int = 0) -> pd.DataFrame:
+    """Respostas sintéticas no formato dos dados processados de cursos (com setores ausentes)."""
+    rng = np.random.default_rng(seed)
+    cursos = np.array([f"Curso {i}" for i in range(12)])
+    curso = rng.choice(cursos, linhas)
+    setor = pd.Series([f"Setor {int(c.split()[1]) % 4}" for c in curso])
+    setor[rng.random(linhas) < 0.05] = None
+    resposta = rng.choice(list(RESPOSTAS), linhas)
+    return pd.DataFrame({
+        "ID_PESQUISA": rng.integers(0, linhas // 3 + 1, linhas),
+        "EIXO_NOME": pd.Categorical(rng.choice(["Eixo 1", "Eixo 2", "Eixo 3"], linhas)),
+        "DIMENSAO_NOME": pd.Categorical(rng.choice(["Dimensão A", "Dimensão B"], linhas)),
+        "PERGUNTA": pd.Categorical(rng.choice([f"Pergunta {i}" for i in range(8)], linhas)),
+        "CURSO": pd.Categorical(curso),
+        "SETOR_CURSO": pd.Categorical(setor),
+        "RESPOSTA": pd.Categorical(resposta),
+        "VALOR_RESPOSTA": pd.Series(resposta).map(RESPOSTAS).astype("int8"),
+    })
+
+
+def normalizar_contagens(contagens: pd.DataFrame) -> pd.DataFrame:
+    """Contagens comparáveis entre cubos: categorias como texto e linhas ordenadas."""
+    chaves = [c for c in contagens.columns if c != "COUNT"]
+    contagens = contagens.astype({c: object for c in chaves if isinstance(contagens[c].dtype, pd.CategoricalDtype)})
+    contagens = contagens.astype({"COUNT": "int64"})
+    return contagens.sort_values(chaves, na_position="first").reset_index(drop=True)
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from services.DataLoader import DataLoader
+from services.ResponseCube import ResponseCube
+from tests.dados import gerar_respostas, normalizar_contagens
+
+
+def test_atualizar_cubo_igual_a_reconstruir(respostas, tmp_path):
+    caminho = str(tmp_path / "processed_cursos.csv")
+    ResponseCube.construir(respostas).salvar(DataLoader.caminho_cubo(caminho))
+    # As respostas novas chegam como no CSV: texto, sem categorias.
+    novas = gerar_respostas(800, seed=3)
+    novas = novas.astype({c: object for c in novas.columns if isinstance(novas[c].dtype, pd.CategoricalDtype)})
+
+    destino = DataLoader.atualizar_cubo(caminho, novas)
+
+    atualizado = ResponseCube.ler(destino)
+    reconstruido = ResponseCube.construir(pd.concat([respostas, novas], ignore_index=True))
+    pd.testing.assert_frame_equal(normalizar_contagens(atualizado.contagens), normalizar_contagens(reconstruido.contagens))
+
+
+def test_atualizar_sem_cubo_persistido(respostas, tmp_path):
+    caminho = str(tmp_path / "processed_cursos.csv")
+
+    assert DataLoader.atualizar_cubo(caminho, respostas) is None
+    assert not (tmp_path / "processed_cursos_cubo.parquet").exists()
@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+
+import pytest
+
+from services.DataLoader import DataLoader
+from services.PeriodComparison import PeriodComparison
+from tests.dados import gerar_respostas
+
+TIPO, PERIODO = "cursos", "2030/1"
+CHAVES = ["CURSO", "SETOR_CURSO"]
+VALORES = {"concordancia": 1, "discordancia": -1, "desconhecimento": 0}
+
+
+@pytest.fixture(autouse=True)
+def armazenamento(tmp_path, monkeypatch):
+    # As pastas do armazenamento são relativas ao diretório de trabalho.
+    monkeypatch.chdir(tmp_path)
+
+
+def test_comparacao_igual_a_construida_do_dataset():
+    df = gerar_respostas(2_000)
+    DataLoader.publicar_periodo(df, TIPO, PERIODO)
+
+    comparacao = DataLoader.comparacao(TIPO, PERIODO, CHAVES, "VALOR_RESPOSTA", VALORES)
+    esperado = PeriodComparison.construir(df, CHAVES, "VALOR_RESPOSTA", VALORES)
+
+    for filtros in (None, {"CURSO": "Curso 3"}, {"CURSO": "Curso 3", "SETOR_CURSO": "Setor 3"}):
+        assert comparacao.metricas(filtros) == esperado.metricas(filtros)
+
+
+def test_comparacao_gerada_por_varias_threads():
+    DataLoader.publicar_periodo(gerar_respostas(2_000), TIPO, PERIODO)
+    inicio = threading.Barrier(8)
+    resultados, erros = [], []
+
+    def consultar():
+        inicio.wait()
+        try:
+            resultados.append(DataLoader.comparacao(TIPO, PERIODO, CHAVES, "VALOR_RESPOSTA", VALORES).metricas())
+        except Exception as erro:  # noqa: BLE001 - o teste conta qualquer falha
+            erros.append(erro)
+
+    threads = [threading.Thread(target=consultar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert erros == []
+    assert len(resultados) == 8 and all(r == resultados[0] for r in resultados)
+    pasta = DataLoader.pasta_periodo(TIPO, PERIODO)
+    assert not [nome for _, _, nomes in os.walk(pasta) for nome in nomes if ".tmp" in nome]
+
+
+def test_comparacao_fica_fora_da_pasta_da_versao():
+    arquivo = DataLoader.publicar_periodo(gerar_respostas(2_000), TIPO, PERIODO)
+    versao = os.path.dirname(arquivo)
+    conteudo, mtime = sorted(os.listdir(versao)), os.path.getmtime(versao)
+
+    DataLoader.comparacao(TIPO, PERIODO, CHAVES, "VALOR_RESPOSTA", VALORES)
+
+    assert sorted(os.listdir(versao)) == conteudo
+    assert os.path.getmtime(versao) == mtime
+    derivados = os.path.join(DataLoader.pasta_periodo(TIPO, PERIODO), "derivados", os.path.basename(versao))
+    assert len(os.listdir(derivados)) == 1
+
+
+def test_coletar_apaga_derivados_de_versoes_apagadas():
+    DataLoader.publicar_periodo(gerar_respostas(2_000, seed=1), TIPO, PERIODO)
+    v1 = DataLoader.versao_atual(TIPO, PERIODO)
+    DataLoader.comparacao(TIPO, PERIODO, CHAVES, "VALOR_RESPOSTA", VALORES)
+    DataLoader.publicar_periodo(gerar_respostas(2_000, seed=2), TIPO, PERIODO)
+    v2 = DataLoader.versao_atual(TIPO, PERIODO)
+    DataLoader.comparacao(TIPO, PERIODO, CHAVES, "VALOR_RESPOSTA", VALORES)
+    derivados = os.path.join(DataLoader.pasta_periodo(TIPO, PERIODO), "derivados")
+    assert sorted(os.listdir(derivados)) == sorted([v1, v2])
+
+    instante = time.time() - 7200
+    os.utime(os.path.join(DataLoader.pasta_periodo(TIPO, PERIODO), "versoes", v1), (instante, instante))
+    DataLoader.coletar_versoes(TIPO, PERIODO, retencao=3600)
+
+    assert os.listdir(derivados) == [v2]
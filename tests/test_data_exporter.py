@@ -0,0 +1,67 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from services.DataExporter import DataExporter, parametros_do_servico
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "ID_PESQUISA": np.arange(10),
+        "CURSO": pd.Categorical(["A", "B"] * 5),
+        "RESPOSTA": ["Concordo", None, "Discordo", "Concordo", "Desconheço"] * 2,
+        "VAZIA": [None] * 10,
+    })
+
+
+def _ler_parquet(exportador: DataExporter) -> pd.DataFrame:
+    return pq.read_table(io.BytesIO(b"".join(exportador.exportar("parquet")))).to_pandas()
+
+
+@pytest.mark.parametrize("posicoes", [None, np.array([1, 2, 5, 7, 8])])
+def test_parquet_coluna_object(df, posicoes, monkeypatch):
+    monkeypatch.setattr("services.DataExporter.TAMANHO_BLOCO", 2)
+    esperado = df if posicoes is None else df.iloc[posicoes]
+
+    lido = _ler_parquet(DataExporter(df, posicoes))
+
+    assert lido["RESPOSTA"].tolist() == esperado["RESPOSTA"].tolist()
+    assert lido["ID_PESQUISA"].tolist() == esperado["ID_PESQUISA"].tolist()
+    assert lido["CURSO"].astype(str).tolist() == esperado["CURSO"].astype(str).tolist()
+    assert lido["VAZIA"].isna().all()
+
+
+def test_parquet_sem_linhas(df):
+    lido = _ler_parquet(DataExporter(df, np.array([], dtype=np.int64)))
+
+    assert len(lido) == 0
+    assert list(lido.columns) == list(df.columns)
+
+
+def test_csv_em_blocos(df, monkeypatch):
+    monkeypatch.setattr("services.DataExporter.TAMANHO_BLOCO", 3)
+    posicoes = np.array([0, 3, 4, 9])
+
+    texto = b"".join(DataExporter(df, posicoes, colunas=["ID_PESQUISA", "RESPOSTA"]).exportar("csv")).decode("utf-8-sig")
+
+    assert texto == df.iloc[posicoes][["ID_PESQUISA", "RESPOSTA"]].to_csv(index=False)
+
+
+def test_formato_desconhecido(df):
+    with pytest.raises(ValueError):
+        DataExporter(df).exportar("json")
+
+
+def test_parametros_do_servico():
+    class Servico:
+        tipo_disciplina_value = "EAD"
+        disciplina_value = "Todas"
+        curso_value = "Curso 1"
+        setor_value = "Todas"
+        dimensao_value = None
+
+    assert parametros_do_servico("disciplinas", Servico()) == {"tipo": ["EAD"], "curso": ["Curso 1"]}
@@ -0,0 +1,110 @@
+import json
+import sqlite3
+
+import pytest
+
+from services.FeedbackStore import FeedbackStore
+
+
+@pytest.fixture(autouse=True)
+def gravacao_rapida(monkeypatch):
+    monkeypatch.setattr("services.FeedbackStore.INTERVALO_GRAVACAO", 0.05)
+
+
+def test_importa_json_ignorando_linhas_malformadas(tmp_path):
+    legado = tmp_path / "feedback_log.json"
+    legado.write_text(
+        "\n".join([json.dumps({"feedback": "Ótimo"}), "{quebrado", json.dumps({"outro": 1}), json.dumps({"feedback": "Ruim"})]) + "\n",
+        encoding="utf-8",
+    )
+    store = FeedbackStore(str(tmp_path / "feedback.db"), str(legado))
+
+    assert store.contagens() == {"Ótimo": 1, "Ruim": 1}
+
+
+def test_lote_com_falha_nao_para_a_gravacao(tmp_path, monkeypatch):
+    store = FeedbackStore(str(tmp_path / "feedback.db"), None)
+    gravar = FeedbackStore._gravar
+    falhas = []
+
+    def gravar_falhando_uma_vez(conexao, registros):
+        if not falhas:
+            falhas.append(len(registros))
+            raise ValueError("falha simulada")
+        gravar(conexao, registros)
+
+    monkeypatch.setattr(FeedbackStore, "_gravar", staticmethod(gravar_falhando_uma_vez))
+    store.registrar("Ótimo")
+    assert store.descarregar()
+    store.registrar("Ótimo")
+    store.registrar("Ruim")
+    assert store.descarregar()
+
+    assert falhas == [1]
+    assert store._thread.is_alive()
+    assert store.contagens() == {"Ótimo": 1, "Ruim": 1}
+
+
+def test_reinicia_thread_encerrada(tmp_path):
+    store = FeedbackStore(str(tmp_path / "feedback.db"), None)
+    store.registrar("Ótimo")
+    assert store.descarregar()
+
+    store._thread = type(store._thread)(target=lambda: None)
+    store._thread.start()
+    store._thread.join()
+    store.registrar("Ruim")
+
+    assert store.descarregar()
+    assert store.contagens() == {"Ótimo": 1, "Ruim": 1}
+
+
+def _erro_sqlite(mensagem: str, codigo: int | None = None) -> sqlite3.OperationalError:
+    erro = sqlite3.OperationalError(mensagem)
+    if codigo is not None:
+        erro.sqlite_errorcode = codigo
+    return erro
+
+
+def test_erro_permanente_descarta_o_lote_sem_repetir(tmp_path, monkeypatch):
+    store = FeedbackStore(str(tmp_path / "feedback.db"), None)
+    gravar = FeedbackStore._gravar
+    chamadas = []
+
+    def gravar_sem_tabela(conexao, registros):
+        chamadas.append(len(registros))
+        if len(chamadas) == 1:
+            raise _erro_sqlite("no such table: feedback", sqlite3.SQLITE_ERROR)
+        gravar(conexao, registros)
+
+    monkeypatch.setattr(FeedbackStore, "_gravar", staticmethod(gravar_sem_tabela))
+    store.registrar("Ótimo")
+    assert store.descarregar(timeout=2)
+    store.registrar("Ruim")
+    assert store.descarregar(timeout=2)
+
+    assert chamadas == [1, 1]
+    assert store.contagens() == {"Ótimo": 0, "Ruim": 1}
+
+
+def test_banco_ocupado_tenta_de_novo_ate_o_limite(tmp_path, monkeypatch):
+    monkeypatch.setattr("services.FeedbackStore.ESPERA_TENTATIVA", 0)
+    monkeypatch.setattr("services.FeedbackStore.TENTATIVAS_GRAVACAO", 3)
+    store = FeedbackStore(str(tmp_path / "feedback.db"), None)
+    gravar = FeedbackStore._gravar
+    chamadas = []
+
+    def gravar_ocupado(conexao, registros):
+        chamadas.append(registros[0][0])
+        if registros[0][0] == "Ruim" or len(chamadas) == 1:
+            raise _erro_sqlite("database is locked", sqlite3.SQLITE_BUSY)
+        gravar(conexao, registros)
+
+    monkeypatch.setattr(FeedbackStore, "_gravar", staticmethod(gravar_ocupado))
+    store.registrar("Ótimo")
+    assert store.descarregar()
+    store.registrar("Ruim")
+    assert store.descarregar()
+
+    assert chamadas == ["Ótimo", "Ótimo", "Ruim", "Ruim", "Ruim"]
+    assert store.contagens() == {"Ótimo": 1, "Ruim": 0}
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from services.FilterIndex import FilterIndex
+from services.ResponseCube import mascara_filtros
+
+FILTROS = [
+    {"CURSO": "Curso 3"},
+    {"CURSO": ["Curso 1", "Curso 2", "Curso 1"]},
+    {"CURSO": ["Curso 1", "Curso 2"], "EIXO_NOME": "Eixo 2"},
+    {"SETOR_CURSO": "Setor 0", "PERGUNTA": ["Pergunta 1", "Pergunta 7"], "DIMENSAO_NOME": "Dimensão B"},
+    {"CURSO": "Curso 4", "SETOR_CURSO": "Setor 1"},
+    {"CURSO": ["Inexistente"], "EIXO_NOME": "Eixo 1"},
+    {"CURSO": None, "EIXO_NOME": ["Eixo 1", "Eixo 3"]},
+    {"SETOR_CURSO": np.nan},
+    {"CURSO": "Curso 2", "SETOR_CURSO": np.nan},
+    {"SETOR_CURSO": ["Setor 1", None, np.nan]},
+]
+
+
+@pytest.mark.parametrize("filtros", FILTROS)
+def test_posicoes_igual_a_mascara(respostas, filtros):
+    indice = FilterIndex.construir(respostas)
+
+    posicoes = indice.posicoes(filtros)
+
+    np.testing.assert_array_equal(posicoes, np.flatnonzero(mascara_filtros(respostas, filtros)))
+
+
+@pytest.mark.parametrize("filtros", [None, {}, {"CURSO": None}])
+def test_sem_filtros_todas_as_linhas(respostas, filtros):
+    assert FilterIndex.construir(respostas).posicoes(filtros) is None
+
+
+def test_nulos_ficam_fora_do_indice(respostas):
+    indice = FilterIndex.construir(respostas)
+
+    total = sum(len(indice.posicoes({"SETOR_CURSO": valor})) for valor in indice.valores("SETOR_CURSO"))
+
+    assert total == respostas["SETOR_CURSO"].notna().sum()
+
+
+def test_filtro_nulo_seleciona_as_linhas_sem_valor(respostas):
+    posicoes = FilterIndex.construir(respostas).posicoes({"SETOR_CURSO": np.nan})
+
+    np.testing.assert_array_equal(posicoes, np.flatnonzero(respostas["SETOR_CURSO"].isna()))
+    assert len(posicoes) > 0
+
+
+def test_selecionar_mantem_a_ordem(respostas):
+    filtros = {"CURSO": ["Curso 5", "Curso 0"], "RESPOSTA": "Concordo"}
+    indice = FilterIndex.construir(respostas, ["CURSO", "RESPOSTA"])
+
+    selecionado = indice.selecionar(respostas, filtros)
+
+    assert selecionado.equals(respostas[mascara_filtros(respostas, filtros)])
+
+
+def test_coluna_nao_indexada(respostas):
+    with pytest.raises(KeyError):
+        FilterIndex.construir(respostas, ["CURSO"]).posicoes({"EIXO_NOME": "Eixo 1"})
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from services.OptionIndex import OptionIndex, normalizar
+from services.ResponseCube import mascara_filtros
+
+COLUNAS = ["CURSO", "SETOR_CURSO"]
+FORMATO = "Curso: {} - Setor: {}"
+
+
+@pytest.fixture
+def indice(respostas) -> OptionIndex:
+    return OptionIndex.construir(respostas, COLUNAS, FORMATO)
+
+
+def test_ids_ida_e_volta(indice, respostas):
+    combinacoes = respostas[COLUNAS].astype(str).drop_duplicates()
+
+    assert len(indice) == len(combinacoes)
+    assert indice.ids() == list(range(len(indice)))
+    for opcao_id in indice.ids():
+        valores = indice.valores(opcao_id)
+        assert indice.id_de(*valores) == opcao_id
+        assert indice.rotulo(opcao_id) == FORMATO.format(*valores)
+        assert mascara_filtros(respostas, dict(zip(COLUNAS, valores))).any()
+
+
+def test_combinacoes_com_valor_ausente(indice, respostas):
+    sem_setor = respostas.loc[respostas["SETOR_CURSO"].isna(), "CURSO"].unique()
+    ids = [indice.id_de(curso, None) for curso in sem_setor]
+
+    assert None not in ids
+    assert [indice.rotulo(i) for i in ids] == [f"Curso: {curso} - Setor: nan" for curso in sem_setor]
+    assert indice.id_de(sem_setor[0], float("nan")) == ids[0]
+    for opcao_id in ids:
+        filtros = dict(zip(COLUNAS, indice.valores(opcao_id)))
+        assert mascara_filtros(respostas, filtros).sum() == (
+            (respostas["CURSO"] == filtros["CURSO"]) & respostas["SETOR_CURSO"].isna()
+        ).sum()
+
+
+def test_ids_seguem_a_ordem_dos_rotulos(indice):
+    assert indice.rotulos() == sorted(indice.rotulos())
+    assert indice.rotulos() == [indice.rotulo(i) for i in indice.ids()]
+
+
+def test_ids_estaveis_para_o_mesmo_dataset(indice, respostas):
+    embaralhado = respostas.sample(frac=1, random_state=0)
+
+    outro = OptionIndex.construir(embaralhado, COLUNAS, FORMATO)
+
+    assert [outro.valores(i) for i in outro.ids()] == [indice.valores(i) for i in indice.ids()]
+
+
+def test_id_de_combinacao_inexistente(indice):
+    assert indice.id_de("Curso 0", "Setor 1") is None
+    assert indice.id_de("Curso 0") is None
+
+
+def test_coluna_unica():
+    df = pd.DataFrame({"DISCIPLINA": pd.Categorical(["Cálculo", "Álgebra", "Cálculo"])})
+
+    indice = OptionIndex.construir(df, ["DISCIPLINA"], "{}")
+
+    assert indice.rotulos() == sorted(["Cálculo", "Álgebra"])
+    assert indice.valores(indice.id_de("Álgebra")) == ("Álgebra",)
+
+
+def test_buscar_ignora_acentos_e_caixa():
+    df = pd.DataFrame({"DISCIPLINA": ["Cálculo I", "Álgebra Linear", "Física Básica"]})
+    indice = OptionIndex.construir(df, ["DISCIPLINA"], "{}")
+
+    assert [indice.rotulo(i) for i in indice.buscar("CALCULO")] == ["Cálculo I"]
+    assert [indice.rotulo(i) for i in indice.buscar("basica fis")] == ["Física Básica"]
+    assert [indice.rotulo(i) for i in indice.buscar("algebar")] == ["Álgebra Linear"]
+    assert indice.buscar("") == indice.ids()
+    assert normalizar("  Álgebra   LINEAR ") == "algebra linear"
@@ -0,0 +1,122 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pipeline.BasePipeline import BasePipeline
+
+
+class _Pipeline(BasePipeline):
+    """Pipeline mínimo: copia as colunas da pesquisa e separa as respostas vazias em um arquivo de erros."""
+
+    NOME = "teste"
+    ARQUIVO_PESQUISA = "pesquisa.csv"
+    ARQUIVO_SAIDA = "saida_{ano}.csv"
+    ARQUIVO_ERROS = "erros_{ano}.csv"
+    COLUNAS_SAIDA = ["ID_PESQUISA", "RESPOSTA"]
+
+    def carregar_auxiliares(self):
+        pass
+
+    def transformar_bloco(self, bloco: pd.DataFrame) -> pd.DataFrame:
+        return self.deduplicar(bloco[self.COLUNAS_SAIDA])
+
+    def finalizar(self, df: pd.DataFrame) -> dict:
+        vazias = df["RESPOSTA"].isna()
+        return {
+            self.caminho_processado(self.ARQUIVO_SAIDA): df[~vazias],
+            self.caminho_processado(self.ARQUIVO_ERROS): df[vazias],
+        }
+
+    def arquivos_saida(self) -> list:
+        return [self.caminho_processado(self.ARQUIVO_SAIDA), self.caminho_processado(self.ARQUIVO_ERROS)]
+
+
+def _pesquisa(ids) -> pd.DataFrame:
+    return pd.DataFrame({
+        "ID_PESQUISA": [i for i in ids for _ in range(3)],
+        "RESPOSTA": [None if i % 7 == 0 else r for i in ids for r in ("Concordo", "Discordo", "Desconheço")],
+    })
+
+
+@pytest.fixture
+def pipeline(tmp_path) -> _Pipeline:
+    os.makedirs(tmp_path / "raw")
+    return _Pipeline(2030, raw_dir=str(tmp_path / "raw"), processed_dir=str(tmp_path / "processed"), chunksize=10)
+
+
+def _exportar(pipeline: _Pipeline, df: pd.DataFrame):
+    df.to_csv(pipeline.caminho_raw(pipeline.ARQUIVO_PESQUISA), index=False)
+
+
+def _ler(pipeline: _Pipeline) -> dict:
+    return {caminho: pd.read_csv(caminho) for caminho in pipeline.arquivos_saida()}
+
+
+def test_incremental_igual_a_executar(pipeline, tmp_path):
+    _exportar(pipeline, _pesquisa(range(30)))
+    pipeline.executar()
+    # A nova exportação repete pesquisas antigas e traz novas.
+    _exportar(pipeline, _pesquisa(range(20, 60)))
+
+    gravados = pipeline.executar_incremental()
+
+    completo = _Pipeline(2030, raw_dir=pipeline.raw_dir, processed_dir=str(tmp_path / "completo"), chunksize=10)
+    _exportar(completo, pd.concat([_pesquisa(range(30)), _pesquisa(range(30, 60))]))
+    completo.executar()
+    esperado = list(_ler(completo).values())
+    for lido, referencia in zip(_ler(pipeline).values(), esperado):
+        pd.testing.assert_frame_equal(lido, referencia)
+    assert sum(gravados.values()) == sum(int((df["ID_PESQUISA"] >= 30).sum()) for df in esperado)
+    assert sorted(pipeline.pesquisas_armazenadas()) == list(range(60))
+
+
+def test_incremental_nao_rele_os_csvs(pipeline, monkeypatch):
+    _exportar(pipeline, _pesquisa(range(30)))
+    pipeline.executar()
+    _exportar(pipeline, _pesquisa(range(30, 40)))
+    saidas = set(pipeline.arquivos_saida())
+    lidos = []
+    ler_csv = pd.read_csv
+
+    def ler_registrando(caminho, *args, **kwargs):
+        lidos.append(caminho)
+        return ler_csv(caminho, *args, **kwargs)
+
+    monkeypatch.setattr("pipeline.BasePipeline.pd.read_csv", ler_registrando)
+    pipeline.executar_incremental()
+    _exportar(pipeline, _pesquisa(range(40, 50)))
+    pipeline.executar_incremental()
+
+    assert not saidas & set(lidos)
+    assert sorted(pipeline.pesquisas_armazenadas()) == list(range(50))
+
+
+def test_saidas_alteradas_por_fora_sao_relidas(pipeline):
+    _exportar(pipeline, _pesquisa(range(30)))
+    pipeline.executar()
+    caminho = pipeline.caminho_processado(pipeline.ARQUIVO_SAIDA)
+    pd.read_csv(caminho).query("ID_PESQUISA < 10").to_csv(caminho, index=False)
+
+    assert sorted(pipeline.pesquisas_armazenadas()) == [i for i in range(30) if i < 10 or i % 7 == 0]
+
+
+def test_falha_ao_anexar_trunca_as_saidas(pipeline, monkeypatch):
+    _exportar(pipeline, _pesquisa(range(30)))
+    pipeline.executar()
+    antes = {caminho: open(caminho, "rb").read() for caminho in pipeline.arquivos_saida()}
+    _exportar(pipeline, _pesquisa(range(30, 60)))
+    para_csv = pd.DataFrame.to_csv
+
+    def falhar_nos_erros(df, caminho=None, *args, **kwargs):
+        if kwargs.get("mode") == "a" and str(caminho).endswith("erros_2030.csv"):
+            para_csv(df.head(1), caminho, *args, **kwargs)
+            raise OSError("disco cheio")
+        return para_csv(df, caminho, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", falhar_nos_erros)
+    with pytest.raises(OSError):
+        pipeline.executar_incremental()
+
+    assert {caminho: open(caminho, "rb").read() for caminho in pipeline.arquivos_saida()} == antes
+    assert sorted(pipeline.pesquisas_armazenadas()) == list(range(30))
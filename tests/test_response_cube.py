@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from services.ResponseCube import ResponseCube, mascara_filtros
+from tests.dados import gerar_respostas, normalizar_contagens
+
+
+def test_construir_conta_todas_as_linhas(respostas):
+    cubo = ResponseCube.construir(respostas)
+
+    assert cubo.contagens["COUNT"].sum() == len(respostas)
+    assert cubo.total() == len(respostas)
+
+
+@pytest.mark.parametrize("filtros", [
+    None,
+    {"CURSO": "Curso 3"},
+    {"CURSO": ["Curso 1", "Curso 2"], "EIXO_NOME": "Eixo 2"},
+    {"SETOR_CURSO": "Setor 0", "PERGUNTA": ["Pergunta 1", "Pergunta 7"]},
+    {"CURSO": "Inexistente"},
+])
+def test_contagens_por_igual_ao_groupby(respostas, filtros):
+    cubo = ResponseCube.construir(respostas)
+    esperado = (
+        respostas[mascara_filtros(respostas, filtros)]
+        .groupby(["EIXO_NOME", "RESPOSTA"], observed=True).size().rename("COUNT").reset_index()
+    )
+
+    resultado = cubo.contagens_por(["EIXO_NOME"], filtros)
+
+    pd.testing.assert_frame_equal(normalizar_contagens(resultado), normalizar_contagens(esperado))
+
+
+def test_somar_igual_a_reconstruir(respostas):
+    novas = gerar_respostas(1_000, seed=1)
+
+    somado = ResponseCube.construir(respostas).somar(ResponseCube.construir(novas))
+    reconstruido = ResponseCube.construir(pd.concat([respostas, novas], ignore_index=True))
+
+    pd.testing.assert_frame_equal(normalizar_contagens(somado.contagens), normalizar_contagens(reconstruido.contagens))
+    assert isinstance(somado.contagens["CURSO"].dtype, pd.CategoricalDtype)
+
+
+def test_somar_persistido(respostas, tmp_path):
+    novas = gerar_respostas(500, seed=2)
+    caminho = tmp_path / "cubo.parquet"
+    ResponseCube.construir(respostas).salvar(caminho)
+
+    somado = ResponseCube.ler(caminho).somar(ResponseCube.construir(novas))
+
+    assert somado.total() == len(respostas) + len(novas)
+    assert somado.total({"CURSO": "Curso 5"}) == (
+        (respostas["CURSO"] == "Curso 5").sum() + (novas["CURSO"] == "Curso 5").sum()
+    )
@@ -0,0 +1,121 @@
+import os
+import time
+
+import pytest
+
+from services.DataLoader import DataLoader
+from services.IngestionWorker import IngestionWorker
+from tests.dados import gerar_respostas
+
+TIPO, PERIODO = "cursos", "2030/1"
+
+
+@pytest.fixture(autouse=True)
+def armazenamento(tmp_path, monkeypatch):
+    # As pastas do armazenamento são relativas ao diretório de trabalho.
+    monkeypatch.chdir(tmp_path)
+
+
+def _versoes() -> set:
+    return set(os.listdir(os.path.join(DataLoader.pasta_periodo(TIPO, PERIODO), "versoes")))
+
+
+def _envelhecer(versao: str, segundos: int):
+    pasta = os.path.join(DataLoader.pasta_periodo(TIPO, PERIODO), "versoes", versao)
+    instante = time.time() - segundos
+    os.utime(pasta, (instante, instante))
+
+
+def test_publicar_troca_o_ponteiro():
+    assert DataLoader.versao_atual(TIPO, PERIODO) is None
+
+    primeiro = DataLoader.publicar_periodo(gerar_respostas(500, seed=1), TIPO, PERIODO)
+    v1 = DataLoader.versao_atual(TIPO, PERIODO)
+    segundo = DataLoader.publicar_periodo(gerar_respostas(500, seed=2), TIPO, PERIODO)
+    v2 = DataLoader.versao_atual(TIPO, PERIODO)
+
+    assert v1 != v2
+    assert segundo != primeiro
+    assert DataLoader.caminho_periodo(TIPO, PERIODO) == segundo
+    assert DataLoader.caminho_periodo(TIPO, PERIODO, v1) == primeiro
+    assert os.path.exists(DataLoader.caminho_cubo(segundo))
+    # A versão substituída fica até passar a retenção; nenhuma pasta temporária sobra.
+    assert _versoes() == {v1, v2}
+    assert DataLoader.periodos_disponiveis(TIPO) == [PERIODO]
+
+
+def test_conteudo_igual_reaproveita_a_versao():
+    df = gerar_respostas(500, seed=1)
+
+    primeiro = DataLoader.publicar_periodo(df, TIPO, PERIODO)
+    segundo = DataLoader.publicar_periodo(df, TIPO, PERIODO)
+
+    assert segundo == primeiro
+    assert _versoes() == {DataLoader.versao_atual(TIPO, PERIODO)}
+
+
+def test_coletar_respeita_a_retencao():
+    DataLoader.publicar_periodo(gerar_respostas(500, seed=1), TIPO, PERIODO)
+    v1 = DataLoader.versao_atual(TIPO, PERIODO)
+    DataLoader.publicar_periodo(gerar_respostas(500, seed=2), TIPO, PERIODO)
+    v2 = DataLoader.versao_atual(TIPO, PERIODO)
+
+    assert DataLoader.coletar_versoes(TIPO, PERIODO, retencao=3600) == []
+    assert _versoes() == {v1, v2}
+
+    _envelhecer(v1, 7200)
+    _envelhecer(v2, 7200)
+    apagadas = DataLoader.coletar_versoes(TIPO, PERIODO, retencao=3600)
+
+    assert [os.path.basename(p) for p in apagadas] == [v1]
+    assert _versoes() == {v2}
+    assert DataLoader.versao_atual(TIPO, PERIODO) == v2
+
+
+def test_coletar_apaga_pastas_temporarias_abandonadas():
+    DataLoader.publicar_periodo(gerar_respostas(500, seed=1), TIPO, PERIODO)
+    abandonada = os.path.basename(DataLoader.preparar_versao(TIPO, PERIODO))
+
+    assert DataLoader.coletar_versoes(TIPO, PERIODO) == []
+    _envelhecer(abandonada, 7200)
+
+    assert [os.path.basename(p) for p in DataLoader.coletar_versoes()] == [abandonada]
+    assert _versoes() == {DataLoader.versao_atual(TIPO, PERIODO)}
+
+
+def test_coletar_mantem_versao_em_uso():
+    DataLoader.publicar_periodo(gerar_respostas(500, seed=1), TIPO, PERIODO)
+    v1 = DataLoader.versao_atual(TIPO, PERIODO)
+    df = DataLoader.load_periodo(TIPO, PERIODO)
+    DataLoader.publicar_periodo(gerar_respostas(500, seed=2), TIPO, PERIODO)
+    _envelhecer(v1, 7200)
+
+    assert DataLoader.coletar_versoes(TIPO, PERIODO, retencao=0) == []
+    assert v1 in _versoes()
+    assert len(df) == 500
+
+
+def _ingerir(df, monkeypatch) -> dict:
+    monkeypatch.setattr("services.IngestionWorker.CHUNKSIZE_INGESTAO", 700)
+    worker = IngestionWorker()
+    worker.enviar(TIPO, PERIODO, "envio.csv", df.to_csv(index=False).encode("utf-8"))
+    limite = time.monotonic() + 30
+    while worker.em_andamento() and time.monotonic() < limite:
+        time.sleep(0.05)
+    return worker.tarefas()[0]
+
+
+def test_ingestao_publica_ordenado_como_publicar_periodo(monkeypatch):
+    df = gerar_respostas(3_000, seed=3).assign(ID_PERGUNTA=1)
+
+    tarefa = _ingerir(df, monkeypatch)
+
+    assert tarefa["etapa"] == "concluída", tarefa["mensagem"]
+    assert tarefa["linhas"] == len(df)
+    ingerido = DataLoader.load_periodo(TIPO, PERIODO)
+    DataLoader.publicar_periodo(df, TIPO, "2030/2")
+    publicado = DataLoader.load_periodo(TIPO, "2030/2")
+    colunas = ["SETOR_CURSO", "CURSO", "ID_PESQUISA", "PERGUNTA", "RESPOSTA"]
+    assert ingerido[colunas].astype(str).equals(publicado[colunas].astype(str))
+    assert _versoes() == {DataLoader.versao_atual(TIPO, PERIODO)}
+    assert os.path.exists(DataLoader.caminho_cubo(DataLoader.caminho_periodo(TIPO, PERIODO)))
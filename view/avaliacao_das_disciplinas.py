@@ -4,6 +4,10 @@ import pandas as pd
 import plotly.graph_objects as go
 
 from services.AvaliacaoDasDisciplinasService import AvaliacaoDasDisciplinasService
+from services.DataLoader import DataLoader
+from view.comparacao import delta_percentual, delta_respondentes
+from view.dados_brutos import dados_brutos
+from view.sessao import obter_servico
  
 BORDER = 1
 COLOR_MAP = {
@@ -41,10 +45,13 @@ def avaliacao_das_disciplinas_view():
         </p>
         """,unsafe_allow_html=True)
 
+    # Períodos com dados tanto da Presencial quanto da EAD.
+    periodos = [p for p in DataLoader.periodos_disponiveis("presencial") if p in DataLoader.periodos_disponiveis("ead")]
+
     col1,col2,_,_,_,_= st.columns(6)
     with col1:
         year_value = st.selectbox('Selecione o Ano/Período', 
-                                ('2025/2','2025/1','2024/2', '2024/1'),
+                                periodos,
                                 index = 0, key = "year_value_disciplina")
     with col2: 
         tipo_disciplina_value = st.selectbox('Presencial/EAD', 
@@ -53,64 +60,65 @@ def avaliacao_das_disciplinas_view():
                                              )
         tipo_disciplina_value = str(tipo_disciplina_value)
 
-    service = AvaliacaoDasDisciplinasService(
-        tipo_disciplina_value=tipo_disciplina_value)
+    service = obter_servico("servico_disciplinas", AvaliacaoDasDisciplinasService, periodo=year_value)
+    service.atualizar_filtros(
+        tipo_disciplina_value=tipo_disciplina_value,
+        disciplina_value=None,
+        curso_value=None,
+        setor_value=None,
+        dimensao_value=None)
+    anterior = service.metricas_ano_passado()
 
     col1,col2,col3, col4 = st.columns(4)
     with col1:
-        pct_ano_passado, total_ano_passado = service.total_respondentes_ano_passado()
+        total_respondentes = service.get_total_respondentes_ano_atual()
         st.metric(
             label="Total Respondentes",
             border=BORDER,
-            value=service.get_total_respondentes_ano_atual(),
-            delta=f"{pct_ano_passado:.2f}% Ano passado: {total_ano_passado}"
+            value=total_respondentes,
+            delta=delta_respondentes(total_respondentes, anterior)
         )
         
     with col2:
+        pct_concordo = service.get_concordancia_atual()
         st.metric(
             label="Concordância",
             border=BORDER,
-            value=f"{service.get_concordancia_atual():.2f}%",
-            delta=f"{service.satisfacao_ano_passado():.2f}% Ano passado",
+            value=f"{pct_concordo:.2f}%",
+            delta=delta_percentual(pct_concordo, anterior, "concordancia"),
             delta_color="normal"
         )
         
     with col3:
+        pct_discordo = service.get_discordancia_atual()
         st.metric(
             label="Discordância",
             border=BORDER,
-            value=f"{service.get_discordancia_atual():.2f}%",
-            delta=f"{service.insatisfacao_ano_passado():.2f}% Ano passado",
+            value=f"{pct_discordo:.2f}%",
+            delta=delta_percentual(pct_discordo, anterior, "discordancia"),
             delta_color="inverse"
         )
         
     with col4:
+        pct_desc = service.get_desconhecimento()
         st.metric(
             label="Desconhecimento",
             border=BORDER,
-            value=f"{service.get_desconhecimento():.2f}%",
-            delta=f"{service.desconhecimento_ano_passado():.2f}% Ano passado"
+            value=f"{pct_desc:.2f}%",
+            delta=delta_percentual(pct_desc, anterior, "desconhecimento")
         )
     
-    select_box_value_disciplina_curso_setor = st.selectbox("Pesquise a disciplina de seu interesse",
-                                   service.formatacao_disciplina_curso_setor())
-    
-    select_box_value_disciplina_curso_setor = str(select_box_value_disciplina_curso_setor)
-    if select_box_value_disciplina_curso_setor == "Todas as disciplinas":
-        disciplina_value = "Todas"
-        curso_value = "Todas"
-        setor_value = "Todas"
-    else:
-        partes = select_box_value_disciplina_curso_setor.split(" - ")
-        disciplina_value = partes[0].replace("Disciplina:", "").strip()
-        curso_value = partes[1].replace("Curso:", "").strip()
-        setor_value = partes[2].replace("Setor:", "").strip()
-        
-    service = AvaliacaoDasDisciplinasService(
-        tipo_disciplina_value=tipo_disciplina_value,
-        disciplina_value= disciplina_value,
-        curso_value= curso_value,
-        setor_value= setor_value)
+    # O seletor trabalha com os IDs do índice de opções; a busca ignora acentos e caixa.
+    opcoes = service.opcoes_disciplina_curso_setor()
+    busca = st.text_input("Pesquise a disciplina de seu interesse",
+                          placeholder="Disciplina, curso ou setor")
+    ids = opcoes.buscar(busca) if busca.strip() else [None] + opcoes.ids()
+    if not ids:
+        st.warning("Nenhuma disciplina encontrada para a pesquisa.")
+
+    opcao_id = st.selectbox("Disciplina / Curso / Setor", ids or [None],
+                            format_func=lambda i: "Todas as disciplinas" if i is None else opcoes.rotulo(i))
+    service.atualizar_filtros(**service.filtros_do_id(opcao_id))
     st.markdown("---")
     st.subheader('Distribuição de respostas')
     st.markdown(
@@ -143,50 +151,52 @@ def avaliacao_das_disciplinas_view():
         st.plotly_chart(service.grafico_resumo_por_eixo(), use_container_width=True)
     
     st.warning("Sim e Não representam as respostas seletoras, ou seja aquelas que indicam uma opinião clara e dão sequência a possibilidade de corcordar, discordar ou desconhecer uma afirmação.Sim foi considerado como concordo e Não como discordo.", icon="⚠️")
+    metricas = service.metricas_filtradas()
+    anterior = service.metricas_filtradas_ano_passado()
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_respondentes, total_respostas = service.get_respondentes_filtrados()
+        total_respondentes = metricas["respondentes"]
         st.metric(
             label="Total Respondentes Filtrados",
 
             border=BORDER,
             value=total_respondentes,
-            delta=f"{pct_ano_passado:.1f}% Ano passado: {total_ano_passado}"
+            delta=delta_respondentes(total_respondentes, anterior)
         )
 
 
     with col2:
-        pct_concordo, total_concordo = service.get_concordancia_filtrado()
+        pct_concordo, total_concordo = metricas["concordancia"]
         st.metric(
             label="Concordância",
             border=BORDER,
             value=f"{pct_concordo:.2f}%",
-            delta=f"{service.satisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_concordo, anterior, "concordancia"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Concordo: {total_concordo}")
 
 
     with col3:
-        pct_discordo, total_discordo = service.get_discordancia_filtrado()
+        pct_discordo, total_discordo = metricas["discordancia"]
         st.metric(
             label="Discordância",
             border=BORDER,
             value=f"{pct_discordo:.2f}%",
-            delta=f"{service.insatisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_discordo, anterior, "discordancia"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Discordo: {total_discordo}")
 
 
     with col4:
-        pct_desc, total_desc = service.get_desconhecimento_filtrado()
+        pct_desc, total_desc = metricas["desconhecimento"]
         st.metric(
             label="Desconhecimento",
             border=BORDER,
             value=f"{pct_desc:.2f}%",
-            delta=f"{service.desconhecimento_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_desc, anterior, "desconhecimento"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Desconheço: {total_desc}")
@@ -220,14 +230,7 @@ def avaliacao_das_disciplinas_view():
         lista_dimensoes_formated
     )
     dim_sel = int(dim_sel)
-    service = AvaliacaoDasDisciplinasService(
-        tipo_disciplina_value=tipo_disciplina_value,
-        disciplina_value= disciplina_value,
-        curso_value= curso_value,
-        setor_value= setor_value,
-        dimensao_value=  dim_sel
-
-        )
+    service.atualizar_filtros(dimensao_value=dim_sel)
     
     st.plotly_chart(service.grafico_saldo_opiniao_dimensao(), use_container_width=True, key = "grafico_saldo_opiniao")
 
@@ -296,18 +299,7 @@ def avaliacao_das_disciplinas_view():
   
 
     st.markdown("---")
-    with st.expander("Ver dados brutos (Frequências Absolutas) (Em desenvolvimento :3)"):
-        st.dataframe()
-        message = "Lorem ipsum.\nStreamlit is cool."
-        st.download_button(
-            label="Download Dados brutos",
-            data=message,
-            file_name="message.txt",
-            on_click="ignore",
-            type="primary",
-            icon=":material/download:",
-            key="dowload-dados-brutos-disciplinas"
-
-        )
+    with st.expander("Ver dados brutos (Frequências Absolutas)"):
+        dados_brutos(service, "disciplinas", "dados-brutos-disciplinas")
 
     
\ No newline at end of file
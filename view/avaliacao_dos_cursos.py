@@ -4,6 +4,10 @@ import pandas as pd
 import plotly.graph_objects as go
 
 from services.AvalicaoDosCursosService import AvaliacaoDosCursosService
+from services.DataLoader import DataLoader
+from view.comparacao import delta_percentual, delta_respondentes
+from view.dados_brutos import dados_brutos
+from view.sessao import obter_servico
 
 BORDER = 1
 COLOR_MAP = {
@@ -15,8 +19,6 @@ COLOR_MAP = {
 COLOR_UFPR_BLUE = '#00548e'
 COLOR_UFPR_BLACK ='#231F20'
 def avaliacao_dos_cursos_view():
-    service = AvaliacaoDosCursosService()
-
     st.markdown(
         f"""
         <h1 style="text-align:left; font-size:3.4rem; font-weight:700;">
@@ -43,68 +45,64 @@ def avaliacao_dos_cursos_view():
 
     col1,_,_,_,_,_= st.columns(6)
     with col1:
-        year_value = st.selectbox('Selecione o Ano',('2025','2024'), 
-                                                             index = 1,key = "year_value_cursos")
+        year_value = st.selectbox('Selecione o Ano',DataLoader.periodos_disponiveis("cursos"), 
+                                                             index = 0,key = "year_value_cursos")
+
+    service = obter_servico("servico_cursos", AvaliacaoDosCursosService, periodo=year_value)
+    service.atualizar_filtros(curso_value=None, setor_value=None, dimensao_value=None)
+    anterior = service.metricas_ano_passado()
+
     col1,col2,col3, col4 = st.columns(4)
 
     with col1:
-        pct_comparacao, qtd_respondentes_ano_passado = service.total_respondentes_ano_passado()
+        total_respondentes = service.get_total_respondentes()
         st.metric(
             label="Total Respondentes",
             border=BORDER,
-            value=f"{service.get_total_respondentes()}",
-            delta=f"{pct_comparacao:.2f}% Ano passado: {qtd_respondentes_ano_passado}"
+            value=f"{total_respondentes}",
+            delta=delta_respondentes(total_respondentes, anterior)
         )
         
     with col2:
+        pct_concordo = service.get_concordancia()
         st.metric(
             label="Concordância",
             border=BORDER,
-            value=f"{service.get_concordancia():.2f}%",
-            delta=f"{service.satisfacao_ano_passado():.2f}% Ano passado"
+            value=f"{pct_concordo:.2f}%",
+            delta=delta_percentual(pct_concordo, anterior, "concordancia")
         )
         
     with col3:
+        pct_discordo = service.get_discordancia()
         st.metric(
             label="Discordância",
             border=BORDER,
-            value=f"{service.get_discordancia():.2f}%",
-            delta=f"{service.insatisfacao_ano_passado():.2f}% Ano passado"
+            value=f"{pct_discordo:.2f}%",
+            delta=delta_percentual(pct_discordo, anterior, "discordancia")
         )
         
     with col4:
+        pct_desc = service.get_desconhecimento()
         st.metric(
             label="Desconhecimento",
             border=BORDER,
-            value=f"{service.get_desconhecimento():.2f}%",
-            delta=f"{service.desconhecimento_ano_passado():.2f}% Ano passado"
+            value=f"{pct_desc:.2f}%",
+            delta=delta_percentual(pct_desc, anterior, "desconhecimento")
         )    
-    select_box_value_curso_setor = st.selectbox(
-        "Pesquise o curso de seu interesse",
-        service.formatacao_curso_setor(),
-        key="curso_value" 
-        )
-    
-    if select_box_value_curso_setor == "Todos os cursos":
-        curso_value = "Todos"
-        setor_value = "Todos"
-
-    elif " - Setor: " in select_box_value_curso_setor:
-        curso_value, setor_value = (
-            select_box_value_curso_setor
-            .replace("Curso: ", "")
-            .split(" - Setor: ")
+    # O seletor trabalha com os IDs do índice de opções; a busca ignora acentos e caixa.
+    opcoes = service.opcoes_curso_setor()
+    busca = st.text_input("Pesquise o curso de seu interesse", placeholder="Curso ou setor")
+    ids = opcoes.buscar(busca) if busca.strip() else [None] + opcoes.ids()
+    if not ids:
+        st.warning("Nenhum curso encontrado para a pesquisa.")
+
+    opcao_id = st.selectbox(
+        "Curso / Setor",
+        ids or [None],
+        format_func=lambda i: "Todos os cursos" if i is None else opcoes.rotulo(i),
         )
 
-    else:
-        curso_value = select_box_value_curso_setor
-        setor_value = ""
-
-    service = AvaliacaoDosCursosService(
-        curso_value=curso_value,
-        setor_value=setor_value,
-        
-        )
+    service.atualizar_filtros(**service.filtros_do_id(opcao_id))
     st.markdown("---")
     
     st.subheader('Distribuição de respostas')
@@ -143,52 +141,53 @@ def avaliacao_dos_cursos_view():
     
     
 
+    metricas = service.metricas_filtradas()
+    anterior = service.metricas_filtradas_ano_passado()
     col1, col2, col3, col4 = st.columns(4)
 
 
     with col1:
-        total_respondentes_filtrado = service.get_total_respondentes_filtrado()
-        pct_ano_passado, total_ano_passado = service.total_respondentes_ano_passado()
+        total_respondentes_filtrado = metricas["respondentes"]
 
         st.metric(
             label="Total Respondentes Filtrados",
             border=BORDER,
             value=total_respondentes_filtrado,
-            delta=f"{pct_ano_passado:.1f}% Ano passado: {total_ano_passado}"
+            delta=delta_respondentes(total_respondentes_filtrado, anterior)
         )
 
 
     with col2:
-        pct_concordo, total_concordo = service.get_concordancia_filtrado()
+        pct_concordo, total_concordo = metricas["concordancia"]
         st.metric(
             label="Concordância",
             border=BORDER,
             value=f"{pct_concordo:.2f}%",
-            delta=f"{service.satisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_concordo, anterior, "concordancia"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Concordo: {total_concordo}")
 
 
     with col3:
-        pct_discordo, total_discordo = service.get_discordancia_filtrado()
+        pct_discordo, total_discordo = metricas["discordancia"]
         st.metric(
             label="Discordância",
             border=BORDER,
             value=f"{pct_discordo:.2f}%",
-            delta=f"{service.insatisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_discordo, anterior, "discordancia"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Discordo: {total_discordo}")
 
 
     with col4:
-        pct_desc, total_desc = service.get_desconhecimento_filtrado()
+        pct_desc, total_desc = metricas["desconhecimento"]
         st.metric(
             label="Desconhecimento",
             border=BORDER,
             value=f"{pct_desc:.2f}%",
-            delta=f"{service.desconhecimento_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_desc, anterior, "desconhecimento"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Desconheço: {total_desc}")
@@ -218,101 +217,13 @@ def avaliacao_dos_cursos_view():
         dimensoes ,key = "dimensao_curso"
     )
     
-    # 1. Filtra os dados da dimensão escolhida
-    df_dimensao = service.df[service.df['DIMENSAO_NOME'] == dim_sel]
+    service.atualizar_filtros(dimensao_value=dim_sel)
 
-    if df_dimensao.empty:
+    figura_saldo = service.grafico_saldo_opiniao_dimensao()
+    if figura_saldo is None:
         st.warning("Sem dados para essa dimensão.")
     else:
-        # 2. CRIAÇÃO SEGURA DOS DADOS (Crosstab)
-        # Transforma respostas em colunas e calcula porcentagem (0-100) por linha (pergunta)
-        tabela_percentuais = pd.crosstab(
-            index=df_dimensao['PERGUNTA'], 
-            columns=df_dimensao['RESPOSTA'], 
-            normalize='index' # Isso aqui garante a porcentagem correta!
-        ) * 100
-
-        # 3. Preenchimento de colunas faltantes com 0 (caso ninguém tenha respondido alguma opção)
-        for col in ['Concordo', 'Discordo', 'Desconheço']:
-            if col not in tabela_percentuais.columns:
-                tabela_percentuais[col] = 0.0
-
-        # 4. Extração das Listas (Garantindo a ordem)
-        questions = tabela_percentuais.index.tolist()
-        
-        # Pega os valores exatos da tabela cruzada
-        concordo_list = tabela_percentuais['Concordo'].tolist()
-        discordo_list = tabela_percentuais['Discordo'].tolist()
-        desconheco_list = tabela_percentuais['Desconheço'].tolist()
-
-        # 5. Formatação do Texto (Quebra de linha)
-        def quebrar_texto(texto, max_chars=50):
-            if len(texto) <= max_chars: return texto
-            import textwrap
-            return "<br>".join(textwrap.wrap(texto, width=max_chars))
-
-        questions_formatted = [quebrar_texto(q) for q in questions]
-
-        # 6. Preparação para o Gráfico Divergente
-        discordo_neg_list = [-x for x in discordo_list]
-        
-        # Divisão do Desconheço (Metade negativa, Metade positiva)
-        desconheco_metade = [x / 2 for x in desconheco_list]
-        desconheco_metade_neg = [-x for x in desconheco_metade]
-        
-        hover_desconheco = [f"Desconheço: {x:.1f}%" for x in desconheco_list]
-        # Mostra label só se for relevante (>1%) para não poluir
-        label_desconheco = [f"{x:.1f}%" if x > 1 else "" for x in desconheco_list]
-
-        fig_div = go.Figure()
-
-        # --- CAMADA 1: DESCONHEÇO (Centro) ---
-        fig_div.add_trace(go.Bar(
-            y=questions_formatted, x=desconheco_metade_neg,
-            name='Desconheço', orientation='h', marker_color='#95a5a6',
-            legendgroup='grp_desc', showlegend=True,
-            hoverinfo='text', hovertext=hover_desconheco,
-            visible='legendonly' # Começa oculto
-        ))
-
-        fig_div.add_trace(go.Bar(
-            y=questions_formatted, x=desconheco_metade,
-            name='Desconheço', orientation='h', marker_color='#95a5a6',
-            legendgroup='grp_desc', showlegend=False,
-            text=label_desconheco, textposition='inside',
-            hoverinfo='text', hovertext=hover_desconheco,
-            visible='legendonly'
-        ))
-
-        # --- CAMADA 2: EXTREMOS ---
-        fig_div.add_trace(go.Bar(
-            y=questions_formatted, x=discordo_neg_list,
-            name='Discordo', orientation='h', marker_color='#e74c3c',
-            text=[f"{x:.1f}%" if x > 1 else "" for x in discordo_list],
-            textposition='inside', insidetextanchor='middle',
-            hoverinfo='text+y', hovertext=[f"Discordo: {x:.1f}%" for x in discordo_list]
-        ))
-
-        fig_div.add_trace(go.Bar(
-            y=questions_formatted, x=concordo_list,
-            name='Concordo', orientation='h', marker_color='#2ecc71',
-            text=[f"{x:.1f}%" if x > 1 else "" for x in concordo_list],
-            textposition='inside', insidetextanchor='middle',
-            hoverinfo='text+y', hovertext=[f"Concordo: {x:.1f}%" for x in concordo_list]
-        ))
-
-        fig_div.update_layout(
-            barmode='relative',
-            title=f"Saldo de Opinião: {dim_sel}",
-            xaxis_title="% Rejeição <---> % Aprovação",
-            yaxis=dict(title=""),
-            legend_title_text='Resposta',
-            height=max(400, len(questions) * 60 + 100), # Altura dinâmica
-            margin=dict(l=10, r=10, t=80, b=20)
-        )
-
-        fig_div.add_vline(x=0, line_width=1, line_color="black", opacity=0.3)
-        st.plotly_chart(fig_div, use_container_width=True, key="plot_perguntas_curso")
+        st.plotly_chart(figura_saldo, use_container_width=True, key="plot_perguntas_curso")
 
     dimensoes = sorted(service.df['DIMENSAO_NOME'].dropna().unique()) # Pega dimensões reais do banco
     
@@ -360,16 +271,6 @@ def avaliacao_dos_cursos_view():
     st.markdown('---')
     # ------------ #
     
-    with st.expander("Ver dados brutos (Frequências Absolutas) (Em desenvolvimento :3)"):
-            st.dataframe()
-            message = "Lorem ipsum.\nStreamlit is cool."
-            st.download_button(
-                label="Download Dados brutos",
-                data=message,
-                file_name="message.txt",
-                on_click="ignore",
-                type="primary",
-                icon=":material/download:",
-                key= "download-dados-brutos-cursos"
-            )
+    with st.expander("Ver dados brutos (Frequências Absolutas)"):
+            dados_brutos(service, "cursos", "dados-brutos-cursos")
     
\ No newline at end of file
@@ -5,6 +5,10 @@ import plotly.graph_objects as go
 import numpy as np
 
 from services.AvaliacaoInstitucionalService import AvaliacaoInstitucionalService
+from services.DataLoader import DataLoader
+from view.comparacao import delta_percentual, delta_respondentes
+from view.dados_brutos import dados_brutos
+from view.sessao import obter_servico
 
 BORDER = 1
 COLOR_MAP = {
@@ -17,9 +21,6 @@ COLOR_UFPR_BLUE = '#00548e'
 COLOR_UFPR_BLACK ='#231F20'
 def avaliacao_institucional_view():
 
-    df = AvaliacaoInstitucionalService().df_load_dados_institucional
-    
-    
     st.markdown(
         f"""
         <h1 style="text-align:left; font-size:3.4rem; font-weight:700;">
@@ -46,26 +47,28 @@ def avaliacao_institucional_view():
     
     col1 ,_,_,_,_,_= st.columns(6)
     with col1:
-        year_value = st.selectbox('Selecione o Ano', ('2025','2024'),
+        year_value = st.selectbox('Selecione o Ano', DataLoader.periodos_disponiveis("institucional"),
                                 index = 0)
 
+    service = obter_servico("servico_institucional", AvaliacaoInstitucionalService, periodo=year_value)
+    df = service.df_load_dados_institucional
+
     col1, col2, col3, col4 = st.columns(4)
-    service = AvaliacaoInstitucionalService(
+    service.atualizar_filtros(
         eixos_value=None,
-        perguntas_value=None
+        perguntas_value=None,
+        dimensao_value=None
     )
 
     qtd_respondentes_ano_atual = service.total_respondentes_ano_atual()
-    pct_comparacao, qtd_respondentes_ano_passado = (
-        service.total_respondentes_ano_passado()
-    )
+    anterior = service.metricas_ano_passado()
     
     with col1:
         st.metric(
             label="Total Respondentes",
             border=BORDER,
             value=qtd_respondentes_ano_atual,
-            delta=f"{pct_comparacao:.1f}% Ano passado: {qtd_respondentes_ano_passado}"
+            delta=delta_respondentes(qtd_respondentes_ano_atual, anterior)
         )
         
     with col2:
@@ -73,7 +76,7 @@ def avaliacao_institucional_view():
             label="Concordância",
             border=BORDER,
             value=f"{service.satisfacao_ano_atual():.2f}%",
-            delta=f"{service.satisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(service.satisfacao_ano_atual(), anterior, "concordancia"),
             delta_color="normal"
         )
         
@@ -82,7 +85,7 @@ def avaliacao_institucional_view():
             label="Discordância",
             border=BORDER,
             value=f"{service.insatisfacao_ano_atual():.2f}%",
-            delta=f"{service.insatisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(service.insatisfacao_ano_atual(), anterior, "discordancia"),
             delta_color="normal"
         )
         
@@ -91,7 +94,7 @@ def avaliacao_institucional_view():
             label="Desconhecimento",
             border=BORDER,
             value=f"{service.desconhecimento_ano_atual():.2f}%",
-            delta=f"{service.desconhecimento_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(service.desconhecimento_ano_atual(), anterior, "desconhecimento"),
             delta_color="normal"
         )
     
@@ -106,16 +109,12 @@ def avaliacao_institucional_view():
             key="filtro_eixo"
         )
 
-    if "Todos" in eixo_value or not eixo_value:
-        df_filtered = df.copy()
-    else:
-        df_filtered = df[df['EIXO_NOME'].isin(eixo_value)].sort_values(by='Ordem')
+    service.atualizar_filtros(eixos_value=eixo_value)
 
     with col2:
-        # Filter all the questions in the selected axis
-        perguntas_unicas = (df_filtered['Ordem'].astype(int).astype(str) + ' - ' + df_filtered['PERGUNTA']).unique().tolist()
-        opcoes_perguntas = ["Todos"] + sorted(perguntas_unicas, key=lambda x: int(x.split(' - ')[0]))
-        
+        # Perguntas dos eixos selecionados
+        opcoes_perguntas = service.formatar_perguntas()
+
         perguntas_value = st.multiselect(
             "Perguntas",
             opcoes_perguntas,
@@ -125,7 +124,7 @@ def avaliacao_institucional_view():
         
     
 
-    service = AvaliacaoInstitucionalService(
+    service.atualizar_filtros(
         eixos_value=eixo_value,
         perguntas_value=perguntas_value
     )
@@ -161,49 +160,51 @@ def avaliacao_institucional_view():
     with col_graf2:
 
         st.plotly_chart(service.grafico_resumo_por_eixo(), use_container_width=True)
+    metricas = service.metricas_filtradas()
+    anterior = service.metricas_filtradas_ano_passado()
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        total_respondentes, _ = service.get_respondentes_filtrados()
+        total_respondentes = metricas["respondentes"]
         st.metric(
             label="Total Respondentes Filtrados",
 
             border=BORDER,
             value=total_respondentes,
-            delta=f"{pct_comparacao:.1f}% Ano passado: {qtd_respondentes_ano_passado}"
+            delta=delta_respondentes(total_respondentes, anterior)
         )
 
 
     with col2:
-        pct_concordo, total_concordo = service.get_concordancia_filtrado()
+        pct_concordo, total_concordo = metricas["concordancia"]
         st.metric(
             label="Concordância",
             border=BORDER,
             value=f"{pct_concordo:.2f}%",
-            delta=f"{service.satisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_concordo, anterior, "concordancia"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Concordo: {total_concordo}")
 
 
     with col3:
-        pct_discordo, total_discordo = service.get_discordancia_filtrado()
+        pct_discordo, total_discordo = metricas["discordancia"]
         st.metric(
             label="Discordância",
             border=BORDER,
             value=f"{pct_discordo:.2f}%",
-            delta=f"{service.insatisfacao_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_discordo, anterior, "discordancia"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Discordo: {total_discordo}")
 
 
     with col4:
-        pct_desc, total_desc = service.get_desconhecimento_filtrado()
+        pct_desc, total_desc = metricas["desconhecimento"]
         st.metric(
             label="Desconhecimento",
             border=BORDER,
             value=f"{pct_desc:.2f}%",
-            delta=f"{service.desconhecimento_ano_passado():.2f}% Ano passado",
+            delta=delta_percentual(pct_desc, anterior, "desconhecimento"),
             delta_color="normal"
         )
         st.warning(f"Total respostas Desconheço: {total_desc}")
@@ -266,11 +267,7 @@ def avaliacao_institucional_view():
 
     dim_sel_temp = dim_sel.split('-',maxsplit=1)[1].strip()
 
-    service = AvaliacaoInstitucionalService( 
-        eixos_value=eixo_value,
-        perguntas_value=perguntas_value,
-        dimensao_value=dim_sel_temp
-    )
+    service.atualizar_filtros(dimensao_value=dim_sel_temp)
 
     figura_saldo = service.grafico_saldo_opiniao_dimensao()
 
@@ -285,15 +282,5 @@ def avaliacao_institucional_view():
     st.markdown("---")
     # ---------- #
 
-    with st.expander("Ver dados brutos (Frequências Absolutas) (Em desenvolvimento :3)"):
-        st.dataframe()
-        message = "Lorem ipsum.\nStreamlit is cool."
-        st.download_button(
-            label="Download Dados brutos",
-            data=message,
-            file_name="message.txt",
-            on_click="ignore",
-            type="primary",
-            icon=":material/download:",
-            key= "download-dados-brutos-insitucional"
-        )
\ No newline at end of file
+    with st.expander("Ver dados brutos (Frequências Absolutas)"):
+        dados_brutos(service, "institucional", "dados-brutos-institucional")
\ No newline at end of file
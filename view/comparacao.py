@@ -0,0 +1,22 @@
+def delta_respondentes(atual: int, anterior: dict | None) -> str | None:
+    """Texto do `delta` do card de respondentes em relação ao ano anterior.
+
+    `anterior` está no formato de `metricas_filtradas` (ou None, sem dados do
+    ano anterior para os filtros). Retorna None para o card não mostrar delta.
+    """
+    if not anterior or not anterior["respondentes"]:
+        return None
+    pct_comparacao = (atual / anterior["respondentes"] - 1) * 100
+    return f"{pct_comparacao:.1f}% Ano passado: {anterior['respondentes']}"
+
+
+def delta_percentual(atual: float, anterior: dict | None, metrica: str) -> str | None:
+    """Texto do `delta` de um card percentual (`metrica`: concordancia, discordancia ou desconhecimento).
+
+    Mostra a diferença em pontos percentuais e o valor do ano anterior, ou
+    None quando não há dados do ano anterior para os filtros.
+    """
+    if not anterior:
+        return None
+    pct_ano_passado = anterior[metrica][0]
+    return f"{atual - pct_ano_passado:+.2f} p.p. Ano passado: {pct_ano_passado:.2f}%"
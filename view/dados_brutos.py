@@ -0,0 +1,87 @@
+import os
+from urllib.parse import urlencode
+
+import streamlit as st
+
+from services.DataExporter import FORMATOS, DataExporter, parametros_do_servico
+
+# Linhas exibidas na prévia das linhas filtradas.
+LINHAS_PREVIA = 1000
+
+# Acima deste número de linhas o arquivo sai pela rota `exportar` da API, em
+# pedaços: o `st.download_button` guarda o arquivo inteiro na memória do servidor
+# (na página, ele só é gerado quando o usuário pede, pelo botão "Gerar arquivo").
+LIMITE_DOWNLOAD = int(os.environ.get("DASHBOARD_EXPORTACAO_LIMITE") or 50_000)
+
+# Endereço da API (`python -m api`) usado nos links de exportação.
+URL_API = os.environ.get("DASHBOARD_API_URL", "http://localhost:8502").rstrip("/")
+
+# Rótulo do seletor -> tabela exportada (parâmetro `tabela` da API).
+TABELAS = {"Linhas filtradas": "dados", "Frequências por pergunta": "frequencias"}
+
+
+def _milhar(numero: int) -> str:
+    """Formata `numero` com ponto como separador de milhar (ex.: 20.000)."""
+    return f"{numero:,}".replace(",", ".")
+
+
+def _exportacao(service, avaliacao: str, chave: str):
+    """Seletores de tabela/formato e o download, reexecutados sem rodar a página inteira."""
+    col1, col2 = st.columns(2)
+    tabela = TABELAS[col1.radio("Tabela", list(TABELAS), horizontal=True, key=f"{chave}-tabela")]
+    formatos = [formato for formato in FORMATOS if DataExporter.disponivel(formato)]
+    formato = col2.radio("Formato", formatos, format_func=str.upper, horizontal=True, key=f"{chave}-formato")
+    if "xlsx" not in formatos:
+        col2.caption("XLSX indisponível: o servidor não tem o pacote openpyxl.")
+
+    if tabela == "frequencias":
+        exportador = DataExporter(service.tabela_frequencias())
+    else:
+        exportador = service.exportador_dados()
+
+    if len(exportador) > LIMITE_DOWNLOAD:
+        parametros = {**parametros_do_servico(avaliacao, service), "formato": [formato], "tabela": [tabela]}
+        parametros.pop("dimensao", None)  # a exportação não depende da dimensão
+        if service.periodo:
+            parametros["periodo"] = [service.periodo]
+        url = f"{URL_API}/api/v1/{avaliacao}/exportar?{urlencode(parametros, doseq=True)}"
+        st.info(
+            f"A seleção tem {_milhar(len(exportador))} linhas (mais de {_milhar(LIMITE_DOWNLOAD)}). "
+            f"Baixe o arquivo gerado em partes pela API: [{formato.upper()}]({url})"
+        )
+        return
+
+    # Os bytes só existem na execução do clique: trocar de tabela/formato ou
+    # qualquer outra reexecução descarta o arquivo em vez de gerá-lo de novo.
+    if st.button("Gerar arquivo", key=f"{chave}-gerar", icon=":material/table:"):
+        with st.spinner("Gerando arquivo..."):
+            dados = b"".join(exportador.exportar(formato))
+        st.download_button(
+            label="Download Dados brutos",
+            data=dados,
+            file_name=DataExporter.nome_arquivo(f"{avaliacao}_{tabela}_{(service.periodo or 'atual').replace('/', '-')}", formato),
+            mime=DataExporter.tipo_mime(formato),
+            on_click="ignore",
+            type="primary",
+            icon=":material/download:",
+            key=f"{chave}-download",
+        )
+
+
+def dados_brutos(service, avaliacao: str, chave: str):
+    """Frequências absolutas, prévia e exportação (CSV, Parquet ou XLSX) das linhas filtradas.
+
+    `avaliacao` é o nome da avaliação na API ('institucional', 'cursos' ou
+    'disciplinas') e `chave` o prefixo das chaves dos widgets.
+    """
+    st.dataframe(service.tabela_frequencias(), hide_index=True, use_container_width=True)
+
+    exportador = service.exportador_dados()
+    linhas = _milhar(len(exportador))
+    if len(exportador) > LINHAS_PREVIA:
+        st.caption(f"{linhas} linhas filtradas (prévia das primeiras {LINHAS_PREVIA})")
+    else:
+        st.caption(f"{linhas} linhas filtradas")
+    st.dataframe(next(exportador.blocos(LINHAS_PREVIA), exportador.df.iloc[:0]), hide_index=True, use_container_width=True)
+
+    st.fragment(_exportacao)(service, avaliacao, chave)
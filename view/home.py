@@ -1,7 +1,7 @@
 import streamlit as st
 from streamlit_carousel import carousel
-import time 
 from services.HomeService import DataLogger
+from services.ResponsiveImages import FORMATOS_APP_STATIC, IMAGENS, PASTA_ORIGEM
 COLOR_UFPR_BLUE = '#00548e'
 COLOR_UFPR_BLACK ='#231F20'
 
@@ -31,6 +31,87 @@ CARD_STYLE_CARDS = """
 
 
 
+# Imagens do carrossel da Home (em data/imgs; variantes em static/imgs).
+IMAGENS_CARROSSEL = ["1.png", "2.png", "3.png", "4.png", "5.png"]
+
+CSS_CARROSSEL = """
+<style>
+.carrossel-home {
+    display:flex;
+    overflow-x:auto;
+    scroll-snap-type:x mandatory;
+    scroll-behavior:smooth;
+    border-radius:12px;
+    background-color:black;
+}
+.carrossel-home picture {
+    flex:0 0 100%;
+    scroll-snap-align:center;
+    display:flex;
+    justify-content:center;
+}
+.carrossel-home img {
+    width:100%;
+    height:auto;
+    max-height:90vh;
+    object-fit:contain;
+}
+</style>
+"""
+
+CSS_CARROSSEL_PNG = """
+<style>
+.carousel-item {   
+    max-height: 90vh !important; 
+    height: auto !important;     
+    width: 100% !important;
+}
+.carousel-item img {
+    object-fit: contain !important;
+    width: 100% !important; 
+    height: auto !important;         
+    max-height: 90vh !important;
+    background-color: black;
+}
+</style>
+"""
+
+
+def _carrossel():
+    """Carrossel das imagens da Home.
+
+    Com as variantes geradas (`python -m services.ResponsiveImages`) e o
+    `enableStaticServing` ligado, o navegador baixa do `app/static/` só a
+    variante WebP que cobre a largura da tela, e os slides fora da tela
+    só quando o usuário rola até eles. Sem elas, usa o `streamlit_carousel`
+    com os PNGs originais (embutidos na página em base64).
+    """
+    if st.get_option("server.enableStaticServing") and IMAGENS.disponivel(IMAGENS_CARROSSEL):
+        slides = "".join(
+            IMAGENS.picture(
+                nome, alt=f"Slide {i} de {len(IMAGENS_CARROSSEL)}", prioridade=i == 1, formatos=FORMATOS_APP_STATIC
+            )
+            for i, nome in enumerate(IMAGENS_CARROSSEL, start=1)
+        )
+        st.markdown(CSS_CARROSSEL + f'<div class="carrossel-home">{slides}</div>', unsafe_allow_html=True)
+        return
+
+    st.markdown(CSS_CARROSSEL_PNG, unsafe_allow_html=True)
+    carousel([
+        {"img": f"{PASTA_ORIGEM}/{nome}", "title": "", "text": ""}
+        for nome in IMAGENS_CARROSSEL
+    ])
+
+
+def _registrar_feedback():
+    """Registra o feedback escolhido e confirma com um aviso temporário."""
+    save = DataLogger(feedback_value=st.session_state.get("feedback_home")).save_feedback()
+    if save["status"] == "success":
+        st.toast(save["message"])
+    elif save["status"] == "error":
+        st.error(save["message"])
+
+
 def home_view():
 
     st.markdown(
@@ -43,22 +124,6 @@ def home_view():
         unsafe_allow_html=True
     )
     
-    st.markdown("""
-    <style>
-    .carousel-item {   
-        max-height: 90vh !important; 
-        height: auto !important;     
-        width: 100% !important;
-    }
-    .carousel-item img {
-        object-fit: contain !important;
-        width: 100% !important; 
-        height: auto !important;         
-        max-height: 90vh !important;
-        background-color: black;
-    }
-    </style>
-    """, unsafe_allow_html=True)
     st.markdown(
             """
             <p style="
@@ -76,33 +141,7 @@ def home_view():
         )
     st.write("")  
     st.write("") 
-    carousel([
-    {
-        "img": "data/imgs/1.png",
-        "title": "",
-        "text": ""
-    },
-    {
-        "img": "data/imgs/2.png",
-        "title": "",
-        "text": ""
-    },
-    {
-        "img": "data/imgs/3.png",
-        "title": "",
-        "text": ""
-    },
-    {
-        "img": "data/imgs/4.png",
-        "title": "",
-        "text": ""
-    },
-    {
-        "img": "data/imgs/5.png",
-        "title": "",
-        "text": ""
-    }
-    ])
+    _carrossel()
     
     st.write("")  
     st.write("")  
@@ -380,15 +419,9 @@ def home_view():
         """,
         unsafe_allow_html=True
 )
-    feedback_value = st.feedback()
-    service = DataLogger(feedback_value=feedback_value)
-
-    if feedback_value is not None:
-        save = service.save_feedback_to_json()
-        msg = st.empty()
-        msg.success(f"{save['message']}")
-        time.sleep(1)
-        msg.empty()
-    else:
-        save = service.save_feedback_to_json()
+    # O feedback é registrado só quando o valor muda (callback), não a cada rerun.
+    feedback_value = st.feedback(key="feedback_home", on_change=_registrar_feedback)
+
+    if feedback_value is None:
+        save = DataLogger(feedback_value=feedback_value).save_feedback()
         st.warning(f"{save['message']}")
\ No newline at end of file
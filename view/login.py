@@ -1,5 +1,8 @@
 import streamlit as st
 from services.LoginService import LoginService
+from view.painel_desempenho import painel_desempenho
+from view.painel_feedback import painel_feedback
+from view.painel_ingestao import painel_ingestao
 
 import time
 
@@ -46,13 +49,13 @@ def login_view():
         """,
         unsafe_allow_html=True
     )
-        with container.container():
-            with col1: 
-                file1 = st.file_uploader("Arquivo Avaliação Institucional", type=["csv", "xlsx"])
-            with col2: 
-                file2 = st.file_uploader("Arquivo Avaliação Cursos", type=["csv", "xlsx" ])
-            with col3:
-                file3 = st.file_uploader("Arquivo Avaliação Disciplinas", type=["csv", "xlsx"])
+        painel_ingestao()
+
+        st.markdown("---")
+        painel_feedback()
+
+        st.markdown("---")
+        painel_desempenho()
             
            
 
@@ -0,0 +1,76 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from services.DataLoader import DataLoader
+from services.FigureCache import CACHE_FIGURAS
+from services.RenderProfiler import PROFILER
+
+BORDER = 1
+
+
+def _em_ms(df: pd.DataFrame, colunas: list) -> pd.DataFrame:
+    """Converte as colunas `*_s` para milissegundos (`*_ms`)."""
+    df = df.copy()
+    for coluna in colunas:
+        df[coluna.replace("_s", "_ms")] = df.pop(coluna) * 1000
+    return df
+
+
+def painel_desempenho():
+    """Tempos por rerun medidos pelo `RenderProfiler` e estado dos caches."""
+    st.subheader("Desempenho")
+
+    if not PROFILER.ativo:
+        st.info(
+            "A medição está desligada. Inicie o dashboard com `DASHBOARD_PROFILER=1` para cronometrar "
+            "cargas, métodos dos serviços e gráficos a cada interação "
+            "(`DASHBOARD_PROFILER_LOG=arquivo.jsonl` grava o log estruturado em arquivo)."
+        )
+    else:
+        execucoes = PROFILER.execucoes()
+        if not execucoes:
+            st.caption("Nenhuma interação medida ainda.")
+        else:
+            ultima = execucoes[-1]
+            duracoes = [e["duracao_s"] for e in execucoes]
+
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Reruns medidos", len(execucoes), border=BORDER)
+            col2.metric("Último rerun", f"{ultima['duracao_s'] * 1000:.0f} ms", border=BORDER)
+            col3.metric("Mediana", f"{pd.Series(duracoes).median() * 1000:.0f} ms", border=BORDER)
+
+            col_categorias, col_ultima = st.columns(2)
+            with col_categorias:
+                categorias = pd.DataFrame(
+                    [{"rerun": i, "categoria": c, "tempo_ms": t * 1000}
+                     for i, e in enumerate(execucoes) for c, t in e["categorias"].items()]
+                )
+                if not categorias.empty:
+                    fig = px.bar(categorias, x="rerun", y="tempo_ms", color="categoria", title="Tempo por categoria em cada rerun")
+                    st.plotly_chart(fig, use_container_width=True)
+
+            with col_ultima:
+                st.caption(f"Último rerun ({ultima['pagina']}, {ultima['momento']})")
+                st.dataframe(
+                    _em_ms(pd.DataFrame(ultima["chamadas"]), ["tempo_s"]),
+                    hide_index=True, use_container_width=True, height=360,
+                )
+
+            st.caption("Acumulado de todos os reruns guardados")
+            st.dataframe(
+                _em_ms(PROFILER.agregado(), ["tempo_total_s", "tempo_medio_s", "tempo_max_s"]),
+                hide_index=True, use_container_width=True,
+            )
+
+            if st.button("Limpar medições"):
+                PROFILER.limpar()
+                st.rerun()
+
+    st.caption("Caches")
+    col_dados, col_figuras = st.columns(2)
+    with col_dados:
+        st.json(DataLoader.estatisticas_cache(), expanded=False)
+        st.dataframe(DataLoader.relatorio_memoria(), hide_index=True, use_container_width=True)
+    with col_figuras:
+        st.json(CACHE_FIGURAS.estatisticas(), expanded=False)
@@ -0,0 +1,19 @@
+import streamlit as st
+
+from services.HomeService import DataLogger
+
+BORDER = 1
+
+
+def painel_feedback():
+    """Totais dos feedbacks da Home (contadores do `FeedbackStore`)."""
+    st.subheader("Feedback da Home")
+
+    contagens = DataLogger.contagens()
+    total = sum(contagens.values())
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total", total, border=BORDER)
+    for coluna, (rotulo, quantidade) in zip((col2, col3), contagens.items()):
+        percentual = f"{quantidade / total * 100:.1f}%" if total else "-"
+        coluna.metric(rotulo, quantidade, delta=percentual, delta_color="off", border=BORDER)
@@ -0,0 +1,68 @@
+import streamlit as st
+
+from services.IngestionWorker import INGESTAO
+
+# Rótulo do seletor -> tipo do armazenamento dos arquivos de disciplinas.
+TIPOS_DISCIPLINA = {"Presencial": "presencial", "EAD": "ead"}
+
+
+def _andamento(atualizar: bool):
+    """Progresso dos envios; enquanto houver algum em andamento, o trecho se atualiza sozinho."""
+    tarefas = INGESTAO.tarefas()
+    if not tarefas:
+        return
+
+    st.caption("Envios recentes")
+    for tarefa in tarefas:
+        descricao = f"{tarefa['arquivo']} → {tarefa['tipo']} {tarefa['periodo']} ({tarefa['criada']})"
+        if tarefa["etapa"] == "erro":
+            st.error(f"{descricao}: {tarefa['mensagem']}")
+        elif tarefa["etapa"] == "concluída":
+            st.success(f"{descricao}: {tarefa['linhas']} linhas em {tarefa['segundos']:.1f}s. {tarefa['mensagem']}")
+        else:
+            st.progress(tarefa["progresso"], text=f"{descricao}: {tarefa['etapa']}, {tarefa['linhas']} linhas")
+
+    # Terminou o último envio: a página inteira roda de novo para listar o período novo.
+    if atualizar and not INGESTAO.em_andamento():
+        st.rerun()
+
+
+def painel_ingestao():
+    """Envio dos arquivos de avaliação, processados e publicados em segundo plano."""
+    st.subheader("Atualização de dados")
+
+    with st.form("form_ingestao", clear_on_submit=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            arquivo_institucional = st.file_uploader("Arquivo Avaliação Institucional", type=["csv", "xlsx"])
+        with col2:
+            arquivo_cursos = st.file_uploader("Arquivo Avaliação Cursos", type=["csv", "xlsx"])
+        with col3:
+            arquivo_disciplinas = st.file_uploader("Arquivo Avaliação Disciplinas", type=["csv", "xlsx"])
+            tipo_disciplina = st.radio("Disciplinas", list(TIPOS_DISCIPLINA), horizontal=True)
+
+        periodo = st.text_input("Ano/Período dos arquivos", placeholder="2026 ou 2026/1")
+        enviado = st.form_submit_button("Processar arquivos")
+
+    if enviado:
+        envios = [
+            ("institucional", arquivo_institucional),
+            ("cursos", arquivo_cursos),
+            (TIPOS_DISCIPLINA[tipo_disciplina], arquivo_disciplinas),
+        ]
+        envios = [(tipo, arquivo) for tipo, arquivo in envios if arquivo is not None]
+        if not envios:
+            st.warning("Selecione ao menos um arquivo.")
+
+        for tipo, arquivo in envios:
+            try:
+                INGESTAO.enviar(tipo, periodo, arquivo.name, arquivo.getvalue())
+            except ValueError as erro:
+                st.error(f"{arquivo.name}: {erro}")
+
+    st.caption(
+        "Os arquivos devem ter as colunas dos dados processados. Eles são lidos em segundo plano "
+        "e o período só é publicado (ou substituído) ao final, sem interromper o dashboard."
+    )
+    atualizar = INGESTAO.em_andamento()
+    st.fragment(_andamento, run_every=1 if atualizar else None)(atualizar)
@@ -0,0 +1,21 @@
+import streamlit as st
+
+
+def obter_servico(chave: str, classe, **parametros):
+    """Retorna a instância de `classe` guardada na sessão, criando-a se preciso.
+
+    O serviço é recriado quando ainda não existe na sessão, quando a classe mudou
+    (recarga do módulo pelo Streamlit), quando algum parâmetro de construção
+    (ex.: `periodo`) é diferente do da instância guardada ou quando o dataset dele
+    foi recarregado pelo DataLoader (`desatualizado`). Os filtros são aplicados
+    com `servico.atualizar_filtros(...)`.
+    """
+    servico = st.session_state.get(chave)
+    if (
+        not isinstance(servico, classe)
+        or any(getattr(servico, nome, None) != valor for nome, valor in parametros.items())
+        or servico.desatualizado()
+    ):
+        servico = classe(**parametros)
+        st.session_state[chave] = servico
+    return servico